@@ -8,10 +8,15 @@ Light load on AI, Backend, and Data tracks.
 
 import requests
 import json
+import time
+import uuid
 from datetime import datetime, date, timedelta
 from typing import Dict, List
 
 class FocusFlowAPI:
+    RETRIES = 3
+    TIMEOUT = 30
+
     def __init__(self, base_url: str, username: str, password: str):
         self.base_url = base_url.rstrip('/')
         self.session = requests.Session()
@@ -39,21 +44,33 @@ class FocusFlowAPI:
         else:
             raise Exception("No workspace found for user")
     
+    def post(self, path: str, data) -> requests.Response:
+        """
+        POST with an Idempotency-Key, retrying timeouts, connection errors,
+        409 (still in flight) and 5xx with the same key so the server runs
+        the request at most once.
+        """
+        headers = {'Idempotency-Key': str(uuid.uuid4())}
+        for attempt in range(self.RETRIES + 1):
+            try:
+                response = self.session.post(f'{self.base_url}{path}', json=data,
+                                             headers=headers, timeout=self.TIMEOUT)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+                if attempt == self.RETRIES:
+                    raise
+            else:
+                if response.status_code != 409 and response.status_code < 500:
+                    break
+                if attempt == self.RETRIES:
+                    break
+            time.sleep(2 ** attempt)
+        response.raise_for_status()
+        return response
+    
     def create_category(self, name: str, description: str) -> dict:
         """Create a category"""
-        try:
-            data = {'name': name, 'description': description}
-            response = self.session.post(f'{self.base_url}/categories/', json=data)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 400:
-                # Might exist, try to get it
-                categories = self.session.get(f'{self.base_url}/categories/').json()['results']
-                for cat in categories:
-                    if cat['name'] == name:
-                        return cat
-            raise e
+        data = {'name': name, 'description': description}
+        return self.post('/categories/', data).json()
     
     def create_track(self, title: str, description: str, category_id: int, deadline: str) -> dict:
         """Create a track"""
@@ -64,9 +81,7 @@ class FocusFlowAPI:
             'deadline': deadline,
             'is_active': True
         }
-        response = self.session.post(f'{self.base_url}/tracks/', json=data)
-        response.raise_for_status()
-        return response.json()
+        return self.post('/tracks/', data).json()
     
     def create_sprint(self, track_id: int, name: str, start_date: str, end_date: str, description: str) -> dict:
         """Create a sprint"""
@@ -78,9 +93,7 @@ class FocusFlowAPI:
             'description': description,
             'is_active': True
         }
-        response = self.session.post(f'{self.base_url}/sprints/', json=data)
-        response.raise_for_status()
-        return response.json()
+        return self.post('/sprints/', data).json()
     
     def create_task(self, track_id: int, sprint_id: int, title: str, description: str, 
                    priority: str = 'MEDIUM', estimated_hours: float = 3.0) -> dict:
@@ -94,9 +107,37 @@ class FocusFlowAPI:
             'estimated_hours': estimated_hours,
             'status': 'TODO'
         }
-        response = self.session.post(f'{self.base_url}/tasks/', json=data)
-        response.raise_for_status()
-        return response.json()
+        return self.post('/tasks/', data).json()
+    
+    def import_plan(self, plan: dict) -> dict:
+        """Upsert a whole categories -> tracks -> sprints -> tasks plan in one request"""
+        return self.post('/import/plan/', plan).json()
+    
+    def create_tasks(self, tasks: List[dict]) -> List[int]:
+        """Create many tasks in one request; returns the new ids in order"""
+        return self.post('/tasks/', tasks).json()['ids']
+
+def build_plan_document(categories: List[dict], tracks: List[dict],
+                        sprints: Dict[str, List[dict]], tasks: Dict[tuple, List[dict]]) -> dict:
+    """Nest the flat plan data into the document accepted by /import/plan/"""
+    return {
+        'categories': [
+            {
+                **category,
+                'tracks': [
+                    {
+                        **{key: value for key, value in track.items() if key != 'category'},
+                        'sprints': [
+                            {**sprint, 'tasks': tasks.get((track['title'], sprint['name']), [])}
+                            for sprint in sprints.get(track['title'], [])
+                        ]
+                    }
+                    for track in tracks if track['category'] == category['name']
+                ]
+            }
+            for category in categories
+        ]
+    }
 
 def get_project_nexus_data():
     """Complete Project Nexus learning plan data"""
@@ -927,97 +968,30 @@ def main():
     
     # Get all data
     categories, tracks, sprints, tasks = get_project_nexus_data()
+    plan = build_plan_document(categories, tracks, sprints, tasks)
     
-    # Create categories
-    print("\n📁 Creating Categories...")
-    created_categories = {}
-    for cat_data in categories:
-        try:
-            category = api.create_category(cat_data['name'], cat_data['description'])
-            created_categories[cat_data['name']] = category
-            print(f"  ✅ {cat_data['name']}")
-        except Exception as e:
-            print(f"  ❌ {cat_data['name']}: {e}")
+    # Import the whole plan in one request (existing items are matched by name)
+    print("\n📦 Importing plan...")
+    report = api.import_plan(plan)
     
-    # Create tracks
-    print("\n🎯 Creating Tracks...")
-    created_tracks = {}
-    for track_data in tracks:
-        try:
-            category_id = created_categories[track_data['category']]['id']
-            track = api.create_track(
-                track_data['title'],
-                track_data['description'],
-                category_id,
-                track_data['deadline']
-            )
-            created_tracks[track_data['title']] = track
-            print(f"  ✅ {track_data['title']}")
-        except Exception as e:
-            print(f"  ❌ {track_data['title']}: {e}")
+    for category in report['categories']:
+        print(f"\n📁 {category['name']} ({category['result']})")
+        for track in category['tracks']:
+            print(f"  🎯 {track['title']} ({track['result']})")
+            for sprint in track['sprints']:
+                print(f"    🏃 {sprint['name']} ({sprint['result']}, {len(sprint['tasks'])} tasks)")
     
-    # Create sprints
-    print("\n🏃 Creating Sprints...")
-    created_sprints = {}
-    for track_title, sprint_list in sprints.items():
-        if track_title not in created_tracks:
-            continue
-            
-        track_id = created_tracks[track_title]['id']
-        created_sprints[track_title] = {}
-        
-        for sprint_data in sprint_list:
-            try:
-                sprint = api.create_sprint(
-                    track_id,
-                    sprint_data['name'],
-                    sprint_data['start_date'],
-                    sprint_data['end_date'],
-                    sprint_data['description']
-                )
-                created_sprints[track_title][sprint_data['name']] = sprint
-                print(f"  ✅ {sprint_data['name']}")
-            except Exception as e:
-                print(f"  ❌ {sprint_data['name']}: {e}")
-    
-    # Create tasks
-    print("\n📋 Creating Tasks...")
-    total_tasks = 0
     priority_counts = {'HIGH': 0, 'MEDIUM': 0, 'LOW': 0}
-    
-    for (track_title, sprint_name), task_list in tasks.items():
-        if track_title not in created_tracks or track_title not in created_sprints:
-            continue
-        if sprint_name not in created_sprints[track_title]:
-            continue
-            
-        track_id = created_tracks[track_title]['id']
-        sprint_id = created_sprints[track_title][sprint_name]['id']
-        
+    for task_list in tasks.values():
         for task_data in task_list:
-            try:
-                task = api.create_task(
-                    track_id,
-                    sprint_id,
-                    task_data['title'],
-                    task_data['description'],
-                    task_data['priority'],
-                    task_data['estimated_hours']
-                )
-                total_tasks += 1
-                priority_counts[task_data['priority']] += 1
-                priority_icon = "🔥" if task_data['priority'] == 'HIGH' else "📝"
-                print(f"  ✅ {priority_icon} {task_data['title']} ({task_data['estimated_hours']}h)")
-            except Exception as e:
-                print(f"  ❌ {task_data['title']}: {e}")
+            priority_counts[task_data['priority']] += 1
     
     # Summary
     print(f"\n🎉 Project Nexus Population Complete!")
     print(f"📊 FINAL SUMMARY:")
-    print(f"  📁 Categories: {len(created_categories)}")
-    print(f"  🎯 Tracks: {len(created_tracks)}")
-    print(f"  🏃 Sprints: {sum(len(s) for s in created_sprints.values())}")
-    print(f"  📋 Tasks: {total_tasks}")
+    for level, counts in report['summary'].items():
+        print(f"  {level.title()}: {counts['created']} created, "
+              f"{counts['updated']} updated, {counts['unchanged']} unchanged")
     print(f"  🔥 High Priority: {priority_counts['HIGH']} tasks")
     print(f"  📝 Medium Priority: {priority_counts['MEDIUM']} tasks")
     print(f"\n🚀 READY TO LAUNCH PROJECT NEXUS!")
@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.utils import timezone
-from .models import UserProfile, Workspace, Category, Track, Sprint, Task, DailyLog, DailyTodo
+from .models import UserProfile, Workspace, Category, Track, Sprint, Task, DailyLog, DailyTodo, WorkspaceDailyStats, Job, IdempotencyKey
 
 
 @admin.register(UserProfile)
@@ -85,3 +85,41 @@ class DailyTodoAdmin(admin.ModelAdmin):
     search_fields = ['title', 'description']
     readonly_fields = ['created_at', 'updated_at']
     date_hierarchy = 'date'
+
+
+@admin.register(WorkspaceDailyStats)
+class WorkspaceDailyStatsAdmin(admin.ModelAdmin):
+    list_display = ['workspace', 'date', 'tasks_completed', 'tasks_created', 'focus_hours', 'mood', 'todos_done']
+    list_filter = ['date']
+    search_fields = ['workspace__user__username']
+    date_hierarchy = 'date'
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ['name', 'status', 'attempts', 'max_attempts', 'run_at', 'locked_by', 'finished_at', 'created_at']
+    list_filter = ['status', 'name']
+    search_fields = ['name', 'last_error']
+    readonly_fields = ['locked_at', 'locked_by', 'finished_at', 'created_at', 'updated_at']
+    date_hierarchy = 'created_at'
+    actions = ['retry_jobs']
+
+    def retry_jobs(self, request, queryset):
+        """Re-queue the selected jobs to run now."""
+        updated = queryset.exclude(status=Job.StatusChoices.RUNNING).update(
+            status=Job.StatusChoices.QUEUED,
+            attempts=0,
+            run_at=timezone.now(),
+            finished_at=None
+        )
+        self.message_user(request, f'{updated} job(s) re-queued.')
+    retry_jobs.short_description = 'Retry selected jobs'
+
+
+@admin.register(IdempotencyKey)
+class IdempotencyKeyAdmin(admin.ModelAdmin):
+    list_display = ['key', 'user', 'response_status', 'created_at', 'expires_at']
+    list_filter = ['response_status']
+    search_fields = ['key', 'user__username']
+    readonly_fields = ['fingerprint', 'response_status', 'response_body', 'created_at']
+    date_hierarchy = 'created_at'
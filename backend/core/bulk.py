@@ -0,0 +1,174 @@
+"""
+Bulk write operations for FocusFlow tracks, sprints and tasks.
+
+Bulk writes bypass ``Model.save()`` and its signals, so each operation
+maintains the track/sprint counters, the daily rollup and the workspace
+data version itself: once per request instead of once per row.
+"""
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers, status
+from rest_framework.response import Response
+
+from . import rollups
+from .models import Workspace, Track, Sprint, Task
+from .serializers import load_referenced_objects
+
+
+def update_tasks(workspace, changes):
+    """
+    Apply validated TaskBulkUpdateSerializer items to tasks of ``workspace``.
+
+    Tasks and target sprints are loaded (and ownership checked) with one
+    query each, changed tasks are written with a single ``bulk_update`` and
+    the counters of every affected track and sprint are recounted once.
+    Raises ValidationError with one error dict per item if any item is
+    invalid; nothing is written in that case. Returns the tasks in input order.
+    """
+    ids = [item['id'] for item in changes]
+    sprint_ids = {item['sprint'] for item in changes if item.get('sprint') is not None}
+
+    with transaction.atomic():
+        tasks = {
+            task.pk: task
+            for task in Task.objects.select_for_update(of=('self',)).select_related(
+                'track', 'sprint'
+            ).filter(workspace_id=workspace.pk, pk__in=ids)
+        }
+        sprints = Sprint.objects.filter(
+            track__workspace_id=workspace.pk, pk__in=sprint_ids
+        ).in_bulk() if sprint_ids else {}
+
+        errors = [{} for _ in changes]
+        seen = set()
+        for item, item_errors in zip(changes, errors):
+            task = tasks.get(item['id'])
+            if task is None:
+                item_errors['id'] = ['Task not found.']
+            elif item['id'] in seen:
+                item_errors['id'] = ['Duplicate task id.']
+            seen.add(item['id'])
+
+            sprint_id = item.get('sprint')
+            if sprint_id is None:
+                continue
+            sprint = sprints.get(sprint_id)
+            if sprint is None:
+                item_errors['sprint'] = ['Sprint not found.']
+            elif task is not None and task.track_id and sprint.track_id != task.track_id:
+                item_errors['sprint'] = ['Sprint must belong to the selected track.']
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        now = timezone.now()
+        changed = []
+        fields = set()
+        track_ids = set()
+        sprint_ids = set()
+        completions = []
+        for item in changes:
+            task = tasks[item['id']]
+            old_sprint = task.sprint_id
+            for name in ('status', 'priority', 'due_date'):
+                if name in item:
+                    setattr(task, name, item[name])
+            if 'sprint' in item:
+                task.sprint = sprints.get(item['sprint'])
+
+            dirty = task.get_dirty_fields()
+            if 'status' in dirty:
+                task.sync_completed_at(now)
+                dirty = task.get_dirty_fields()
+            if not dirty:
+                continue
+
+            task.updated_at = now
+            changed.append(task)
+            fields.update(dirty)
+            if 'status' in dirty:
+                track_ids.add(task.track_id)
+                sprint_ids.add(task.sprint_id)
+            if 'sprint_id' in dirty:
+                sprint_ids.update([old_sprint, task.sprint_id])
+            if 'completed_at' in dirty:
+                completions.append((rollups.loaded_value(task, 'completed_at'), task.completed_at))
+
+        if changed:
+            Task.objects.bulk_update(changed, [*fields, 'updated_at'])
+            track_ids.discard(None)
+            sprint_ids.discard(None)
+            if track_ids:
+                Track.recount_tasks(pk__in=track_ids)
+            if sprint_ids:
+                Sprint.recount_tasks(pk__in=sprint_ids)
+            rollups.tasks_completion_changed(workspace.pk, completions)
+            Workspace.bump_version(pk=workspace.pk)
+            for task in changed:
+                task.remember_loaded_values()
+
+    return [tasks[task_id] for task_id in ids]
+
+
+def tasks_created(workspace, tasks):
+    """Bookkeeping for tasks inserted with bulk_create: counters and rollup."""
+    track_ids = {task.track_id for task in tasks} - {None}
+    sprint_ids = {task.sprint_id for task in tasks} - {None}
+    if track_ids:
+        Track.recount_tasks(pk__in=track_ids)
+    if sprint_ids:
+        Sprint.recount_tasks(pk__in=sprint_ids)
+    rollups.tasks_created(workspace.pk, tasks)
+
+
+class BulkCreateMixin:
+    """
+    ViewSet mixin letting ``POST`` on the list endpoint accept a JSON array.
+
+    Every item is validated before anything is written, with related ids
+    resolved by load_referenced_objects() in at most one workspace-scoped
+    query per related model. Rows are inserted with ``bulk_create`` in one
+    transaction and the created ids are returned in input order. Bookkeeping normally done by signals goes in
+    ``bulk_created()``.
+    """
+
+    def create(self, request, *args, **kwargs):
+        if not isinstance(request.data, list):
+            return super().create(request, *args, **kwargs)
+
+        workspace = request.workspace
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+        context['prefetched'] = load_referenced_objects(serializer_class, request.data, workspace)
+        serializer = serializer_class(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=settings.BULK_MAX_ITEMS,
+            context=context
+        )
+        serializer.is_valid(raise_exception=True)
+
+        model = serializer.child.Meta.model
+        objects = [self.build_bulk_instance(model, attrs) for attrs in serializer.validated_data]
+        with transaction.atomic():
+            created = model.objects.bulk_create(objects)
+            self.bulk_created(created)
+            Workspace.bump_version(pk=workspace.pk)
+
+        return Response({'ids': [obj.pk for obj in created]}, status=status.HTTP_201_CREATED)
+
+    def build_bulk_instance(self, model, attrs):
+        """
+        Unsaved instance for one validated item. Like perform_create(), sets
+        the workspace on models that have one; non-model fields are dropped.
+        """
+        field_names = {field.name for field in model._meta.concrete_fields}
+        values = {name: value for name, value in attrs.items() if name in field_names}
+        if 'workspace' in field_names:
+            values['workspace_id'] = self.request.workspace.pk
+        return model(**values)
+
+    def bulk_created(self, objects):
+        """Hook run inside the transaction after the bulk insert."""
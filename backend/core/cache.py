@@ -0,0 +1,44 @@
+"""
+Workspace-versioned response cache for FocusFlow read endpoints.
+
+Cached payloads are keyed by workspace, endpoint, query parameters, the
+current date and the workspace's data_version. Any write to the workspace's
+data bumps the version, so stale entries are never served; they simply
+expire.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+
+def cache_key(workspace, endpoint, params):
+    """Build the cache key for one endpoint call."""
+    query = '&'.join(f'{name}={values}' for name, values in sorted(params.lists()))
+    digest = hashlib.md5(query.encode()).hexdigest()
+    return ':'.join([
+        'response',
+        str(workspace.pk),
+        endpoint,
+        str(workspace.data_version),
+        timezone.now().date().isoformat(),
+        digest,
+    ])
+
+
+def cached_response(request, endpoint, compute, timeout=None):
+    """
+    Return the cached payload for ``endpoint`` in the requester's workspace,
+    calling ``compute()`` and storing its result on a miss.
+    """
+    key = cache_key(request.workspace.instance, endpoint, request.query_params)
+    data = cache.get(key)
+    if data is None:
+        data = compute()
+        cache.set(
+            key,
+            data,
+            settings.RESPONSE_CACHE_TIMEOUT if timeout is None else timeout
+        )
+    return data
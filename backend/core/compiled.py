@@ -0,0 +1,174 @@
+"""
+Compiled read-only list representations for FocusFlow's hot list endpoints.
+
+Rendering a page through a ModelSerializer builds a model instance per row
+and walks every field's ``get_attribute()``/``to_representation()``.
+``CompiledSerializer`` inspects a serializer class once, works out which
+``values()`` columns its readable fields need and a plain function per
+field, and then turns ``values()`` rows straight into dicts with the same
+keys, order and value types, so the rendered JSON is byte-for-byte what the
+serializer would produce. ``get_FOO_display`` sources become static
+lookup dicts built from the model field's choices.
+
+Supported sources are model fields, ``get_FOO_display`` and a field of a
+forward relation (``track.title``); anything else (method fields, model
+properties) is rejected when the serializer is compiled.
+"""
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.settings import ISO_8601, api_settings
+
+
+def datetime_mapper(field):
+    """Same output as ``DateTimeField.to_representation`` for aware datetimes."""
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    if output_format is None or output_format.lower() == ISO_8601:
+        return field.to_representation
+    tz = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+    if tz is None:
+        return field.to_representation
+
+    def to_representation(value):
+        if not value:
+            return None
+        return value.astimezone(tz).strftime(output_format)
+    return to_representation
+
+
+def date_mapper(field):
+    """Same output as ``DateField.to_representation``."""
+    output_format = getattr(field, 'format', api_settings.DATE_FORMAT)
+    if output_format is None or output_format.lower() == ISO_8601:
+        return field.to_representation
+
+    def to_representation(value):
+        if not value:
+            return None
+        return value.strftime(output_format)
+    return to_representation
+
+
+def value_mapper(field):
+    """Function turning one column value into the field's representation."""
+    if isinstance(field, serializers.RelatedField):
+        # values() already yields the primary key
+        return None
+    if isinstance(field, serializers.DateTimeField):
+        return datetime_mapper(field)
+    if isinstance(field, serializers.DateField):
+        return date_mapper(field)
+    if isinstance(field, serializers.ChoiceField):
+        return field.to_representation
+    if isinstance(field, serializers.CharField):
+        return str
+    if isinstance(field, serializers.IntegerField):
+        return int
+    return field.to_representation
+
+
+def display_mapper(labels, to_representation):
+    """Static lookup replacing a ``get_FOO_display()`` call."""
+    def to_display(value):
+        return to_representation(labels.get(value, value))
+    return to_display
+
+
+class CompiledSerializer:
+    """
+    Read-only ``values()``-based twin of a ModelSerializer's output.
+    Compiled on first use; ``columns`` are the ``values()`` lookups needed.
+    """
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self._plan = None
+
+    def compile(self):
+        model = self.serializer_class.Meta.model
+        columns = []
+        plan = []
+        for name, field in self.serializer_class().fields.items():
+            if field.write_only:
+                continue
+            if isinstance(field, serializers.SerializerMethodField):
+                raise ImproperlyConfigured(f'{name}: method fields cannot be compiled')
+
+            attrs = field.source_attrs
+            if len(attrs) == 1 and attrs[0].startswith('get_') and attrs[0].endswith('_display'):
+                column = attrs[0][len('get_'):-len('_display')]
+                labels = {
+                    value: str(label)
+                    for value, label in model._meta.get_field(column).flatchoices
+                }
+                plan.append((name, column, None, display_mapper(labels, value_mapper(field))))
+                columns.append(column)
+                continue
+
+            try:
+                model_field = model._meta.get_field(attrs[0])
+            except FieldDoesNotExist:
+                if hasattr(model, attrs[0]) or field.required:
+                    raise ImproperlyConfigured(f'{name}: source {field.source!r} is not a model field')
+                # Field.get_attribute() gives None or SkipField on every row
+                if field.allow_null:
+                    plan.append((name, None, None, None))
+                continue
+
+            if len(attrs) == 1:
+                column, skip_if_null = attrs[0], None
+            elif len(attrs) == 2 and model_field.many_to_one:
+                # A missing related object makes the field raise SkipField
+                column, skip_if_null = '__'.join(attrs), attrs[0]
+                columns.append(attrs[0])
+            else:
+                raise ImproperlyConfigured(f'{name}: source {field.source!r} cannot be compiled')
+
+            plan.append((name, column, skip_if_null, value_mapper(field)))
+            columns.append(column)
+
+        self.columns = list(dict.fromkeys(columns))
+        self._plan = plan
+
+    @property
+    def plan(self):
+        if self._plan is None:
+            self.compile()
+        return self._plan
+
+    def values(self, queryset):
+        """``queryset`` as the ``values()`` rows render() expects."""
+        if self._plan is None:
+            self.compile()
+        return queryset.values(*self.columns)
+
+    def render(self, rows):
+        """Serialized dicts for ``values()`` rows, in row order."""
+        plan = self.plan
+        data = []
+        for row in rows:
+            item = {}
+            for name, column, skip_if_null, mapper in plan:
+                if skip_if_null is not None and row[skip_if_null] is None:
+                    continue
+                value = None if column is None else row[column]
+                if value is not None and mapper is not None:
+                    value = mapper(value)
+                item[name] = value
+            data.append(item)
+        return data
+
+
+class CompiledListMixin:
+    """
+    ViewSet mixin rendering the ``list`` action through ``compiled_serializer``
+    (a CompiledSerializer of the viewset's serializer) from ``values()`` rows.
+    """
+    compiled_serializer = None
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.compiled_serializer.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.compiled_serializer.render(page))
+        return Response(self.compiled_serializer.render(queryset))
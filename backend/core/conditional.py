@@ -0,0 +1,128 @@
+"""
+Conditional GET support (ETag / Last-Modified) for FocusFlow API endpoints.
+
+Validators are derived from the workspace's data_version and updated_at,
+which every write to the workspace's data bumps, so an unchanged response
+is answered with 304 before any query or serialization work happens.
+"""
+import hashlib
+from datetime import datetime, time
+from functools import wraps
+
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+SAFE_METHODS = ('GET', 'HEAD')
+
+
+def workspace_validators(request, period=None):
+    """
+    Return (etag, last_modified) for a request in the user's workspace.
+
+    The ETag covers the workspace version, the full request path and the
+    current date (several payloads depend on "today"); Last-Modified is
+    never earlier than local midnight for the same reason. ``period`` is an
+    optional (name, start) pair for payloads that also change within a day,
+    e.g. the dashboard's time-of-day greeting: the name goes into the ETag
+    and Last-Modified is never earlier than the start.
+    """
+    workspace = request.workspace.instance
+    today = timezone.localdate()
+    parts = [
+        str(workspace.pk),
+        str(workspace.data_version),
+        workspace.updated_at.isoformat(),
+        today.isoformat(),
+        request.get_full_path(),
+    ]
+    midnight = timezone.make_aware(datetime.combine(today, time.min))
+    last_modified = max(workspace.updated_at, midnight)
+    if period is not None:
+        name, start = period
+        parts.append(name)
+        last_modified = max(last_modified, start)
+    etag = quote_etag(hashlib.md5(':'.join(parts).encode()).hexdigest())
+    return etag, int(last_modified.timestamp())
+
+
+def not_modified_response(request, etag, last_modified):
+    """Return a 304 response if the client's validators match, else None."""
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified):
+    """Attach ETag/Last-Modified and force clients to revalidate."""
+    response.headers['ETag'] = etag
+    response.headers['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ['Authorization'])
+    return response
+
+
+class NotModified(Exception):
+    """Raised from ``initial()`` to skip the handler and answer 304."""
+
+    def __init__(self, response):
+        super().__init__('Not modified')
+        self.response = response
+
+
+class ConditionalGetMixin:
+    """
+    ViewSet mixin adding ETag/Last-Modified to every GET/HEAD action and
+    answering 304 without running the handler when nothing has changed.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._validators = None
+        if request.method in SAFE_METHODS:
+            self._validators = workspace_validators(request)
+            not_modified = not_modified_response(request, *self._validators)
+            if not_modified is not None:
+                raise NotModified(not_modified)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        validators = getattr(self, '_validators', None)
+        if validators and response.status_code == 200:
+            set_validators(response, *validators)
+        return response
+
+
+def conditional_get(view_func=None, *, period=None):
+    """
+    Decorator for function-based API views (below ``@api_view``) that adds
+    ETag/Last-Modified and short-circuits unchanged GETs with 304.
+    ``@conditional_get(period=callable)`` passes ``callable()`` to
+    workspace_validators as the payload's current period.
+    """
+    if view_func is None:
+        return lambda view_func: conditional_get(view_func, period=period)
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if request.method not in SAFE_METHODS:
+            return view_func(request, *args, **kwargs)
+
+        validators = workspace_validators(request, period() if period else None)
+        not_modified = not_modified_response(request, *validators)
+        if not_modified is not None:
+            return not_modified
+
+        response = view_func(request, *args, **kwargs)
+        if response.status_code == 200:
+            set_validators(response, *validators)
+        return response
+
+    return wrapper
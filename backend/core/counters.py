@@ -0,0 +1,46 @@
+"""
+Incremental maintenance of the denormalized task counters on Track and Sprint.
+
+Every Task write shifts ``total_tasks``/``done_tasks`` of the affected
+parents with atomic ``F()`` updates, so progress never needs a recount.
+``Track.recount_tasks`` / ``Sprint.recount_tasks`` rebuild them from the
+tasks table to repair drift.
+"""
+from .models import Track, Sprint, Task
+from .rollups import loaded_value
+
+
+def move_task(model, old_pk, new_pk, was_done, is_done):
+    """
+    Shift one task's contribution from parent ``old_pk`` to ``new_pk``
+    (either may be None) of ``model``.
+    """
+    if old_pk == new_pk:
+        if new_pk is not None and was_done != is_done:
+            model.adjust_task_counters(new_pk, done=1 if is_done else -1)
+        return
+    if old_pk is not None:
+        model.adjust_task_counters(old_pk, total=-1, done=-int(was_done))
+    if new_pk is not None:
+        model.adjust_task_counters(new_pk, total=1, done=int(is_done))
+
+
+def task_saved(task, created):
+    """Adjust track and sprint counters after a task insert or update."""
+    if created:
+        old_track, old_sprint, was_done = None, None, False
+    else:
+        old_track = loaded_value(task, 'track_id')
+        old_sprint = loaded_value(task, 'sprint_id')
+        was_done = loaded_value(task, 'status') == Task.StatusChoices.DONE
+    is_done = task.status == Task.StatusChoices.DONE
+
+    move_task(Track, old_track, task.track_id, was_done, is_done)
+    move_task(Sprint, old_sprint, task.sprint_id, was_done, is_done)
+
+
+def task_deleted(task):
+    """Remove a deleted task from its track's and sprint's counters."""
+    was_done = task.status == Task.StatusChoices.DONE
+    move_task(Track, task.track_id, None, was_done, False)
+    move_task(Sprint, task.sprint_id, None, was_done, False)
@@ -0,0 +1,149 @@
+"""
+Grouped listings with per-group keyset cursors for FocusFlow.
+
+Board-style endpoints show the first N rows of every group (tasks per
+status, tracks per category). ``top_per_group()`` fetches all groups in one
+query by ranking rows with ``ROW_NUMBER() OVER (PARTITION BY <group>)``,
+and ``group_counts()`` gets every group's total in one more. Each group
+gets an opaque ``next`` cursor holding the sort key of its last row, so a
+client can page one group on its own with ``keyset_page()``.
+
+Sort keys are the model's default ordering plus ``pk``; the ordering
+fields must not be nullable.
+"""
+import base64
+import datetime
+import json
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import RowNumber
+
+from .prefetch import order_expressions
+
+
+DEFAULT_LIMIT_PER_GROUP = 20
+MAX_LIMIT_PER_GROUP = 100
+
+
+def parse_limit_per_group(value):
+    """Parse ``?limit_per_group=``; raises ValueError when out of range."""
+    if value in (None, ''):
+        return DEFAULT_LIMIT_PER_GROUP
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError('limit_per_group must be an integer')
+    if not 1 <= limit <= MAX_LIMIT_PER_GROUP:
+        raise ValueError(f'limit_per_group must be between 1 and {MAX_LIMIT_PER_GROUP}')
+    return limit
+
+
+def sort_key(model):
+    """Ordering used for grouped listings: default ordering plus pk."""
+    return [*model._meta.ordering, '-pk']
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder cuts datetimes to milliseconds; cursors keep the full
+    precision, or rows sharing the cursor row's millisecond would be skipped.
+    """
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(obj, ordering):
+    """Opaque cursor pointing just after ``obj`` in ``ordering``."""
+    values = [getattr(obj, name.lstrip('-')) for name in ordering]
+    raw = json.dumps(values, cls=CursorEncoder)
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor, ordering):
+    """Sort key values stored in a cursor; raises ValueError if malformed."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(values, list) or len(values) != len(ordering):
+        raise ValueError('Invalid cursor')
+    return values
+
+
+def cursor_values(model, ordering, values):
+    """Cursor values converted back to the Python types of their fields."""
+    fields = [
+        model._meta.pk if name.lstrip('-') == 'pk' else model._meta.get_field(name.lstrip('-'))
+        for name in ordering
+    ]
+    return [field.to_python(value) for field, value in zip(fields, values)]
+
+
+def after(ordering, values):
+    """Q matching rows that sort strictly after ``values`` in ``ordering``."""
+    condition = None
+    for index in reversed(range(len(ordering))):
+        name = ordering[index].lstrip('-')
+        lookup = 'lt' if ordering[index].startswith('-') else 'gt'
+        step = Q(**{f'{name}__{lookup}': values[index]})
+        if condition is not None:
+            step |= Q(**{name: values[index]}) & condition
+        condition = step
+    return condition
+
+
+def top_per_group(queryset, group_field, limit):
+    """
+    The first ``limit`` rows of every ``group_field`` value, in one query,
+    ordered by group and then by the model's sort key.
+    """
+    ordering = sort_key(queryset.model)
+    return queryset.annotate(
+        group_rank=Window(
+            RowNumber(),
+            partition_by=F(group_field),
+            order_by=order_expressions(ordering),
+        )
+    ).filter(group_rank__lte=limit).order_by(group_field, *ordering)
+
+
+def group_counts(queryset, group_field):
+    """Map each ``group_field`` value to its row count, in one query."""
+    rows = queryset.order_by().values(group_field).annotate(total=Count('pk'))
+    return {row[group_field]: row['total'] for row in rows}
+
+
+def keyset_page(queryset, limit, cursor=None):
+    """
+    One page of a single group after ``cursor``. Returns the rows and the
+    cursor for the next page (None on the last page).
+    """
+    ordering = sort_key(queryset.model)
+    if cursor:
+        try:
+            values = cursor_values(queryset.model, ordering, decode_cursor(cursor, ordering))
+            queryset = queryset.filter(after(ordering, values))
+        except (TypeError, DjangoValidationError):
+            raise ValueError('Invalid cursor')
+    rows = list(queryset.order_by(*ordering)[:limit + 1])
+    return rows[:limit], group_cursor(rows[:limit], len(rows))
+
+
+def group_cursor(rows, total):
+    """Cursor after the last shown row of a group, or None if none are left."""
+    if not rows or len(rows) >= total:
+        return None
+    return encode_cursor(rows[-1], sort_key(type(rows[-1])))
+
+
+def split_groups(rows, group_field):
+    """Bucket rows fetched by ``top_per_group()`` by their group value."""
+    groups = {}
+    for row in rows:
+        groups.setdefault(getattr(row, group_field), []).append(row)
+    return groups
@@ -0,0 +1,181 @@
+"""
+Idempotency-Key support for FocusFlow's mutating API endpoints.
+
+Clients that retry a POST/PUT/PATCH/DELETE send the same ``Idempotency-Key``
+header on every attempt. The first successful response for a key is stored
+for IDEMPOTENCY_KEY_TTL seconds and replayed to retries without running the
+handler again. A retry while the first attempt is still running gets 409,
+and reusing a key for a different request gets 422. Keys are scoped to the
+user; unauthenticated requests ignore the header.
+"""
+import hashlib
+from datetime import timedelta
+from functools import wraps
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.response import Response
+
+from .models import IdempotencyKey
+
+
+HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+UNSAFE_METHODS = ('POST', 'PUT', 'PATCH', 'DELETE')
+MAX_KEY_LENGTH = IdempotencyKey._meta.get_field('key').max_length
+
+
+class KeyInFlight(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = 'A request with this Idempotency-Key is still being processed.'
+    default_code = 'idempotency_key_in_flight'
+
+
+class KeyMismatch(APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = 'This Idempotency-Key was already used for a different request.'
+    default_code = 'idempotency_key_mismatch'
+
+
+def request_fingerprint(request):
+    """Hash of the method, full path and raw body of a request."""
+    digest = hashlib.sha256()
+    digest.update(f'{request.method} {request.get_full_path()}\n'.encode())
+    digest.update(request.body)
+    return digest.hexdigest()
+
+
+def replay(record):
+    """Response reproducing the stored result of a completed key."""
+    return Response(
+        record.response_body,
+        status=record.response_status,
+        headers={REPLAYED_HEADER: 'true'}
+    )
+
+
+def begin(request):
+    """
+    Start handling an idempotent request.
+
+    Returns ``(record, None)`` when the handler should run (``record`` is
+    None if the request carries no key), or ``(None, response)`` with the
+    stored response of a completed retry. Raises KeyInFlight/KeyMismatch.
+    """
+    if request.method not in UNSAFE_METHODS or not request.user.is_authenticated:
+        return None, None
+    key = request.headers.get(HEADER)
+    if not key:
+        return None, None
+    if len(key) > MAX_KEY_LENGTH:
+        raise ValidationError({HEADER: [f'Ensure this value has at most {MAX_KEY_LENGTH} characters.']})
+
+    fingerprint = request_fingerprint(request)
+    now = timezone.now()
+    record = IdempotencyKey.objects.filter(user=request.user, key=key).first()
+    if record is not None:
+        abandoned = (
+            record.response_status is None
+            and record.created_at <= now - timedelta(seconds=settings.IDEMPOTENCY_LOCK_TIMEOUT)
+        )
+        if record.expires_at <= now or abandoned:
+            IdempotencyKey.objects.filter(pk=record.pk).delete()
+            record = None
+
+    if record is None:
+        try:
+            with transaction.atomic():
+                record = IdempotencyKey.objects.create(
+                    user=request.user,
+                    key=key,
+                    fingerprint=fingerprint,
+                    expires_at=now + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+                )
+        except IntegrityError:
+            # Another attempt with the same key got there first
+            raise KeyInFlight()
+        return record, None
+
+    if record.fingerprint != fingerprint:
+        raise KeyMismatch()
+    if record.response_status is None:
+        raise KeyInFlight()
+    return None, replay(record)
+
+
+def release(record):
+    """Forget a key whose request did not succeed, so it can be retried."""
+    if record is not None:
+        IdempotencyKey.objects.filter(pk=record.pk).delete()
+
+
+def finish(record, response):
+    """Store a successful response for replay; release the key otherwise."""
+    if record is None:
+        return response
+    if status.is_success(response.status_code) and hasattr(response, 'data'):
+        record.response_status = response.status_code
+        record.response_body = response.data
+        record.save(update_fields=['response_status', 'response_body'])
+    else:
+        release(record)
+    return response
+
+
+class Replayed(Exception):
+    """Raised from ``initial()`` to skip the handler and replay a stored response."""
+
+    def __init__(self, response):
+        super().__init__('Replayed')
+        self.response = response
+
+
+class IdempotencyMixin:
+    """
+    ViewSet mixin honouring ``Idempotency-Key`` on every mutating action.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        self._idempotency_record = None
+        super().initial(request, *args, **kwargs)
+        self._idempotency_record, replayed = begin(request)
+        if replayed is not None:
+            raise Replayed(replayed)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, Replayed):
+            return exc.response
+        try:
+            return super().handle_exception(exc)
+        except Exception:
+            release(getattr(self, '_idempotency_record', None))
+            raise
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        record = getattr(self, '_idempotency_record', None)
+        self._idempotency_record = None
+        return finish(record, response)
+
+
+def idempotent(view_func):
+    """
+    Decorator for function-based API views (below ``@api_view``) that
+    honours ``Idempotency-Key`` like IdempotencyMixin.
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        record, replayed = begin(request)
+        if replayed is not None:
+            return replayed
+        try:
+            response = view_func(request, *args, **kwargs)
+        except Exception:
+            release(record)
+            raise
+        return finish(record, response)
+
+    return wrapper
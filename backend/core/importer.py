@@ -0,0 +1,248 @@
+"""
+Whole-plan import for FocusFlow.
+
+A validated plan document (categories -> tracks -> sprints -> tasks, see
+PlanImportSerializer) is upserted level by level in dependency order.
+Existing rows are matched by name: categories by name, tracks by title
+in the workspace, sprints by name in their track and tasks by title in
+their sprint (or track). Each level costs one lookup query, one
+``bulk_create`` and one ``bulk_update``, all in a single transaction.
+"""
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from . import rollups
+from .models import Workspace, Category, Track, Sprint, Task
+
+
+CREATED = 'created'
+UPDATED = 'updated'
+UNCHANGED = 'unchanged'
+
+
+def node_values(node, *exclude):
+    """Column values given for a plan node, without its children."""
+    return {name: value for name, value in node.items() if name not in exclude}
+
+
+def index_by(queryset, *keys):
+    """Map key tuples to rows; the oldest row wins when several match."""
+    rows = {}
+    for row in queryset.order_by('-pk'):
+        rows[tuple(getattr(row, key) for key in keys)] = row
+    return rows
+
+
+def column_values(row):
+    """Current column values of a row, by attname."""
+    return {field.attname: getattr(row, field.attname) for field in row._meta.concrete_fields}
+
+
+def summarize(rows):
+    """Count of each result for one level."""
+    counts = Counter(result for _, result in rows)
+    return {result: counts[result] for result in (CREATED, UPDATED, UNCHANGED)}
+
+
+def upsert(model, entries, now, prepare=None):
+    """
+    Create or update one level of the plan.
+
+    ``entries`` is a list of ``(existing_row_or_None, values)``. Missing rows
+    are inserted with one bulk_create and changed rows written with one
+    bulk_update. ``prepare`` is called on every row after its values are
+    applied. Returns ``(row, result)`` pairs in input order.
+    """
+    created, changed, fields, results = [], [], set(), []
+    for row, values in entries:
+        if row is None:
+            row = model(**values)
+            if prepare:
+                prepare(row)
+            created.append(row)
+            results.append((row, CREATED))
+            continue
+
+        before = column_values(row)
+        for name, value in values.items():
+            setattr(row, name, value)
+        if prepare:
+            prepare(row)
+        dirty = [name for name, value in column_values(row).items() if before[name] != value]
+        if dirty:
+            changed.append(row)
+            fields.update(dirty)
+        results.append((row, UPDATED if dirty else UNCHANGED))
+
+    if created:
+        model.objects.bulk_create(created)
+    if changed:
+        if any(field.name == 'updated_at' for field in model._meta.concrete_fields):
+            for row in changed:
+                row.updated_at = now
+            fields.add('updated_at')
+        model.objects.bulk_update(changed, list(fields))
+    return results
+
+
+def upsert_categories(workspace, categories, now):
+    """
+    Category level of the import. Category names are unique across all
+    workspaces, so a concurrent request may insert one of ours between the
+    lookup and the insert. A name now held by another workspace is a
+    validation error; one inserted into this workspace (e.g. a repeated
+    import) is matched by a second lookup.
+    """
+    names = [category['name'] for category in categories]
+    for retry in (False, True):
+        existing = index_by(Category.objects.filter(workspace_id=workspace.pk, name__in=names), 'name')
+        try:
+            with transaction.atomic():
+                return upsert(Category, [
+                    (
+                        existing.get((category['name'],)),
+                        {**node_values(category, 'tracks'), 'workspace_id': workspace.pk},
+                    )
+                    for category in categories
+                ], now)
+        except IntegrityError:
+            taken = sorted(
+                Category.objects.filter(name__in=names)
+                .exclude(workspace_id=workspace.pk).values_list('name', flat=True)
+            )
+            if taken:
+                raise serializers.ValidationError({
+                    'categories': [f"Category name(s) already in use: {', '.join(taken)}."]
+                })
+            if retry:
+                raise
+
+
+def node_report(row, result, name_field, **children):
+    """Result entry for one imported node."""
+    return {name_field: getattr(row, name_field), 'id': row.pk, 'result': result, **children}
+
+
+def import_plan(workspace, plan):
+    """
+    Upsert a validated plan into ``workspace`` and return the per-node
+    report, mirroring the plan's shape, plus per-level summary counts.
+    """
+    now = timezone.now()
+    categories = plan['categories']
+    tracks = [(category, track) for category in categories for track in category['tracks']]
+    sprints = [(track, sprint) for _, track in tracks for sprint in track['sprints']]
+
+    with transaction.atomic():
+        category_rows = upsert_categories(workspace, categories, now)
+        category_ids = {
+            id(category): row.pk for category, (row, _) in zip(categories, category_rows)
+        }
+
+        existing_tracks = index_by(
+            Track.objects.filter(workspace_id=workspace.pk, title__in=[track['title'] for _, track in tracks]),
+            'title'
+        )
+        track_rows = upsert(Track, [
+            (
+                existing_tracks.get((track['title'],)),
+                {
+                    **node_values(track, 'sprints', 'tasks'),
+                    'workspace_id': workspace.pk,
+                    'category_id': category_ids[id(category)],
+                },
+            )
+            for category, track in tracks
+        ], now)
+        track_ids = {id(track): row.pk for (_, track), (row, _) in zip(tracks, track_rows)}
+        matched_tracks = [row.pk for row, result in track_rows if result != CREATED]
+
+        existing_sprints = index_by(
+            Sprint.objects.filter(
+                track_id__in=matched_tracks, name__in=[sprint['name'] for _, sprint in sprints]
+            ),
+            'track_id', 'name'
+        )
+        sprint_rows = upsert(Sprint, [
+            (
+                existing_sprints.get((track_ids[id(track)], sprint['name'])),
+                {**node_values(sprint, 'tasks'), 'track_id': track_ids[id(track)]},
+            )
+            for track, sprint in sprints
+        ], now)
+        sprint_ids = {id(sprint): row.pk for (_, sprint), (row, _) in zip(sprints, sprint_rows)}
+
+        tasks = [(track, None, task) for _, track in tracks for task in track['tasks']]
+        tasks += [(track, sprint, task) for track, sprint in sprints for task in sprint['tasks']]
+        existing_tasks = index_by(
+            Task.objects.filter(
+                workspace_id=workspace.pk,
+                track_id__in=matched_tracks,
+                title__in=[task['title'] for _, _, task in tasks]
+            ),
+            'track_id', 'sprint_id', 'title'
+        )
+        task_entries = []
+        for track, sprint, task in tasks:
+            track_id = track_ids[id(track)]
+            sprint_id = sprint_ids[id(sprint)] if sprint else None
+            task_entries.append((
+                existing_tasks.get((track_id, sprint_id, task['title'])),
+                {
+                    **task,
+                    'workspace_id': workspace.pk,
+                    'track_id': track_id,
+                    'sprint_id': sprint_id,
+                },
+            ))
+        task_rows = upsert(Task, task_entries, now, prepare=lambda row: row.sync_completed_at(now))
+
+        new_tasks = [row for row, result in task_rows if result == CREATED]
+        updated_tasks = [row for row, result in task_rows if result == UPDATED]
+        if new_tasks or updated_tasks:
+            Track.recount_tasks(pk__in=set(track_ids.values()))
+            Sprint.recount_tasks(pk__in=set(sprint_ids.values()))
+            rollups.tasks_created(workspace.pk, new_tasks)
+            rollups.tasks_completion_changed(workspace.pk, [
+                (rollups.loaded_value(row, 'completed_at'), row.completed_at)
+                for row in updated_tasks
+            ])
+        if any(result != UNCHANGED for _, result in category_rows + track_rows + sprint_rows + task_rows):
+            Workspace.bump_version(pk=workspace.pk)
+
+    task_results = {id(task): pair for (_, _, task), pair in zip(tasks, task_rows)}
+    sprint_results = {id(sprint): pair for (_, sprint), pair in zip(sprints, sprint_rows)}
+    track_results = {id(track): pair for (_, track), pair in zip(tracks, track_rows)}
+
+    def task_reports(nodes):
+        return [node_report(*task_results[id(task)], 'title') for task in nodes]
+
+    report = {
+        'categories': [
+            node_report(*category_row, 'name', tracks=[
+                node_report(
+                    *track_results[id(track)], 'title',
+                    sprints=[
+                        node_report(
+                            *sprint_results[id(sprint)], 'name',
+                            tasks=task_reports(sprint['tasks'])
+                        )
+                        for sprint in track['sprints']
+                    ],
+                    tasks=task_reports(track['tasks'])
+                )
+                for track in category['tracks']
+            ])
+            for category, category_row in zip(categories, category_rows)
+        ],
+        'summary': {
+            'categories': summarize(category_rows),
+            'tracks': summarize(track_rows),
+            'sprints': summarize(sprint_rows),
+            'tasks': summarize(task_rows),
+        },
+    }
+    return report
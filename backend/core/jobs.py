@@ -0,0 +1,199 @@
+"""
+Database-backed background job queue for FocusFlow.
+
+Request handlers ``enqueue()`` jobs inside their own transaction, so a job
+only becomes visible once the request's writes are committed. Workers
+(``manage.py run_jobs``) claim due jobs with ``SELECT ... FOR UPDATE SKIP
+LOCKED`` so several workers never pick the same row, run the registered
+handler and retry failures with exponential backoff.
+"""
+import logging
+import traceback
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.auth.tokens import default_token_generator
+from django.core.mail import send_mail
+from django.db import transaction
+from django.db.models import F
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .models import Job
+from .rollups import rebuild
+
+
+logger = logging.getLogger(__name__)
+
+JOB_HANDLERS = {}
+
+
+def job_handler(name):
+    """Register a function as the handler for jobs called ``name``."""
+    def register(func):
+        JOB_HANDLERS[name] = func
+        return func
+    return register
+
+
+def enqueue(name, payload=None, run_at=None, max_attempts=None):
+    """
+    Queue a job for a registered handler; ``payload`` is passed as keyword
+    arguments and must be JSON-serializable.
+    """
+    if name not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job: {name}")
+    return Job.objects.create(
+        name=name,
+        payload=payload or {},
+        run_at=run_at or timezone.now(),
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+    )
+
+
+def claim(worker, limit=1):
+    """
+    Atomically claim up to ``limit`` due jobs for ``worker`` and mark them
+    running. Rows locked by other workers are skipped rather than waited on.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(
+            Job.objects.select_for_update(skip_locked=True).filter(
+                status=Job.StatusChoices.QUEUED,
+                run_at__lte=now,
+            ).order_by('run_at', 'pk')[:limit]
+        )
+        if jobs:
+            Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+                status=Job.StatusChoices.RUNNING,
+                attempts=F('attempts') + 1,
+                locked_at=now,
+                locked_by=worker,
+                updated_at=now,
+            )
+    for job in jobs:
+        job.attempts += 1
+        job.locked_by = worker
+    return jobs
+
+
+def retry_delay(attempts):
+    """Exponential backoff before the next attempt."""
+    return timedelta(seconds=settings.JOB_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def run(job):
+    """
+    Run one claimed job and record the outcome. Failed jobs are re-queued
+    with backoff until ``max_attempts`` is reached, then marked FAILED.
+    """
+    handler = JOB_HANDLERS.get(job.name)
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for job '{job.name}'")
+        handler(**job.payload)
+    except Exception:
+        error = traceback.format_exc()
+        now = timezone.now()
+        if handler is not None and job.attempts < job.max_attempts:
+            status, run_at, finished_at = Job.StatusChoices.QUEUED, now + retry_delay(job.attempts), None
+        else:
+            status, run_at, finished_at = Job.StatusChoices.FAILED, job.run_at, now
+        logger.warning('Job %s (%s) failed on attempt %s:\n%s', job.pk, job.name, job.attempts, error)
+        Job.objects.filter(pk=job.pk).update(
+            status=status,
+            run_at=run_at,
+            finished_at=finished_at,
+            last_error=error,
+            locked_at=None,
+            locked_by='',
+            updated_at=now,
+        )
+        return False
+
+    now = timezone.now()
+    Job.objects.filter(pk=job.pk).update(
+        status=Job.StatusChoices.DONE,
+        finished_at=now,
+        locked_at=None,
+        locked_by='',
+        updated_at=now,
+    )
+    return True
+
+
+def requeue_stale(timeout=None):
+    """
+    Put back jobs left RUNNING longer than ``timeout`` seconds, e.g. by a
+    worker that was killed. Returns the number of jobs re-queued.
+    """
+    timeout = settings.JOB_LOCK_TIMEOUT if timeout is None else timeout
+    now = timezone.now()
+    return Job.objects.filter(
+        status=Job.StatusChoices.RUNNING,
+        locked_at__lt=now - timedelta(seconds=timeout),
+    ).update(
+        status=Job.StatusChoices.QUEUED,
+        locked_at=None,
+        locked_by='',
+        run_at=now,
+        updated_at=now,
+    )
+
+
+# Job handlers
+
+@job_handler('send_password_reset_email')
+def send_password_reset_email(user_id):
+    """Email a password reset link to a user."""
+    user = User.objects.filter(pk=user_id).first()
+    if user is None or not user.email:
+        return
+
+    # Generate reset token
+    token = default_token_generator.make_token(user)
+
+    # Create reset URL
+    reset_url = f"{settings.FRONTEND_URL}/reset-password?token={token}&uid={user.pk}"
+
+    subject = 'Reset Your BreathingMonk Password'
+
+    # Render HTML email
+    html_message = render_to_string('emails/password_reset.html', {
+        'username': user.username,
+        'reset_url': reset_url,
+    })
+
+    # Plain text fallback
+    plain_message = f'''
+    Hello {user.username},
+
+    We received a request to reset your password for your BreathingMonk account.
+
+    Click the link below to reset your password:
+    {reset_url}
+
+    This link will expire in 24 hours.
+
+    If you didn't request a password reset, you can safely ignore this email.
+
+    Best regards,
+    The BreathingMonk Team
+    '''
+
+    send_mail(
+        subject=subject,
+        message=plain_message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[user.email],
+        html_message=html_message,
+        fail_silently=False,
+    )
+
+
+@job_handler('rebuild_daily_stats')
+def rebuild_daily_stats(workspace_id=None, since=None):
+    """Rebuild the daily rollup for a workspace (or all), optionally from a date."""
+    rebuild(workspace_id=workspace_id, since=date.fromisoformat(since) if since else None)
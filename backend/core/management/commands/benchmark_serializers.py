@@ -0,0 +1,65 @@
+"""
+Django management command comparing ModelSerializer and compiled rendering
+of the task and daily log lists for one user's workspace.
+Run with: python manage.py benchmark_serializers --user <username> [--repeat 5]
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.models import User
+from rest_framework.renderers import JSONRenderer
+
+from core.compiled import CompiledSerializer
+from core.models import Task, DailyLog
+from core.serializers import TaskSerializer, DailyLogSerializer
+from core.views import TASK_LIST_FIELDS
+
+
+class Command(BaseCommand):
+    help = 'Measures rows/sec of the task and daily log lists, serializer vs compiled'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', required=True, help='Username whose workspace is rendered')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per path; the best is reported')
+
+    def handle(self, *args, **options):
+        try:
+            workspace = User.objects.get(username=options['user']).workspace
+        except User.DoesNotExist:
+            raise CommandError(f"User {options['user']!r} does not exist")
+
+        cases = [
+            (
+                'tasks', TaskSerializer,
+                Task.objects.filter(workspace=workspace).select_related('track', 'sprint')
+                .only(*TASK_LIST_FIELDS).order_by('-priority', '-created_at'),
+            ),
+            ('daily-logs', DailyLogSerializer, DailyLog.objects.filter(workspace=workspace).order_by('-date')),
+        ]
+        renderer = JSONRenderer()
+        for name, serializer_class, queryset in cases:
+            compiled = CompiledSerializer(serializer_class)
+            paths = {
+                'serializer': lambda: renderer.render(serializer_class(queryset.all(), many=True).data),
+                'compiled': lambda: renderer.render(compiled.render(compiled.values(queryset.all()))),
+            }
+            results = {}
+            for path, render in paths.items():
+                best = None
+                for _ in range(options['repeat']):
+                    started = time.perf_counter()
+                    body = render()
+                    elapsed = time.perf_counter() - started
+                    best = elapsed if best is None else min(best, elapsed)
+                results[path] = (best, body)
+
+            rows = queryset.count()
+            identical = results['serializer'][1] == results['compiled'][1]
+            for path, (best, _) in results.items():
+                rate = rows / best if best else 0
+                self.stdout.write(f'{name:<11} {path:<10} {rows:>7} rows  {best * 1000:9.1f} ms  {rate:>11,.0f} rows/sec')
+            speedup = results['serializer'][0] / results['compiled'][0] if results['compiled'][0] else 0
+            style = self.style.SUCCESS if identical else self.style.ERROR
+            self.stdout.write(style(
+                f'{name:<11} {speedup:.1f}x faster, output {"identical" if identical else "DIFFERS"}'
+            ))
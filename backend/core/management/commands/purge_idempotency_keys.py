@@ -0,0 +1,16 @@
+"""
+Django management command deleting expired Idempotency-Key records.
+Run with: python manage.py purge_idempotency_keys (e.g. daily from cron)
+"""
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    help = 'Deletes stored Idempotency-Key responses whose TTL has passed'
+
+    def handle(self, *args, **options):
+        deleted, _ = IdempotencyKey.objects.filter(expires_at__lte=timezone.now()).delete()
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} expired idempotency key(s)'))
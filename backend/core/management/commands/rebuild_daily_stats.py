@@ -0,0 +1,57 @@
+"""
+Django management command to backfill or rebuild the daily rollup table.
+Run with: python manage.py rebuild_daily_stats [--user USERNAME] [--since YYYY-MM-DD] [--background]
+"""
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.models import User
+
+from core.jobs import enqueue
+from core.rollups import rebuild
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds WorkspaceDailyStats rows from tasks, daily logs and daily todos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            help='Only rebuild the workspace of this username'
+        )
+        parser.add_argument(
+            '--since',
+            help='Only rebuild days on or after this date (YYYY-MM-DD)'
+        )
+        parser.add_argument(
+            '--background',
+            action='store_true',
+            help='Queue the rebuild for the run_jobs worker instead of running it here'
+        )
+
+    def handle(self, *args, **options):
+        workspace_id = None
+        if options['user']:
+            try:
+                workspace_id = User.objects.get(username=options['user']).pk
+            except User.DoesNotExist:
+                raise CommandError(f"User '{options['user']}' does not exist")
+
+        since = None
+        if options['since']:
+            try:
+                since = date.fromisoformat(options['since'])
+            except ValueError:
+                raise CommandError('--since must be a date in YYYY-MM-DD format')
+
+        if options['background']:
+            job = enqueue('rebuild_daily_stats', {
+                'workspace_id': workspace_id,
+                'since': since.isoformat() if since else None,
+            })
+            self.stdout.write(self.style.SUCCESS(f'Queued daily stats rebuild as job #{job.pk}'))
+            return
+
+        self.stdout.write('Rebuilding daily stats...')
+        rows = rebuild(workspace_id=workspace_id, since=since)
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {rows} daily stats rows'))
@@ -0,0 +1,104 @@
+"""
+Django management command running background job workers.
+Run with: python manage.py run_jobs [--concurrency N] [--poll-interval SECONDS] [--once]
+"""
+import os
+import signal
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection
+
+from core import jobs
+
+
+class Command(BaseCommand):
+    help = 'Runs background jobs from the database-backed job queue'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=settings.JOB_WORKER_CONCURRENCY,
+            help='Number of worker threads (default: JOB_WORKER_CONCURRENCY)'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=settings.JOB_POLL_INTERVAL,
+            help='Seconds to wait when the queue is empty (default: JOB_POLL_INTERVAL)'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit once no due jobs are left instead of polling forever'
+        )
+
+    def handle(self, *args, **options):
+        concurrency = options['concurrency']
+        if concurrency < 1:
+            raise CommandError('--concurrency must be at least 1')
+
+        self.poll_interval = options['poll_interval']
+        self.once = options['once']
+        self.stopping = threading.Event()
+        self.processed = 0
+        self.lock = threading.Lock()
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+
+        requeued = jobs.requeue_stale()
+        if requeued:
+            self.stdout.write(f'Re-queued {requeued} stale job(s)')
+
+        prefix = f'{socket.gethostname()}:{os.getpid()}'
+        self.stdout.write(f'Starting {concurrency} job worker(s) ({prefix})...')
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='job-worker') as pool:
+            for index in range(concurrency):
+                pool.submit(self.work, f'{prefix}:{index}')
+
+        self.stdout.write(self.style.SUCCESS(f'Job workers stopped after {self.processed} job(s)'))
+
+    def stop(self, signum, frame):
+        """Finish the jobs in progress, then exit."""
+        self.stdout.write('Stopping job workers...')
+        self.stopping.set()
+
+    def work(self, worker):
+        """Claim and run jobs one at a time until stopped."""
+        try:
+            while not self.stopping.is_set():
+                close_old_connections()
+                try:
+                    claimed = jobs.claim(worker)
+                except Exception as e:
+                    # e.g. database restarting or migrations not applied yet
+                    self.stderr.write(f'{worker}: could not claim jobs: {e}')
+                    claimed = []
+                    if self.once:
+                        break
+
+                if not claimed:
+                    if self.once:
+                        break
+                    self.stopping.wait(self.poll_interval)
+                    try:
+                        jobs.requeue_stale()
+                    except Exception:
+                        pass
+                    continue
+
+                for job in claimed:
+                    ok = jobs.run(job)
+                    with self.lock:
+                        self.processed += 1
+                    self.stdout.write(
+                        f'{worker}: {job.name} #{job.pk} ' + ('done' if ok else 'failed')
+                    )
+        finally:
+            connection.close()
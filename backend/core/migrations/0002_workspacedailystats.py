@@ -0,0 +1,62 @@
+# Generated by Django 5.0.1 on 2026-10-17 06:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkspaceDailyStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("tasks_completed", models.IntegerField(default=0)),
+                ("tasks_created", models.IntegerField(default=0)),
+                ("has_log", models.BooleanField(default=False)),
+                (
+                    "focus_hours",
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=4, null=True
+                    ),
+                ),
+                ("mood", models.IntegerField(blank=True, null=True)),
+                ("energy", models.IntegerField(blank=True, null=True)),
+                ("todos_done", models.IntegerField(default=0)),
+                (
+                    "workspace",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to="core.workspace",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Workspace Daily Stats",
+                "verbose_name_plural": "Workspace Daily Stats",
+                "db_table": "workspace_daily_stats",
+                "ordering": ["-date"],
+                "indexes": [
+                    models.Index(
+                        fields=["workspace", "date"],
+                        name="workspace_d_workspa_cbb676_idx",
+                    )
+                ],
+                "unique_together": {("workspace", "date")},
+            },
+        ),
+    ]
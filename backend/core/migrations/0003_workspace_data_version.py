@@ -0,0 +1,21 @@
+# Generated by Django 5.0.1 on 2026-10-17 06:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_workspacedailystats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="workspace",
+            name="data_version",
+            field=models.PositiveBigIntegerField(
+                default=0,
+                help_text="Bumped on every write to the workspace's data; keys response caches",
+            ),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.0.1 on 2026-10-17 06:59
+
+from django.db import migrations, models
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_task_counters(apps, schema_editor):
+    """Initialise track and sprint task counters (and track progress) from tasks."""
+    Track = apps.get_model("core", "Track")
+    Sprint = apps.get_model("core", "Sprint")
+    Task = apps.get_model("core", "Task")
+
+    def task_count(parent_field, **conditions):
+        tasks = Task.objects.filter(
+            **{parent_field: OuterRef("pk")}, **conditions
+        ).order_by()
+        return Coalesce(
+            Subquery(
+                tasks.values(parent_field).annotate(total=Count("pk")).values("total")
+            ),
+            0,
+        )
+
+    for model, parent_field in [(Track, "track"), (Sprint, "sprint")]:
+        model.objects.update(
+            total_tasks=task_count(parent_field),
+            done_tasks=task_count(parent_field, status="DONE"),
+        )
+
+    Track.objects.filter(total_tasks__gt=0).update(
+        progress_percentage=F("done_tasks") * 100 / F("total_tasks")
+    )
+    Track.objects.filter(total_tasks=0).update(progress_percentage=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_workspace_data_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sprint",
+            name="done_tasks",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sprint",
+            name="total_tasks",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="track",
+            name="done_tasks",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="track",
+            name="total_tasks",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_task_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations
+
+
+def enqueue_backfill(apps, schema_editor):
+    """
+    Queue one full rebuild of the daily rollup for the worker, replacing
+    the rebuild entrypoint.sh used to run on every container start.
+    """
+    Job = apps.get_model("core", "Job")
+    Job.objects.create(name="rebuild_daily_stats", payload={})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_idempotency_key"),
+    ]
+
+    operations = [
+        migrations.RunPython(enqueue_backfill, migrations.RunPython.noop),
+    ]
@@ -1,9 +1,166 @@
-from django.db import models
+import copy
+
+from django.db import models, transaction
+from django.db.models import Case, Count, F, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django.db.models.lookups import GreaterThan
 from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
 
 
+def percentage_of(done, total):
+    """SQL expression for ``done * 100 / total`` as an integer, 0 when total is 0."""
+    return Case(
+        When(GreaterThan(total, 0), then=done * 100 / total),
+        default=Value(0),
+        output_field=models.IntegerField()
+    )
+
+
+def task_count(parent_field, **conditions):
+    """Correlated subquery counting the tasks of the outer row, optionally filtered."""
+    tasks = Task.objects.filter(**{parent_field: OuterRef('pk')}, **conditions).order_by()
+    return Coalesce(
+        Subquery(tasks.values(parent_field).annotate(total=Count('pk')).values('total')),
+        0
+    )
+
+
+class DirtyFieldsMixin:
+    """
+    Remembers the column values an instance was loaded with so that saves
+    only write the columns that changed, and so signal handlers can diff
+    the previous and new state (``_loaded_values``). JSON values are
+    snapshotted as copies, so in-place changes (``habits.append(...)``)
+    count as changes too.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        json_fields = {
+            field.attname for field in cls._meta.concrete_fields if isinstance(field, models.JSONField)
+        }
+        instance._loaded_values = {
+            name: copy.deepcopy(value) if name in json_fields else value
+            for name, value in zip(field_names, values)
+        }
+        return instance
+
+    def get_dirty_fields(self):
+        """
+        Names (attnames) of the loaded columns whose value changed since the
+        last load or save, or None when the persisted state is unknown.
+        """
+        loaded = getattr(self, '_loaded_values', None)
+        if self._state.adding or loaded is None:
+            return None
+        deferred = self.get_deferred_fields()
+        return [
+            field.attname for field in self._meta.concrete_fields
+            if not field.primary_key
+            and field.attname not in deferred
+            and (field.attname not in loaded or getattr(self, field.attname) != loaded[field.attname])
+        ]
+
+    def remember_loaded_values(self, fields=None):
+        """
+        Record the current column values as the persisted state, for the
+        given field names only or for every loaded column.
+        """
+        if fields is None:
+            deferred = self.get_deferred_fields()
+            concrete = [field for field in self._meta.concrete_fields if field.attname not in deferred]
+            self._loaded_values = {}
+        else:
+            concrete = [self._meta.get_field(name) for name in fields]
+            self._loaded_values = dict(getattr(self, '_loaded_values', None) or {})
+        for field in concrete:
+            value = getattr(self, field.attname)
+            self._loaded_values[field.attname] = (
+                copy.deepcopy(value) if isinstance(field, models.JSONField) else value
+            )
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        """Reloaded columns (including deferred ones loaded on access) are clean again."""
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self.remember_loaded_values(fields)
+
+    def save(self, *args, **kwargs):
+        """
+        Issue ``UPDATE ... SET`` for the changed columns only (plus auto_now
+        timestamps); skip the write entirely when nothing changed.
+        """
+        if kwargs.get('update_fields') is None:
+            dirty = self.get_dirty_fields()
+            if dirty is not None:
+                if not dirty:
+                    return
+                kwargs['update_fields'] = dirty + [
+                    field.attname for field in self._meta.concrete_fields
+                    if getattr(field, 'auto_now', False) and field.attname not in dirty
+                ]
+        super().save(*args, **kwargs)
+        self.remember_loaded_values()
+
+
+class RollupSourceMixin:
+    """
+    Models counted in WorkspaceDailyStats (and, for tasks, in the track and
+    sprint counters). save() and delete() run in one transaction with their
+    signal handlers and first lock the row, so the deltas the handlers
+    derive from the old and new state apply to the committed row, one
+    writer after another, and the workspace lock the rollup update takes
+    is held until the row itself is committed (see core/rollups.py).
+    """
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic(using=kwargs.get('using'), savepoint=False):
+            if not self._state.adding and self.pk is not None:
+                self.lock_persisted_row(kwargs.get('using'))
+            super().save(*args, **kwargs)
+
+    def delete(self, using=None, keep_parents=False):
+        with transaction.atomic(using=using, savepoint=False):
+            if not self.lock_persisted_row(using, keep_changes=False):
+                # Already deleted by someone else: nothing left to count down
+                return 0, {}
+            return super().delete(using=using, keep_parents=keep_parents)
+
+    def lock_persisted_row(self, using=None, keep_changes=True):
+        """
+        Lock this row until the end of the transaction and re-read it. The
+        snapshot (``_loaded_values``) becomes the committed row, and loaded
+        columns this instance has not changed (all of them unless
+        ``keep_changes``) take the committed values, so a concurrent write
+        made since this instance was loaded is neither overwritten nor
+        counted twice. Returns False when the row no longer exists.
+        """
+        fields = self._meta.concrete_fields
+        row = type(self)._base_manager.db_manager(using).select_for_update().filter(
+            pk=self.pk
+        ).values(*[field.attname for field in fields]).first()
+        if row is None:
+            return False
+
+        changed = set(self.get_dirty_fields() or ()) if keep_changes else set()
+        if keep_changes and getattr(self, '_loaded_values', None) is None:
+            # Built by hand: every column is written as it is
+            changed = {field.attname for field in fields}
+        deferred = self.get_deferred_fields()
+        for field in fields:
+            if field.attname not in changed and field.attname not in deferred:
+                setattr(self, field.attname, row[field.attname])
+        self._loaded_values = {
+            field.attname: copy.deepcopy(row[field.attname])
+            if isinstance(field, models.JSONField) else row[field.attname]
+            for field in fields
+        }
+        return True
+
+
 class UserProfile(models.Model):
     """
     Extended user profile with approval status.
@@ -46,6 +203,10 @@ class Workspace(models.Model):
         primary_key=True
     )
     name = models.CharField(max_length=255, default='My Workspace')
+    data_version = models.PositiveBigIntegerField(
+        default=0,
+        help_text="Bumped on every write to the workspace's data; keys response caches"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -57,6 +218,29 @@ class Workspace(models.Model):
     def __str__(self):
         return f"{self.user.username}'s Workspace"
 
+    def save(self, *args, **kwargs):
+        """
+        Never write data_version from a (possibly stale) in-memory instance;
+        it is only changed by atomic updates in bump_version().
+        """
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname != 'data_version'
+            ]
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def bump_version(cls, **filters):
+        """
+        Atomically increment data_version of the matching workspace(s) and
+        mark them as modified now.
+        """
+        cls.objects.filter(**filters).update(
+            data_version=models.F('data_version') + 1,
+            updated_at=timezone.now()
+        )
+
 
 class Category(models.Model):
     """
@@ -84,7 +268,7 @@ class Category(models.Model):
         return self.name
 
 
-class Track(models.Model):
+class Track(DirtyFieldsMixin, models.Model):
     """
     High-level objectives (e.g., "Master AWS", "Learn Django").
     Tracks progress and has a deadline.
@@ -107,6 +291,8 @@ class Track(models.Model):
         default=0,
         validators=[MinValueValidator(0), MaxValueValidator(100)]
     )
+    total_tasks = models.PositiveIntegerField(default=0)
+    done_tasks = models.PositiveIntegerField(default=0)
     deadline = models.DateField(null=True, blank=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -127,18 +313,37 @@ class Track(models.Model):
 
     def update_progress(self):
         """
-        Auto-calculate progress based on completed tasks.
+        Recount this track's task counters from its tasks and re-derive progress.
+        Counters are normally kept in sync incrementally; this repairs any drift.
         """
-        total_tasks = self.tasks.count()
-        if total_tasks == 0:
-            self.progress_percentage = 0
-        else:
-            completed_tasks = self.tasks.filter(status=Task.StatusChoices.DONE).count()
-            self.progress_percentage = int((completed_tasks / total_tasks) * 100)
-        self.save()
-
+        type(self).recount_tasks(pk=self.pk)
+        self.refresh_from_db(fields=['total_tasks', 'done_tasks', 'progress_percentage'])
 
-class Sprint(models.Model):
+    @classmethod
+    def adjust_task_counters(cls, pk, total=0, done=0):
+        """
+        Atomically shift a track's task counters and derive progress from
+        the new values in the same UPDATE.
+        """
+        cls.objects.filter(pk=pk).update(
+            total_tasks=F('total_tasks') + total,
+            done_tasks=F('done_tasks') + done,
+            progress_percentage=percentage_of(F('done_tasks') + done, F('total_tasks') + total)
+        )
+
+    @classmethod
+    def recount_tasks(cls, **filters):
+        """Recompute the task counters and progress of the matching tracks."""
+        total = task_count('track')
+        done = task_count('track', status=Task.StatusChoices.DONE)
+        cls.objects.filter(**filters).update(
+            total_tasks=total,
+            done_tasks=done,
+            progress_percentage=percentage_of(done, total)
+        )
+
+
+class Sprint(DirtyFieldsMixin, models.Model):
     """
     A 2-week period linked to a Track for focused execution.
     """
@@ -152,6 +357,8 @@ class Sprint(models.Model):
     end_date = models.DateField()
     description = models.TextField(blank=True, null=True)
     is_active = models.BooleanField(default=True)
+    total_tasks = models.PositiveIntegerField(default=0)
+    done_tasks = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -179,8 +386,31 @@ class Sprint(models.Model):
         today = timezone.now().date()
         return self.start_date <= today <= self.end_date
 
-
-class Task(models.Model):
+    @property
+    def progress_percentage(self):
+        """Share of the sprint's tasks that are done, from the counters."""
+        if self.total_tasks == 0:
+            return 0
+        return int(self.done_tasks * 100 / self.total_tasks)
+
+    @classmethod
+    def adjust_task_counters(cls, pk, total=0, done=0):
+        """Atomically shift a sprint's task counters."""
+        cls.objects.filter(pk=pk).update(
+            total_tasks=F('total_tasks') + total,
+            done_tasks=F('done_tasks') + done
+        )
+
+    @classmethod
+    def recount_tasks(cls, **filters):
+        """Recompute the task counters of the matching sprints."""
+        cls.objects.filter(**filters).update(
+            total_tasks=task_count('sprint'),
+            done_tasks=task_count('sprint', status=Task.StatusChoices.DONE)
+        )
+
+
+class Task(RollupSourceMixin, DirtyFieldsMixin, models.Model):
     """
     Actionable items linked to a Track or Sprint.
     Core execution unit in the system.
@@ -261,21 +491,30 @@ class Task(models.Model):
     def __str__(self):
         return f"{self.title} ({self.get_status_display()})"
 
-    def save(self, *args, **kwargs):
-        """Auto-set completed_at when status changes to DONE."""
+    def sync_completed_at(self, now=None):
+        """Set completed_at for DONE tasks (keeping an earlier value), clear it otherwise."""
         if self.status == self.StatusChoices.DONE and not self.completed_at:
-            self.completed_at = timezone.now()
+            self.completed_at = now or timezone.now()
         elif self.status != self.StatusChoices.DONE:
             self.completed_at = None
 
-        super().save(*args, **kwargs)
+    def save(self, *args, **kwargs):
+        """
+        Auto-set completed_at when status changes to DONE.
+        Track and sprint counters are adjusted by the post_save signal.
+        """
+        dirty = self.get_dirty_fields()
+        if dirty is None or 'status' in dirty:
+            self.sync_completed_at()
 
-        # Update track progress if linked to a track
-        if self.track:
-            self.track.update_progress()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'status' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'completed_at'}
+
+        super().save(*args, **kwargs)
 
 
-class DailyLog(models.Model):
+class DailyLog(RollupSourceMixin, DirtyFieldsMixin, models.Model):
     """
     Date-based journal entry for tracking daily progress, mood, and habits.
     """
@@ -326,7 +565,7 @@ class DailyLog(models.Model):
         return f"Log for {self.date} (Mood: {self.mood_score or 'N/A'})"
 
 
-class DailyTodo(models.Model):
+class DailyTodo(RollupSourceMixin, DirtyFieldsMixin, models.Model):
     """
     Daily todo items - simple tasks for the day.
     """
@@ -355,3 +594,115 @@ class DailyTodo(models.Model):
     def __str__(self):
         status = "✓" if self.is_completed else "○"
         return f"{status} {self.title} ({self.date})"
+
+
+class WorkspaceDailyStats(models.Model):
+    """
+    Per-workspace daily rollup of task, log and todo activity.
+    Maintained incrementally on every Task, DailyLog and DailyTodo write
+    so dashboards read one small row per day instead of scanning history.
+    """
+    workspace = models.ForeignKey(
+        Workspace,
+        on_delete=models.CASCADE,
+        related_name='daily_stats'
+    )
+    date = models.DateField()
+    tasks_completed = models.IntegerField(default=0)
+    tasks_created = models.IntegerField(default=0)
+    has_log = models.BooleanField(default=False)
+    focus_hours = models.DecimalField(
+        max_digits=4,
+        decimal_places=2,
+        null=True,
+        blank=True
+    )
+    mood = models.IntegerField(null=True, blank=True)
+    energy = models.IntegerField(null=True, blank=True)
+    todos_done = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'workspace_daily_stats'
+        verbose_name = 'Workspace Daily Stats'
+        verbose_name_plural = 'Workspace Daily Stats'
+        ordering = ['-date']
+        unique_together = ['workspace', 'date']
+        indexes = [
+            models.Index(fields=['workspace', 'date']),
+        ]
+
+    def __str__(self):
+        return f"Stats for {self.date} ({self.tasks_completed} completed)"
+
+
+class Job(models.Model):
+    """
+    A unit of background work in the database-backed job queue.
+    Claimed by ``manage.py run_jobs`` workers with SELECT ... FOR UPDATE SKIP LOCKED.
+    """
+
+    class StatusChoices(models.TextChoices):
+        QUEUED = 'QUEUED', 'Queued'
+        RUNNING = 'RUNNING', 'Running'
+        DONE = 'DONE', 'Done'
+        FAILED = 'FAILED', 'Failed'
+
+    name = models.CharField(max_length=100, help_text="Registered handler name")
+    payload = models.JSONField(default=dict, blank=True, help_text="Keyword arguments for the handler")
+    status = models.CharField(
+        max_length=20,
+        choices=StatusChoices.choices,
+        default=StatusChoices.QUEUED
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_at = models.DateTimeField(default=timezone.now, help_text="Not picked up before this time")
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=255, blank=True)
+    last_error = models.TextField(blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'jobs'
+        verbose_name = 'Job'
+        verbose_name_plural = 'Jobs'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'run_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.get_status_display()})"
+
+
+class IdempotencyKey(models.Model):
+    """
+    A client-supplied ``Idempotency-Key`` and the response it produced.
+    While ``response_status`` is empty the original request is still in flight.
+    """
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='idempotency_keys'
+    )
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64, help_text="Hash of method, path and body")
+    response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'idempotency_keys'
+        verbose_name = 'Idempotency Key'
+        verbose_name_plural = 'Idempotency Keys'
+        ordering = ['-created_at']
+        unique_together = ['user', 'key']
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.key} ({self.user.username})"
@@ -0,0 +1,128 @@
+"""
+Runtime N+1 query detection for FocusFlow.
+
+``NPlusOneMiddleware`` watches the SQL each request runs on the default
+connection and flags any statement shape (the SQL with its parameters and
+literals stripped) that repeats ``NPLUSONE_THRESHOLD`` times or more, e.g.
+``SELECT ... FROM tracks WHERE id = %s`` run once per serialized task. The
+application stack of the call that crossed the threshold is reported, so
+the lazy load can be traced to the serializer field or loop behind it.
+
+Set ``NPLUSONE_DETECTOR`` to ``log`` (warn after the response is built) or
+``raise`` (fail the offending query with NPlusOneError); it is off unless
+configured, and defaults to ``log`` when DEBUG is on.
+"""
+import logging
+import re
+import traceback
+from collections import Counter
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+
+logger = logging.getLogger(__name__)
+
+DETECTOR_MODES = ('log', 'raise')
+
+
+class NPlusOneError(Exception):
+    """A statement shape repeated more often than NPLUSONE_THRESHOLD in one request."""
+
+
+def fingerprint(sql):
+    """SQL with literals replaced, so repetitions of one statement compare equal."""
+    sql = re.sub(r"'(?:[^']|'')*'", '?', sql)
+    sql = re.sub(r'\b\d+(?:\.\d+)?\b', '?', sql)
+    sql = sql.replace('%s', '?')
+    return re.sub(r'\(\?(?:, \?)*\)', '(...)', sql)
+
+
+def chunked_batch(sql):
+    """
+    Statements the deletion collector issues per chunk of 100 primary keys
+    (deleting or unlinking cascaded rows): they repeat with the size of the
+    cascade, but one statement covers many rows.
+    """
+    return sql.startswith(('DELETE FROM', 'UPDATE')) and '"id" IN (' in sql
+
+
+def caller_stack():
+    """Formatted stack frames from the project's own code, innermost last."""
+    base_dir = str(settings.BASE_DIR)
+    stack = traceback.extract_stack()[:-1]
+    frames = [
+        frame for frame in stack
+        if frame.filename.startswith(base_dir)
+        and 'site-packages' not in frame.filename
+        and frame.filename != __file__
+    ]
+    if not frames:
+        # No project code involved (e.g. a generic view): show the nearest
+        # frames above the ORM instead
+        frames = [frame for frame in stack if '/django/db/' not in frame.filename][-10:]
+    return ''.join(traceback.format_list(frames))
+
+
+class RepeatedQueryCounter:
+    """
+    ``connection.execute_wrapper`` counting statement shapes; remembers the
+    stack of the query that first reaches ``threshold``.
+    """
+
+    def __init__(self, threshold, raise_on_repeat=False):
+        self.threshold = threshold
+        self.raise_on_repeat = raise_on_repeat
+        self.counts = Counter()
+        self.examples = {}
+        self.stacks = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        if chunked_batch(sql):
+            return execute(sql, params, many, context)
+        shape = fingerprint(sql)
+        self.counts[shape] += 1
+        if self.counts[shape] == self.threshold:
+            self.examples[shape] = sql
+            self.stacks[shape] = caller_stack()
+            if self.raise_on_repeat:
+                raise NPlusOneError(
+                    f'Query repeated {self.threshold} times in one request: {sql}\n'
+                    f'{self.stacks[shape]}'
+                )
+        return execute(sql, params, many, context)
+
+    def repeated(self):
+        """(count, sql, stack) for every shape that reached the threshold."""
+        return [
+            (self.counts[shape], self.examples[shape], self.stacks[shape])
+            for shape in self.examples
+        ]
+
+
+class NPlusOneMiddleware:
+    """
+    Development/staging middleware flagging repeated query shapes per request.
+    Not loaded unless NPLUSONE_DETECTOR is ``log`` or ``raise``.
+    """
+
+    def __init__(self, get_response):
+        mode = settings.NPLUSONE_DETECTOR
+        if mode not in DETECTOR_MODES:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.raise_on_repeat = mode == 'raise'
+        self.threshold = settings.NPLUSONE_THRESHOLD
+
+    def __call__(self, request):
+        counter = RepeatedQueryCounter(self.threshold, self.raise_on_repeat)
+        with connection.execute_wrapper(counter):
+            response = self.get_response(request)
+
+        for count, sql, stack in counter.repeated():
+            logger.warning(
+                'Possible N+1: query ran %s times during %s %s: %s\n%s',
+                count, request.method, request.path, sql, stack
+            )
+        return response
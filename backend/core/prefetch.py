@@ -0,0 +1,44 @@
+"""
+Top-N prefetching for FocusFlow.
+
+``prefetch_related`` loads every child of every parent. A Prefetch whose
+queryset is sliced keeps the first ``limit`` children of each parent
+(Django numbers them with ``ROW_NUMBER() OVER (PARTITION BY <parent>)``),
+so "the 10 latest tasks of each track" is one query however many tracks
+are listed.
+"""
+from django.db.models import F, Prefetch
+
+from .models import Sprint, Task
+
+
+TRACK_RECENT_TASKS = 10
+TRACK_RECENT_SPRINTS = 5
+
+
+def order_expressions(ordering):
+    """Turn ``['-created_at', 'name']`` style ordering into F() expressions."""
+    return [F(name[1:]).desc() if name.startswith('-') else F(name).asc() for name in ordering]
+
+
+def with_recent_children(queryset):
+    """
+    Prefetch the latest tasks and sprints of every track in a Track queryset
+    for TrackDetailSerializer: two queries in total, whatever the number of
+    tracks. Tasks come with their sprint joined; the parent track is set on
+    each child by the prefetch itself. Children keep their default ordering,
+    with the pk breaking ties so the cut-off is stable.
+    """
+    return queryset.prefetch_related(
+        Prefetch(
+            'tasks',
+            queryset=Task.objects.select_related('sprint')
+            .order_by(*Task._meta.ordering, 'pk')[:TRACK_RECENT_TASKS],
+            to_attr='recent_tasks'
+        ),
+        Prefetch(
+            'sprints',
+            queryset=Sprint.objects.order_by(*Sprint._meta.ordering, 'pk')[:TRACK_RECENT_SPRINTS],
+            to_attr='recent_sprints'
+        ),
+    )
@@ -0,0 +1,260 @@
+"""
+Incremental maintenance of the per-workspace daily rollup table.
+
+Every Task, DailyLog and DailyTodo write adjusts the affected
+WorkspaceDailyStats rows in place; ``rebuild`` recomputes them from the
+source tables for backfills or to repair drift.
+
+Both lock the workspace row (``lock_workspaces``) before touching its
+rollup rows and keep it until their transaction commits. The source write
+and its increments commit together (those models save atomically), so an
+increment is either already reflected in the rows a rebuild reads, or
+waits for the rebuild and is applied on top of the rewritten rows.
+"""
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Workspace, Task, DailyLog, DailyTodo, WorkspaceDailyStats
+
+
+def local_date(value):
+    """Calendar date of a datetime in the current timezone (None-safe)."""
+    if value is None:
+        return None
+    return timezone.localdate(value)
+
+
+def loaded_value(instance, attname):
+    """Value of a column as last loaded from the database, or None."""
+    return getattr(instance, '_loaded_values', {}).get(attname)
+
+
+def load_previous_values(instance):
+    """
+    Fetch the persisted column values missing from an instance's snapshot:
+    all of them for instances built by hand with an explicit pk, the
+    deferred ones for instances loaded with only()/defer().
+    """
+    if instance._state.adding:
+        return
+    loaded = getattr(instance, '_loaded_values', {})
+    missing = [
+        field.attname for field in instance._meta.concrete_fields
+        if field.attname not in loaded
+    ]
+    if missing:
+        loaded.update(
+            type(instance).objects.filter(pk=instance.pk).values(*missing).first() or {}
+        )
+    instance._loaded_values = loaded
+
+
+def lock_workspaces(workspace_id=None):
+    """
+    Lock one workspace row (all of them if ``workspace_id`` is None) until
+    the end of the current transaction.
+    """
+    workspaces = Workspace.objects.select_for_update().order_by('pk')
+    if workspace_id is not None:
+        workspaces = workspaces.filter(pk=workspace_id)
+    list(workspaces.values_list('pk', flat=True))
+
+
+def update_day(workspace_id, date, **values):
+    """Apply column updates to one rollup row, creating the row if needed."""
+    if date is None:
+        return
+    rows = WorkspaceDailyStats.objects.filter(workspace_id=workspace_id, date=date)
+    if not rows.update(**values):
+        WorkspaceDailyStats.objects.get_or_create(workspace_id=workspace_id, date=date)
+        rows.update(**values)
+
+
+def increment(workspace_id, date, field, delta):
+    """Atomically add ``delta`` to a counter column of one rollup row."""
+    if delta:
+        update_day(workspace_id, date, **{field: F(field) + delta})
+
+
+def task_saved(task, created):
+    """Adjust created/completed counters after a task insert or update."""
+    old_completed = local_date(loaded_value(task, 'completed_at'))
+    new_completed = local_date(task.completed_at)
+    if created or old_completed != new_completed:
+        lock_workspaces(task.workspace_id)
+
+    if created:
+        increment(task.workspace_id, local_date(task.created_at), 'tasks_created', 1)
+    if old_completed != new_completed:
+        increment(task.workspace_id, old_completed, 'tasks_completed', -1)
+        increment(task.workspace_id, new_completed, 'tasks_completed', 1)
+
+
+def tasks_completion_changed(workspace_id, changes):
+    """
+    Adjust completed counters for tasks updated in bulk, given
+    ``(old_completed_at, new_completed_at)`` pairs; one update per day.
+    """
+    deltas = Counter()
+    for old, new in changes:
+        old_completed, new_completed = local_date(old), local_date(new)
+        if old_completed != new_completed:
+            if old_completed:
+                deltas[old_completed] -= 1
+            if new_completed:
+                deltas[new_completed] += 1
+    if any(deltas.values()):
+        lock_workspaces(workspace_id)
+    for date, delta in deltas.items():
+        increment(workspace_id, date, 'tasks_completed', delta)
+
+
+def tasks_created(workspace_id, tasks):
+    """Count tasks inserted in bulk; one update per affected day and counter."""
+    if tasks:
+        lock_workspaces(workspace_id)
+    for date_field, counter in [('created_at', 'tasks_created'), ('completed_at', 'tasks_completed')]:
+        days = Counter(local_date(getattr(task, date_field)) for task in tasks)
+        days.pop(None, None)
+        for date, total in days.items():
+            increment(workspace_id, date, counter, total)
+
+
+def tasks_deleted(workspace_id, tasks):
+    """Remove tasks deleted together (e.g. with their track); one update per day."""
+    if not tasks:
+        return
+    lock_workspaces(workspace_id)
+    for date_field, counter in [('created_at', 'tasks_created'), ('completed_at', 'tasks_completed')]:
+        days = Counter(local_date(getattr(task, date_field)) for task in tasks)
+        days.pop(None, None)
+        for date, total in days.items():
+            increment(workspace_id, date, counter, -total)
+
+
+def task_deleted(task):
+    """Remove a deleted task from the counters of its days."""
+    lock_workspaces(task.workspace_id)
+    increment(task.workspace_id, local_date(task.created_at), 'tasks_created', -1)
+    increment(task.workspace_id, local_date(task.completed_at), 'tasks_completed', -1)
+
+
+def log_saved(log):
+    """Copy a daily log's mood, energy and focus onto its day's row."""
+    lock_workspaces(log.workspace_id)
+    old_date = loaded_value(log, 'date')
+    if old_date and old_date != log.date:
+        log_deleted(log, date=old_date)
+
+    update_day(
+        log.workspace_id,
+        log.date,
+        has_log=True,
+        mood=log.mood_score,
+        energy=log.energy_level,
+        focus_hours=log.focus_hours,
+    )
+
+
+def log_deleted(log, date=None):
+    """Clear the log columns of the row for a removed daily log."""
+    lock_workspaces(log.workspace_id)
+    update_day(
+        log.workspace_id,
+        date or log.date,
+        has_log=False,
+        mood=None,
+        energy=None,
+        focus_hours=None,
+    )
+
+
+def todo_saved(todo):
+    """Adjust the done-todo counter after a todo insert or update."""
+    was_done = bool(loaded_value(todo, 'is_completed'))
+    old_date = loaded_value(todo, 'date')
+    if was_done or todo.is_completed:
+        lock_workspaces(todo.workspace_id)
+    if was_done and (not todo.is_completed or old_date != todo.date):
+        increment(todo.workspace_id, old_date, 'todos_done', -1)
+    if todo.is_completed and (not was_done or old_date != todo.date):
+        increment(todo.workspace_id, todo.date, 'todos_done', 1)
+
+
+def todo_deleted(todo):
+    """Remove a deleted todo from its day's done counter."""
+    if todo.is_completed:
+        lock_workspaces(todo.workspace_id)
+        increment(todo.workspace_id, todo.date, 'todos_done', -1)
+
+
+def rebuild(workspace_id=None, since=None):
+    """
+    Recompute rollup rows from the source tables.
+
+    Restrict to one workspace and/or to dates on or after ``since``.
+    Runs in one transaction holding the workspace lock(s), so it is safe
+    to run against live traffic, and bumps the rebuilt workspaces' version
+    so cached responses and ETags built from the old rows are dropped.
+    Returns the number of rows written.
+    """
+    def scoped(queryset, date_field):
+        if workspace_id is not None:
+            queryset = queryset.filter(workspace_id=workspace_id)
+        if since is not None:
+            queryset = queryset.filter(**{f'{date_field}__gte': since})
+        return queryset.order_by()
+
+    rows = {}
+
+    def row(ws_id, date):
+        key = (ws_id, date)
+        if key not in rows:
+            rows[key] = WorkspaceDailyStats(workspace_id=ws_id, date=date)
+        return rows[key]
+
+    with transaction.atomic():
+        # Incremental updates of these workspaces wait until the new rows
+        # are committed; writes already holding the lock finish first
+        lock_workspaces(workspace_id)
+
+        for date_field, counter in [('completed_at', 'tasks_completed'), ('created_at', 'tasks_created')]:
+            grouped = scoped(
+                Task.objects.filter(**{f'{date_field}__isnull': False}), f'{date_field}__date'
+            ).annotate(
+                day=TruncDate(date_field)
+            ).values('workspace_id', 'day').annotate(total=Count('pk'))
+            for entry in grouped:
+                setattr(row(entry['workspace_id'], entry['day']), counter, entry['total'])
+
+        logs = scoped(DailyLog.objects.all(), 'date').values_list(
+            'workspace_id', 'date', 'mood_score', 'energy_level', 'focus_hours'
+        )
+        for ws_id, date, mood, energy, focus in logs:
+            stats = row(ws_id, date)
+            stats.has_log = True
+            stats.mood = mood
+            stats.energy = energy
+            stats.focus_hours = focus
+
+        todos = scoped(DailyTodo.objects.filter(is_completed=True), 'date').values(
+            'workspace_id', 'date'
+        ).annotate(total=Count('pk'))
+        for entry in todos:
+            row(entry['workspace_id'], entry['date']).todos_done = entry['total']
+
+        existing = WorkspaceDailyStats.objects.all()
+        if workspace_id is not None:
+            existing = existing.filter(workspace_id=workspace_id)
+        if since is not None:
+            existing = existing.filter(date__gte=since)
+
+        existing.delete()
+        WorkspaceDailyStats.objects.bulk_create(rows.values(), batch_size=1000)
+        Workspace.bump_version(**({'pk': workspace_id} if workspace_id is not None else {}))
+
+    return len(rows)
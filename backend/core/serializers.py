@@ -4,7 +4,114 @@ Production-grade serializers with validation and nested relationships.
 """
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Sum
 from .models import Workspace, Track, Sprint, Task, DailyLog, Category, DailyTodo
+from .prefetch import TRACK_RECENT_TASKS, TRACK_RECENT_SPRINTS
+
+
+# Lookup restricting each related model to the requesting workspace
+WORKSPACE_LOOKUPS = {
+    Category: 'workspace_id',
+    Track: 'workspace_id',
+    Sprint: 'track__workspace_id',
+}
+
+# Parent loaded with select_related() along with each related model, so a
+# referenced parent that is also the parent of a referenced child (the
+# track of a task's sprint) needs no query of its own
+PARENT_RELATIONS = {
+    Sprint: 'track',
+}
+
+
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Primary key field that resolves ids from objects prefetched into the
+    serializer context (``context['prefetched'][Model]``, a pk -> object
+    dict) instead of querying once per item. Its queryset is restricted to
+    the requesting user's workspace, so ids of other workspaces' objects
+    are rejected as not found.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        request = self.context.get('request')
+        if request is None or not request.user.is_authenticated:
+            return queryset
+        return queryset.filter(**{WORKSPACE_LOOKUPS[queryset.model]: request.workspace.pk})
+
+    def to_internal_value(self, data):
+        prefetched = self.context.get('prefetched', {}).get(self.queryset.model)
+        if prefetched is None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = self.queryset.model._meta.pk.to_python(data)
+        except DjangoValidationError:
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        if pk not in prefetched:
+            self.fail('does_not_exist', pk_value=data)
+        return prefetched[pk]
+
+
+def load_referenced_objects(serializer_class, items, workspace):
+    """
+    Fetch the objects referenced by the PrefetchedPrimaryKeyRelatedFields of
+    ``serializer_class`` across all ``items``, scoped to ``workspace``: at
+    most one query per related model, and none for parents already loaded
+    through PARENT_RELATIONS. Returns the ``context['prefetched']`` mapping.
+    """
+    requested = {}
+    for name, field in serializer_class().fields.items():
+        if field.read_only or not isinstance(field, PrefetchedPrimaryKeyRelatedField):
+            continue
+        model = field.queryset.model
+        pks = requested.setdefault(model, set())
+        for item in items:
+            if not isinstance(item, dict) or item.get(name) in (None, ''):
+                continue
+            try:
+                pks.add(model._meta.pk.to_python(item[name]))
+            except (DjangoValidationError, TypeError):
+                continue
+
+    prefetched = {model: {} for model in requested}
+    # Children first, so their parents can be taken from the join
+    for model in sorted(requested, key=lambda model: model not in PARENT_RELATIONS):
+        pks = requested[model] - prefetched[model].keys()
+        if not pks:
+            continue
+        queryset = model.objects.filter(**{WORKSPACE_LOOKUPS[model]: workspace.pk, 'pk__in': pks})
+        parent = PARENT_RELATIONS.get(model)
+        if parent is not None:
+            queryset = queryset.select_related(parent)
+        prefetched[model].update(queryset.in_bulk())
+        if parent is not None:
+            parent_model = model._meta.get_field(parent).related_model
+            for obj in prefetched[model].values():
+                parent_obj = getattr(obj, parent)
+                if parent_obj.pk in requested.get(parent_model, ()):
+                    prefetched[parent_model][parent_obj.pk] = parent_obj
+    return prefetched
+
+
+class ScopedRelationsMixin:
+    """
+    ModelSerializer mixin resolving every PrefetchedPrimaryKeyRelatedField of
+    a single item with load_referenced_objects() before field validation:
+    ownership of the track, the sprint and the sprint's track is settled by
+    one workspace-scoped query. Bulk creates prefetch for the whole list.
+    """
+
+    def to_internal_value(self, data):
+        request = self.context.get('request')
+        if 'prefetched' not in self.context and request is not None and isinstance(data, dict):
+            self.context['prefetched'] = load_referenced_objects(
+                type(self), [data], request.workspace
+            )
+        return super().to_internal_value(data)
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -54,30 +161,49 @@ class WorkspaceSerializer(serializers.ModelSerializer):
         read_only_fields = ['user', 'created_at', 'updated_at']
 
 
-class TrackSerializer(serializers.ModelSerializer):
+class TrackSerializer(ScopedRelationsMixin, serializers.ModelSerializer):
     """Serializer for Track model with auto-calculated fields."""
     workspace = serializers.PrimaryKeyRelatedField(read_only=True)
+    category = PrefetchedPrimaryKeyRelatedField(
+        queryset=Category.objects.all(),
+        required=False,
+        allow_null=True
+    )
     category_name = serializers.CharField(source='category.name', read_only=True)
     task_count = serializers.SerializerMethodField()
+    done_task_count = serializers.SerializerMethodField()
     sprint_count = serializers.SerializerMethodField()
+    estimated_hours = serializers.SerializerMethodField()
 
     class Meta:
         model = Track
         fields = [
             'id', 'workspace', 'title', 'description', 'category', 'category_name',
-            'progress_percentage', 'deadline', 'is_active', 'task_count', 'sprint_count',
-            'created_at', 'updated_at'
+            'progress_percentage', 'deadline', 'is_active', 'task_count', 'done_task_count',
+            'sprint_count', 'estimated_hours', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'workspace', 'progress_percentage', 'created_at', 'updated_at']
 
     def get_task_count(self, obj):
         """Return total number of tasks for this track."""
-        return obj.tasks.count()
+        return obj.total_tasks
+
+    def get_done_task_count(self, obj):
+        """Return number of completed tasks for this track."""
+        return obj.done_tasks
 
     def get_sprint_count(self, obj):
-        """Return total number of sprints for this track."""
+        """Return total number of sprints (annotated by with_track_counts when listed)."""
+        if hasattr(obj, 'sprint_count'):
+            return obj.sprint_count
         return obj.sprints.count()
 
+    def get_estimated_hours(self, obj):
+        """Return the summed estimated hours of this track's tasks."""
+        if hasattr(obj, 'estimated_hours'):
+            return obj.estimated_hours or 0
+        return obj.tasks.aggregate(total=Sum('estimated_hours'))['total'] or 0
+
     def validate_deadline(self, value):
         """Ensure deadline is not in the past."""
         from django.utils import timezone
@@ -95,13 +221,19 @@ class TrackDetailSerializer(TrackSerializer):
         fields = TrackSerializer.Meta.fields + ['tasks', 'sprints']
 
     def get_tasks(self, obj):
-        """Return recent tasks for this track."""
-        tasks = obj.tasks.all()[:10]  # Limit to prevent large payloads
+        """Return recent tasks (prefetched by with_recent_children when available)."""
+        if hasattr(obj, 'recent_tasks'):
+            tasks = obj.recent_tasks
+        else:
+            tasks = obj.tasks.select_related('sprint')[:TRACK_RECENT_TASKS]  # Limit to prevent large payloads
         return TaskSerializer(tasks, many=True).data
 
     def get_sprints(self, obj):
-        """Return recent sprints for this track."""
-        sprints = obj.sprints.all()[:5]  # Limit to prevent large payloads
+        """Return recent sprints (prefetched by with_recent_children when available)."""
+        if hasattr(obj, 'recent_sprints'):
+            sprints = obj.recent_sprints
+        else:
+            sprints = obj.sprints.all()[:TRACK_RECENT_SPRINTS]  # Limit to prevent large payloads
         return SprintSerializer(sprints, many=True).data
 
 
@@ -116,7 +248,9 @@ class CategorySerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'workspace', 'created_at']
 
     def get_track_count(self, obj):
-        """Return total number of tracks for this category."""
+        """Return total number of tracks for this category (annotated when grouped)."""
+        if hasattr(obj, 'track_count'):
+            return obj.track_count
         return obj.tracks.count()
 
     def get_sprints(self, obj):
@@ -125,9 +259,9 @@ class CategorySerializer(serializers.ModelSerializer):
         return SprintSerializer(sprints, many=True).data
 
 
-class SprintSerializer(serializers.ModelSerializer):
+class SprintSerializer(ScopedRelationsMixin, serializers.ModelSerializer):
     """Serializer for Sprint model with validation."""
-    track = serializers.PrimaryKeyRelatedField(queryset=Track.objects.all())
+    track = PrefetchedPrimaryKeyRelatedField(queryset=Track.objects.all())
     track_title = serializers.CharField(source='track.title', read_only=True)
     duration_days = serializers.ReadOnlyField()
     is_current = serializers.ReadOnlyField()
@@ -144,7 +278,7 @@ class SprintSerializer(serializers.ModelSerializer):
 
     def get_task_count(self, obj):
         """Return total number of tasks in this sprint."""
-        return obj.tasks.count()
+        return obj.total_tasks
 
     def validate(self, attrs):
         """Ensure end_date is after start_date."""
@@ -155,24 +289,16 @@ class SprintSerializer(serializers.ModelSerializer):
                 })
         return attrs
 
-    def validate_track(self, value):
-        """Ensure track belongs to user's workspace."""
-        request = self.context.get('request')
-        if request and hasattr(request.user, 'workspace'):
-            if value.workspace != request.user.workspace:
-                raise serializers.ValidationError("Track does not belong to your workspace.")
-        return value
-
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(ScopedRelationsMixin, serializers.ModelSerializer):
     """Serializer for Task model with validation and display fields."""
     workspace = serializers.PrimaryKeyRelatedField(read_only=True)
-    track = serializers.PrimaryKeyRelatedField(
+    track = PrefetchedPrimaryKeyRelatedField(
         queryset=Track.objects.all(),
         required=False,
         allow_null=True
     )
-    sprint = serializers.PrimaryKeyRelatedField(
+    sprint = PrefetchedPrimaryKeyRelatedField(
         queryset=Sprint.objects.all(),
         required=False,
         allow_null=True
@@ -193,25 +319,20 @@ class TaskSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'workspace', 'completed_at', 'created_at', 'updated_at']
 
-    def validate_track(self, value):
-        """Ensure track belongs to user's workspace."""
-        if value:
-            request = self.context.get('request')
-            if request and hasattr(request.user, 'workspace'):
-                if value.workspace != request.user.workspace:
-                    raise serializers.ValidationError("Track does not belong to your workspace.")
-        return value
-
-    def validate_sprint(self, value):
-        """Ensure sprint belongs to the same track."""
-        if value:
-            track = self.initial_data.get('track') or (self.instance.track if self.instance else None)
-            if track and value.track.id != (track.id if hasattr(track, 'id') else track):
-                raise serializers.ValidationError("Sprint must belong to the selected track.")
-        return value
-
     def validate(self, attrs):
         """Additional validation for task fields."""
+        # Ensure sprint belongs to the same track
+        sprint = attrs.get('sprint')
+        if sprint:
+            if 'track' in attrs:
+                track_id = attrs['track'].pk if attrs['track'] else None
+            else:
+                track_id = self.instance.track_id if self.instance else None
+            if track_id and sprint.track_id != track_id:
+                raise serializers.ValidationError({
+                    "sprint": "Sprint must belong to the selected track."
+                })
+
         # Validate due_date
         if attrs.get('due_date'):
             from django.utils import timezone
@@ -230,6 +351,22 @@ class TaskSerializer(serializers.ModelSerializer):
         return attrs
 
 
+class TaskBulkUpdateSerializer(serializers.Serializer):
+    """One item of a bulk task update: the task id and the fields to change."""
+    id = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=Task.StatusChoices.choices, required=False)
+    priority = serializers.ChoiceField(choices=Task.PriorityChoices.choices, required=False)
+    sprint = serializers.IntegerField(required=False, allow_null=True)
+    due_date = serializers.DateField(required=False, allow_null=True)
+
+    def validate_due_date(self, value):
+        """Reject due dates in the past, like TaskSerializer."""
+        from django.utils import timezone
+        if value and value < timezone.now().date():
+            raise serializers.ValidationError("Due date cannot be in the past.")
+        return value
+
+
 class DailyLogSerializer(serializers.ModelSerializer):
     """Serializer for DailyLog model with validation."""
     workspace = serializers.PrimaryKeyRelatedField(read_only=True)
@@ -253,13 +390,13 @@ class DailyLogSerializer(serializers.ModelSerializer):
     def validate(self, attrs):
         """Ensure unique daily log per workspace per date."""
         request = self.context.get('request')
-        if request and hasattr(request.user, 'workspace'):
-            workspace = request.user.workspace
+        if request and request.user.is_authenticated:
+            workspace = request.workspace
             date = attrs.get('date')
 
             # Check for existing log (exclude current instance if updating)
             existing_log = DailyLog.objects.filter(
-                workspace=workspace,
+                workspace_id=workspace.pk,
                 date=date
             )
             if self.instance:
@@ -292,6 +429,131 @@ class DashboardStatsSerializer(serializers.Serializer):
     overdue_tasks = serializers.IntegerField()
 
 
+def duplicate_names(nodes, key):
+    """Values of ``key`` that occur more than once among ``nodes``."""
+    seen, duplicates = set(), []
+    for node in nodes:
+        if node[key] in seen and node[key] not in duplicates:
+            duplicates.append(node[key])
+        seen.add(node[key])
+    return duplicates
+
+
+class PlanTaskSerializer(serializers.Serializer):
+    """A task in an imported plan, matched by title within its sprint."""
+    title = serializers.CharField(max_length=255)
+    description = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    status = serializers.ChoiceField(choices=Task.StatusChoices.choices, required=False)
+    priority = serializers.ChoiceField(choices=Task.PriorityChoices.choices, required=False)
+    estimated_hours = serializers.DecimalField(
+        max_digits=5, decimal_places=2, min_value=0, required=False, allow_null=True
+    )
+    actual_hours = serializers.DecimalField(
+        max_digits=5, decimal_places=2, min_value=0, required=False, allow_null=True
+    )
+    due_date = serializers.DateField(required=False, allow_null=True)
+
+    validate_due_date = TaskBulkUpdateSerializer.validate_due_date
+
+
+def validate_unique_task_titles(tasks):
+    """Task titles must be unique within one sprint (or track) of a plan."""
+    duplicates = duplicate_names(tasks, 'title')
+    if duplicates:
+        raise serializers.ValidationError(f"Duplicate task title(s): {', '.join(duplicates)}.")
+    return tasks
+
+
+class PlanSprintSerializer(serializers.Serializer):
+    """A sprint in an imported plan, matched by name within its track."""
+    name = serializers.CharField(max_length=255)
+    start_date = serializers.DateField()
+    end_date = serializers.DateField()
+    description = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    is_active = serializers.BooleanField(required=False)
+    tasks = PlanTaskSerializer(many=True, required=False, default=list)
+
+    def validate_tasks(self, value):
+        return validate_unique_task_titles(value)
+
+    def validate(self, attrs):
+        """Ensure end_date is after start_date."""
+        if attrs['end_date'] < attrs['start_date']:
+            raise serializers.ValidationError({
+                "end_date": "End date must be after start date."
+            })
+        return attrs
+
+
+class PlanTrackSerializer(serializers.Serializer):
+    """A track in an imported plan, matched by title within the workspace."""
+    title = serializers.CharField(max_length=255)
+    description = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    deadline = serializers.DateField(required=False, allow_null=True)
+    is_active = serializers.BooleanField(required=False)
+    sprints = PlanSprintSerializer(many=True, required=False, default=list)
+    tasks = PlanTaskSerializer(many=True, required=False, default=list)
+
+    validate_deadline = TrackSerializer.validate_deadline
+
+    def validate_sprints(self, value):
+        """Sprint names must be unique within a track."""
+        duplicates = duplicate_names(value, 'name')
+        if duplicates:
+            raise serializers.ValidationError(f"Duplicate sprint name(s): {', '.join(duplicates)}.")
+        return value
+
+    def validate_tasks(self, value):
+        return validate_unique_task_titles(value)
+
+
+class PlanCategorySerializer(serializers.Serializer):
+    """A category in an imported plan, matched by name."""
+    name = serializers.CharField(max_length=100)
+    description = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    tracks = PlanTrackSerializer(many=True, required=False, default=list)
+
+
+class PlanImportSerializer(serializers.Serializer):
+    """
+    A whole plan: categories -> tracks -> sprints -> tasks.
+    Tasks may also sit directly under a track, outside any sprint.
+    """
+    categories = PlanCategorySerializer(many=True, allow_empty=False)
+
+    def validate_categories(self, value):
+        """Names must be unambiguous, and category names are globally unique."""
+        duplicates = duplicate_names(value, 'name')
+        if duplicates:
+            raise serializers.ValidationError(f"Duplicate category name(s): {', '.join(duplicates)}.")
+
+        tracks = [track for category in value for track in category['tracks']]
+        duplicates = duplicate_names(tracks, 'title')
+        if duplicates:
+            raise serializers.ValidationError(f"Duplicate track title(s): {', '.join(duplicates)}.")
+
+        from django.conf import settings
+        task_count = sum(
+            len(track['tasks']) + sum(len(sprint['tasks']) for sprint in track['sprints'])
+            for track in tracks
+        )
+        if task_count > settings.BULK_MAX_ITEMS:
+            raise serializers.ValidationError(
+                f"A plan may contain at most {settings.BULK_MAX_ITEMS} tasks."
+            )
+
+        request = self.context.get('request')
+        if request and request.user.is_authenticated:
+            taken = Category.objects.filter(
+                name__in=[category['name'] for category in value]
+            ).exclude(workspace_id=request.workspace.pk).values_list('name', flat=True)
+            if taken:
+                raise serializers.ValidationError(
+                    f"Category name(s) already in use: {', '.join(sorted(taken))}."
+                )
+        return value
+
+
 class DailyTodoSerializer(serializers.ModelSerializer):
     """Serializer for DailyTodo model."""
     workspace = serializers.PrimaryKeyRelatedField(read_only=True)
@@ -1,8 +1,12 @@
-from django.db.models.signals import post_save
+from django.db.models import QuerySet
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.auth.models import User
 from django.db import connection
 
+from . import counters, rollups
+from .models import Workspace, Category, Track, Sprint, Task, DailyLog, DailyTodo
+
 
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
@@ -54,3 +58,123 @@ def save_workspace_for_user(sender, instance, **kwargs):
     except Exception:
         # Silently fail if workspace doesn't exist
         pass
+
+
+@receiver(pre_save, sender=Task)
+@receiver(pre_save, sender=DailyLog)
+@receiver(pre_save, sender=DailyTodo)
+def load_previous_values(sender, instance, **kwargs):
+    """
+    Make the previously persisted values available to the counter and
+    rollup handlers for instances that were not (fully) loaded from the
+    database.
+    """
+    rollups.load_previous_values(instance)
+
+
+def cascade_parent(sender, origin):
+    """
+    Model whose deletion removed this ``sender`` row through a foreign key
+    cascade, or None when the row itself (or a queryset of its model) was
+    deleted.
+    """
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return None if origin is None or model is sender else model
+
+
+def deleted_with_workspace(sender, origin):
+    """Rows removed with their workspace need no counter, rollup or version upkeep."""
+    return cascade_parent(sender, origin) in (User, Workspace)
+
+
+@receiver(post_save, sender=Task)
+def update_counters_for_task(sender, instance, created, **kwargs):
+    """Keep track/sprint task counters and the daily rollup in sync."""
+    counters.task_saved(instance, created)
+    rollups.task_saved(instance, created)
+
+
+@receiver(post_delete, sender=Task)
+def remove_task_from_counters(sender, instance, origin=None, **kwargs):
+    """
+    Remove a deleted task from track/sprint counters and the daily rollup.
+    Tasks deleted with their track skip the counters (the track and its
+    sprints are going too) and leave the rollup to remove_track_tasks_from_rollup.
+    """
+    parent = cascade_parent(sender, origin)
+    if parent is Track:
+        origin.__dict__.setdefault('_deleted_tasks', []).append(instance)
+        return
+    if parent in (User, Workspace):
+        return
+    counters.task_deleted(instance)
+    rollups.task_deleted(instance)
+
+
+@receiver(post_delete, sender=Track)
+def remove_track_tasks_from_rollup(sender, instance, origin=None, **kwargs):
+    """
+    Take the tasks deleted with a track (or with every track of a queryset)
+    off the daily rollup: one update per affected day, not one per task.
+    Tasks are deleted before their tracks, so all of them are collected by
+    the time the first track's signal is sent.
+    """
+    tasks = origin.__dict__.pop('_deleted_tasks', []) if origin is not None else []
+    by_workspace = {}
+    for task in tasks:
+        by_workspace.setdefault(task.workspace_id, []).append(task)
+    for workspace_id, workspace_tasks in by_workspace.items():
+        rollups.tasks_deleted(workspace_id, workspace_tasks)
+
+
+@receiver(post_save, sender=DailyLog)
+def update_daily_stats_for_log(sender, instance, **kwargs):
+    """Copy daily log metrics into the daily rollup."""
+    rollups.log_saved(instance)
+
+
+@receiver(post_delete, sender=DailyLog)
+def remove_log_from_daily_stats(sender, instance, origin=None, **kwargs):
+    """Clear daily log metrics from the daily rollup."""
+    if not deleted_with_workspace(sender, origin):
+        rollups.log_deleted(instance)
+
+
+@receiver(post_save, sender=DailyTodo)
+def update_daily_stats_for_todo(sender, instance, **kwargs):
+    """Keep the daily rollup's done-todo counter in sync."""
+    rollups.todo_saved(instance)
+
+
+@receiver(post_delete, sender=DailyTodo)
+def remove_todo_from_daily_stats(sender, instance, origin=None, **kwargs):
+    """Remove a deleted todo from the daily rollup."""
+    if not deleted_with_workspace(sender, origin):
+        rollups.todo_deleted(instance)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Track)
+@receiver(post_delete, sender=Track)
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+@receiver(post_save, sender=DailyLog)
+@receiver(post_delete, sender=DailyLog)
+@receiver(post_save, sender=DailyTodo)
+@receiver(post_delete, sender=DailyTodo)
+def bump_workspace_version(sender, instance, origin=None, **kwargs):
+    """
+    Invalidate cached responses of the workspace that owns the object.
+    Rows deleted with a parent leave it to the parent's own signal.
+    """
+    if cascade_parent(sender, origin) is None:
+        Workspace.bump_version(pk=instance.workspace_id)
+
+
+@receiver(post_save, sender=Sprint)
+@receiver(post_delete, sender=Sprint)
+def bump_workspace_version_for_sprint(sender, instance, origin=None, **kwargs):
+    """Invalidate cached responses of the workspace that owns the sprint's track."""
+    if cascade_parent(sender, origin) is None:
+        Workspace.bump_version(tracks=instance.track_id)
@@ -0,0 +1,361 @@
+"""
+Dashboard statistics engine for FocusFlow.
+Computes workspace counters with conditional aggregation so that the number
+of queries per dashboard call stays constant regardless of workspace size.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Count, Q, F, Avg, Sum, Window, OuterRef, Subquery
+from django.db.models.functions import Coalesce, RowNumber, TruncMonth, TruncWeek
+
+from .models import Track, Sprint, Task, WorkspaceDailyStats
+
+
+OPEN_STATUSES = [Task.StatusChoices.TODO, Task.StatusChoices.IN_PROGRESS]
+
+HEATMAP_DAYS = 30
+HEATMAP_MAX_DAYS = 731
+LOG_WINDOW_DAYS = 30
+
+TREND_GRANULARITIES = {
+    'week': TruncWeek,
+    'month': TruncMonth,
+}
+TREND_PERIODS = 12
+TREND_MAX_PERIODS = 104
+
+
+def count_where(queryset, **conditions):
+    """
+    Count rows matching each condition in a single aggregate query.
+
+    Each keyword maps an output name to a ``Q`` object; an empty ``Q()``
+    counts every row in the queryset.
+    """
+    return queryset.aggregate(**{
+        name: Count('pk', filter=condition) if condition else Count('pk')
+        for name, condition in conditions.items()
+    })
+
+
+def track_counters(workspace):
+    """Total and active track counts."""
+    return count_where(
+        Track.objects.filter(workspace_id=workspace.pk),
+        total_tracks=Q(),
+        active_tracks=Q(is_active=True),
+    )
+
+
+def task_counters(workspace, today):
+    """Task counts by status, plus high-priority and overdue open tasks."""
+    counters = count_where(
+        Task.objects.filter(workspace_id=workspace.pk),
+        total_tasks=Q(),
+        completed_tasks=Q(status=Task.StatusChoices.DONE),
+        in_progress_tasks=Q(status=Task.StatusChoices.IN_PROGRESS),
+        pending_tasks=Q(status=Task.StatusChoices.TODO),
+        high_priority_pending=Q(status__in=OPEN_STATUSES, priority=Task.PriorityChoices.HIGH),
+        overdue_tasks=Q(status__in=OPEN_STATUSES, due_date__lt=today),
+    )
+    total = counters['total_tasks']
+    completion_rate = (counters['completed_tasks'] / total * 100) if total > 0 else 0
+    counters['completion_rate'] = round(completion_rate, 2)
+    return counters
+
+
+def with_track_counts(queryset):
+    """
+    Annotate a Track queryset with its sprint count and estimated task hours
+    and join its category, so TrackSerializer needs no per-row queries.
+    Task totals are read from the track's own counters. Correlated
+    subqueries keep the sprint and task aggregates from multiplying.
+    """
+    sprints = Sprint.objects.filter(track=OuterRef('pk')).order_by().values('track')
+    tasks = Task.objects.filter(track=OuterRef('pk')).order_by().values('track')
+    return queryset.select_related('category').annotate(
+        sprint_count=Coalesce(Subquery(sprints.annotate(total=Count('pk')).values('total')), 0),
+        estimated_hours=Subquery(tasks.annotate(total=Sum('estimated_hours')).values('total')),
+    )
+
+
+def with_sprint_progress(queryset):
+    """
+    Annotate a Sprint queryset with in-progress counts and hour sums.
+    Total and done counts are read from the sprint's own counters; the rest
+    comes from a single join against tasks.
+    """
+    return queryset.select_related('track').annotate(
+        in_progress_tasks=Count('tasks', filter=Q(tasks__status=Task.StatusChoices.IN_PROGRESS)),
+        estimated_hours=Sum('tasks__estimated_hours'),
+        actual_hours=Sum('tasks__actual_hours'),
+    )
+
+
+def sprint_progress_data(sprint, today):
+    """Progress payload for a sprint annotated by with_sprint_progress()."""
+    total = sprint.total_tasks
+    percentage = (sprint.done_tasks / total * 100) if total > 0 else 0
+    return {
+        'id': sprint.id,
+        'name': sprint.name,
+        'track': sprint.track_id,
+        'track_title': sprint.track.title if sprint.track else None,
+        'start_date': sprint.start_date,
+        'end_date': sprint.end_date,
+        'total_tasks': total,
+        'completed_tasks': sprint.done_tasks,
+        'in_progress_tasks': sprint.in_progress_tasks,
+        'estimated_hours': sprint.estimated_hours or 0,
+        'actual_hours': sprint.actual_hours or 0,
+        'progress_percentage': round(percentage, 2),
+        'days_remaining': (sprint.end_date - today).days,
+    }
+
+
+def sprint_progress(workspace, today):
+    """Progress of every currently running sprint, in one annotated query."""
+    active_sprints = with_sprint_progress(Sprint.objects.filter(
+        track__workspace_id=workspace.pk,
+        start_date__lte=today,
+        end_date__gte=today,
+        is_active=True
+    ))
+    return [sprint_progress_data(sprint, today) for sprint in active_sprints]
+
+
+def heatmap(workspace, today, days=HEATMAP_DAYS):
+    """
+    Daily activity for the last ``days`` days, oldest first.
+    Reads one rollup row per active day; days without a row are filled in.
+    """
+    start = today - timedelta(days=days - 1)
+    activity = {
+        stats.date: stats
+        for stats in WorkspaceDailyStats.objects.filter(
+            workspace_id=workspace.pk,
+            date__gte=start,
+            date__lte=today,
+        ).only('date', 'tasks_completed', 'focus_hours', 'has_log')
+    }
+
+    data = []
+    for offset in range(days):
+        date = start + timedelta(days=offset)
+        stats = activity.get(date)
+        count = stats.tasks_completed if stats else 0
+        data.append({
+            'date': date.isoformat(),
+            'count': count,
+            'level': min(count, 4),  # 0-4 for visual intensity
+            'focus_hours': round(stats.focus_hours or 0, 2) if stats else 0,
+            'has_log': stats.has_log if stats else False,
+        })
+    return data
+
+
+def log_aggregates(workspace, today, days=LOG_WINDOW_DAYS):
+    """Average mood and total focus hours over recent days, from the rollup."""
+    totals = WorkspaceDailyStats.objects.filter(
+        workspace_id=workspace.pk,
+        date__gte=today - timedelta(days=days)
+    ).aggregate(
+        avg_mood=Avg('mood'),
+        total_focus=Sum('focus_hours'),
+    )
+    return {
+        'avg_mood_score': round(totals['avg_mood'] or 0, 2),
+        'total_focus_hours': round(totals['total_focus'] or 0, 2),
+    }
+
+
+def period_start(date, granularity):
+    """First day of the week (Monday) or month containing ``date``."""
+    if granularity == 'week':
+        return date - timedelta(days=date.weekday())
+    return date.replace(day=1)
+
+
+def shift_periods(start, granularity, count):
+    """Move a period start forwards (or backwards) by ``count`` periods."""
+    if granularity == 'week':
+        return start + timedelta(weeks=count)
+    month_index = start.year * 12 + start.month - 1 + count
+    return start.replace(year=month_index // 12, month=month_index % 12 + 1)
+
+
+def trends(workspace, today, granularity='week', periods=TREND_PERIODS):
+    """
+    Per-period task velocity, completion rate, mood/energy and focus.
+
+    Two queries over the daily rollup. The first sums completions before
+    the window, which seeds ``cumulative_completed`` (all-time, not
+    window-only). The second uses TRUNC to bucket each day into its
+    period, window functions for the per-period totals and the running
+    completion count, and a ROW_NUMBER filter to keep one row per period.
+    Periods without activity are filled in.
+    """
+    first = shift_periods(period_start(today, granularity), granularity, -(periods - 1))
+    earlier = WorkspaceDailyStats.objects.filter(
+        workspace_id=workspace.pk, date__lt=first
+    ).aggregate(total=Coalesce(Sum('tasks_completed'), 0))['total']
+    by_period = [F('period')]
+    rows = WorkspaceDailyStats.objects.filter(
+        workspace_id=workspace.pk,
+        date__gte=first,
+        date__lte=today,
+    ).annotate(
+        period=TREND_GRANULARITIES[granularity]('date'),
+    ).annotate(
+        period_completed=Window(Sum('tasks_completed'), partition_by=by_period),
+        period_created=Window(Sum('tasks_created'), partition_by=by_period),
+        period_mood=Window(Avg('mood'), partition_by=by_period),
+        period_energy=Window(Avg('energy'), partition_by=by_period),
+        period_focus=Window(Sum('focus_hours'), partition_by=by_period),
+        running_completed=Window(Sum('tasks_completed'), order_by=F('date').asc()),
+        day_rank=Window(RowNumber(), partition_by=by_period, order_by=F('date').desc()),
+    ).filter(day_rank=1).values(
+        'period', 'period_completed', 'period_created', 'period_mood',
+        'period_energy', 'period_focus', 'running_completed',
+    )
+    totals = {row['period']: row for row in rows}
+
+    data = []
+    cumulative = earlier
+    for index in range(periods):
+        start = shift_periods(first, granularity, index)
+        row = totals.get(start)
+        completed = row['period_completed'] if row else 0
+        created = row['period_created'] if row else 0
+        if row:
+            cumulative = earlier + row['running_completed']
+        data.append({
+            'period_start': start.isoformat(),
+            'tasks_completed': completed,
+            'tasks_created': created,
+            'completion_rate': round(completed / created * 100, 2) if created else 0.0,
+            'avg_mood': round(row['period_mood'], 2) if row and row['period_mood'] is not None else None,
+            'avg_energy': round(row['period_energy'], 2) if row and row['period_energy'] is not None else None,
+            'focus_hours': round(row['period_focus'] or 0, 2) if row else 0,
+            'cumulative_completed': cumulative,
+        })
+    return data
+
+
+def counters_section(workspace, today):
+    """Track and task counters."""
+    tracks = track_counters(workspace)
+    tasks = task_counters(workspace, today)
+    return {
+        'total_tracks': tracks['total_tracks'],
+        'active_tracks': tracks['active_tracks'],
+        'total_tasks': tasks['total_tasks'],
+        'completed_tasks': tasks['completed_tasks'],
+        'in_progress_tasks': tasks['in_progress_tasks'],
+        'pending_tasks': tasks['pending_tasks'],
+        'high_priority_pending': tasks['high_priority_pending'],
+        'overdue_tasks': tasks['overdue_tasks'],
+        'completion_rate': tasks['completion_rate'],
+    }
+
+
+def sprints_section(workspace, today):
+    """Progress of the currently running sprints."""
+    sprints = sprint_progress(workspace, today)
+    return {
+        'active_sprints_count': len(sprints),
+        'sprint_progress': sprints,
+    }
+
+
+def heatmap_section(workspace, today):
+    """Daily activity for the default heatmap window."""
+    return {'heatmap_data': heatmap(workspace, today)}
+
+
+def logs_section(workspace, today):
+    """Mood and focus aggregates over recent days."""
+    return log_aggregates(workspace, today)
+
+
+DASHBOARD_SECTIONS = {
+    'counters': counters_section,
+    'sprints': sprints_section,
+    'heatmap': heatmap_section,
+    'logs': logs_section,
+}
+
+
+def parse_sections(value):
+    """
+    Parse a comma-separated ``?sections=`` value into section names.
+    Returns every section for an empty value; raises ValueError on unknown names.
+    """
+    if not value:
+        return list(DASHBOARD_SECTIONS)
+    sections = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in sections if name not in DASHBOARD_SECTIONS]
+    if unknown:
+        raise ValueError(
+            f"Unknown section(s): {', '.join(unknown)}. "
+            f"Available: {', '.join(DASHBOARD_SECTIONS)}"
+        )
+    return sections
+
+
+def compute_dashboard_stats(workspace, today, sections=None):
+    """
+    Compute the dashboard payload for a workspace.
+    Only the requested sections are computed; each issues a fixed number of queries.
+    """
+    stats = {}
+    for name in sections or DASHBOARD_SECTIONS:
+        stats.update(DASHBOARD_SECTIONS[name](workspace, today))
+    return stats
+
+
+_section_executor = None
+
+
+def section_executor():
+    """
+    Bounded thread pool shared by concurrent section computations.
+    Its size caps the extra database connections opened for the dashboard.
+    """
+    global _section_executor
+    if _section_executor is None:
+        _section_executor = ThreadPoolExecutor(
+            max_workers=settings.DASHBOARD_SECTION_WORKERS,
+            thread_name_prefix='dashboard-section'
+        )
+    return _section_executor
+
+
+def _run_section(name, workspace, today):
+    """Compute one section in a worker thread with a healthy connection."""
+    close_old_connections()
+    try:
+        return DASHBOARD_SECTIONS[name](workspace, today)
+    finally:
+        close_old_connections()
+
+
+async def acompute_dashboard_stats(workspace, today, sections=None):
+    """
+    Async variant of compute_dashboard_stats() that computes the requested
+    sections concurrently, each on its own thread and database connection,
+    so latency tracks the slowest section instead of their sum.
+    """
+    names = list(sections or DASHBOARD_SECTIONS)
+    run = sync_to_async(_run_section, thread_sensitive=False, executor=section_executor())
+    results = await asyncio.gather(*(run(name, workspace, today) for name in names))
+
+    stats = {}
+    for result in results:
+        stats.update(result)
+    return stats
@@ -0,0 +1,55 @@
+"""
+Request-scoped workspace resolution for FocusFlow.
+
+Every user gets exactly one Workspace (created by a post_save signal), and
+its primary key is the user's id. ``WorkspaceMiddleware`` sets
+``request.workspace`` to a WorkspaceContext whose ``pk`` is read from the
+authenticated user, so scoping querysets (``workspace_id=workspace.pk``)
+never queries the database. The Workspace row itself is only loaded, once
+per request, when a view needs its fields (``instance``), e.g. the
+data_version behind cache keys and ETags.
+
+DRF authenticates after middleware has run; the context reads
+``request.user`` at access time, which DRF has replaced with the
+authenticated user by then.
+"""
+from django.core.exceptions import ObjectDoesNotExist
+from django.utils.functional import cached_property
+from rest_framework.exceptions import PermissionDenied
+
+
+class WorkspaceContext:
+    """
+    The requesting user's workspace. ``pk`` is free; ``instance`` is the
+    Workspace row, loaded on first access; a user without one gets a 403
+    from there. Accepted wherever a function only needs ``workspace.pk``.
+    """
+
+    def __init__(self, request):
+        self._request = request
+
+    @property
+    def pk(self):
+        return self._request.user.pk
+
+    @cached_property
+    def instance(self):
+        # Cached on the user too, so ``request.user.workspace`` reuses it
+        try:
+            return self._request.user.workspace
+        except ObjectDoesNotExist:
+            raise PermissionDenied('No workspace found for this user.')
+
+    def __repr__(self):
+        return f'<WorkspaceContext pk={self.pk}>'
+
+
+class WorkspaceMiddleware:
+    """Attach a lazy WorkspaceContext to every request as ``request.workspace``."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.workspace = WorkspaceContext(request)
+        return self.get_response(request)
@@ -0,0 +1,156 @@
+"""
+Bulk task endpoints: results and bookkeeping, not just query counts.
+"""
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core.models import Track, Sprint, Task
+
+
+class BulkTestCase(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('bulk', 'bulk@example.com', 'password123')
+        cls.track = Track.objects.create(workspace_id=cls.user.pk, title='Bulk')
+        cls.other_track = Track.objects.create(workspace_id=cls.user.pk, title='Elsewhere')
+        cls.sprint = Sprint.objects.create(
+            track=cls.track, name='First', start_date='2026-01-01', end_date='2026-01-14'
+        )
+        cls.next_sprint = Sprint.objects.create(
+            track=cls.track, name='Second', start_date='2026-01-15', end_date='2026-01-28'
+        )
+        cls.foreign_sprint = Sprint.objects.create(
+            track=cls.other_track, name='Foreign', start_date='2026-01-01', end_date='2026-01-14'
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+
+    def assertCounters(self, parent, total, done):
+        parent.refresh_from_db()
+        self.assertEqual((parent.total_tasks, parent.done_tasks), (total, done), parent)
+
+
+class BulkUpdateTests(BulkTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tasks = [
+            Task.objects.create(workspace_id=self.user.pk, track=self.track, sprint=self.sprint, title=f'Task {i}')
+            for i in range(3)
+        ]
+
+    def bulk_update(self, changes):
+        return self.client.patch(reverse('task-bulk-update'), changes, format='json')
+
+    def test_move_and_complete_update_old_and_new_parents(self):
+        response = self.bulk_update([
+            {'id': self.tasks[0].pk, 'sprint': self.next_sprint.pk, 'status': Task.StatusChoices.DONE},
+            {'id': self.tasks[1].pk, 'sprint': self.next_sprint.pk},
+            {'id': self.tasks[2].pk, 'status': Task.StatusChoices.DONE},
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([task['id'] for task in response.data], [task.pk for task in self.tasks])
+        self.assertCounters(self.track, 3, 2)
+        self.assertCounters(self.sprint, 1, 1)
+        self.assertCounters(self.next_sprint, 2, 1)
+
+        response = self.bulk_update([{'id': self.tasks[0].pk, 'sprint': None}])
+        self.assertEqual(response.status_code, 200)
+        self.assertCounters(self.track, 3, 2)
+        self.assertCounters(self.next_sprint, 1, 0)
+
+    def test_sprint_of_another_track_is_rejected(self):
+        response = self.bulk_update([
+            {'id': self.tasks[0].pk, 'status': Task.StatusChoices.DONE},
+            {'id': self.tasks[1].pk, 'sprint': self.foreign_sprint.pk},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('sprint', response.data[1])
+        # Nothing is written when any item is invalid
+        self.assertFalse(Task.objects.filter(status=Task.StatusChoices.DONE).exists())
+        self.assertCounters(self.sprint, 3, 0)
+
+    def test_other_workspaces_tasks_are_rejected(self):
+        stranger = User.objects.create_user('bulk-stranger', 'bulk-stranger@example.com', 'password123')
+        foreign = Task.objects.create(workspace_id=stranger.pk, title='Theirs')
+
+        response = self.bulk_update([{'id': foreign.pk, 'status': Task.StatusChoices.DONE}])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('id', response.data[0])
+        self.assertEqual(Task.objects.get(pk=foreign.pk).status, Task.StatusChoices.TODO)
+
+    @override_settings(BULK_MAX_ITEMS=2)
+    def test_item_limit(self):
+        response = self.bulk_update([{'id': task.pk, 'status': Task.StatusChoices.DONE} for task in self.tasks])
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Task.objects.filter(status=Task.StatusChoices.DONE).exists())
+
+
+class BulkCreateTests(BulkTestCase):
+
+    def bulk_create(self, route, items):
+        return self.client.post(reverse(route), items, format='json')
+
+    def test_created_ids_come_back_in_input_order(self):
+        response = self.bulk_create('track-list', [{'title': 'Alpha'}, {'title': 'Beta'}])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(list(response.data), ['ids'])
+        self.assertEqual(
+            [Track.objects.get(pk=pk).title for pk in response.data['ids']], ['Alpha', 'Beta']
+        )
+
+        response = self.bulk_create('sprint-list', [
+            {'track': self.other_track.pk, 'name': 'Later', 'start_date': '2026-02-01', 'end_date': '2026-02-14'},
+        ])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Sprint.objects.get(pk=response.data['ids'][0]).track_id, self.other_track.pk)
+
+    def test_tasks_update_counters(self):
+        response = self.bulk_create('task-list', [
+            {'title': 'One', 'track': self.track.pk, 'sprint': self.sprint.pk},
+            {'title': 'Two', 'track': self.track.pk, 'sprint': self.sprint.pk, 'status': Task.StatusChoices.DONE},
+            {'title': 'Three', 'track': self.other_track.pk},
+        ])
+
+        self.assertEqual(response.status_code, 201)
+        tasks = Task.objects.in_bulk(response.data['ids'])
+        self.assertEqual([tasks[pk].title for pk in response.data['ids']], ['One', 'Two', 'Three'])
+        self.assertTrue(all(task.workspace_id == self.user.pk for task in tasks.values()))
+        self.assertCounters(self.track, 2, 1)
+        self.assertCounters(self.sprint, 2, 1)
+        self.assertCounters(self.other_track, 1, 0)
+
+    def test_invalid_items_reject_the_whole_batch(self):
+        response = self.bulk_create('task-list', [
+            {'title': 'Fine', 'track': self.track.pk},
+            {'title': 'Mismatch', 'track': self.track.pk, 'sprint': self.foreign_sprint.pk},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('sprint', response.data[1])
+        self.assertFalse(Task.objects.exists())
+        self.assertCounters(self.track, 0, 0)
+
+    def test_other_workspaces_parents_are_rejected(self):
+        stranger = User.objects.create_user('bulk-rival', 'bulk-rival@example.com', 'password123')
+        foreign_track = Track.objects.create(workspace_id=stranger.pk, title='Theirs')
+
+        response = self.bulk_create('task-list', [{'title': 'Sneaky', 'track': foreign_track.pk}])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('track', response.data[0])
+        self.assertFalse(Task.objects.exists())
+
+    @override_settings(BULK_MAX_ITEMS=2)
+    def test_item_limit(self):
+        response = self.bulk_create('track-list', [{'title': f'Track {i}'} for i in range(3)])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Track.objects.filter(workspace_id=self.user.pk).count(), 2)
@@ -0,0 +1,83 @@
+"""
+The compiled list endpoints must render exactly what their serializers do.
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from core.compiled import CompiledSerializer
+from core.models import Category, Track, Sprint, Task, DailyLog
+from core.serializers import TaskSerializer, DailyLogSerializer, TrackSerializer
+
+
+class CompiledSerializerTests(APITestCase):
+    """Byte-for-byte comparison of compiled and ModelSerializer output."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('compiled', 'compiled@example.com', 'password123')
+        workspace = cls.user.workspace
+        category = Category.objects.create(workspace=workspace, name='Compiled')
+        track = Track.objects.create(workspace=workspace, title='Tráck "one"', category=category)
+        sprint = Sprint.objects.create(
+            track=track, name='Sprint 1', start_date='2026-01-01', end_date='2026-01-14'
+        )
+        now = timezone.now()
+        Task.objects.bulk_create([
+            Task(workspace=workspace, track=track, sprint=sprint, title='Both',
+                 status=Task.StatusChoices.DONE, estimated_hours=Decimal('1.5'),
+                 actual_hours=Decimal('2'), due_date=date(2026, 1, 5), completed_at=now),
+            Task(workspace=workspace, track=track, title='No sprint', description='line\nbreak'),
+            Task(workspace=workspace, title='No track', priority=Task.PriorityChoices.HIGH),
+        ])
+        DailyLog.objects.bulk_create([
+            DailyLog(workspace=workspace, date=date(2026, 1, 1) - timedelta(days=i),
+                     mood_score=i or None, notes='' if i else None,
+                     habits_completed=['read', {'run': i}], focus_hours=Decimal('2.25'))
+            for i in range(3)
+        ])
+
+    def setUp(self):
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+
+    def serialized(self, serializer_class, queryset):
+        return JSONRenderer().render(serializer_class(queryset, many=True).data)
+
+    def compiled(self, serializer_class, queryset):
+        compiled = CompiledSerializer(serializer_class)
+        return JSONRenderer().render(compiled.render(compiled.values(queryset)))
+
+    def test_task_rows_match_serializer(self):
+        queryset = Task.objects.order_by('pk')
+        self.assertEqual(self.compiled(TaskSerializer, queryset), self.serialized(TaskSerializer, queryset))
+
+    def test_daily_log_rows_match_serializer(self):
+        queryset = DailyLog.objects.order_by('pk')
+        self.assertEqual(
+            self.compiled(DailyLogSerializer, queryset), self.serialized(DailyLogSerializer, queryset)
+        )
+
+    def test_list_endpoints_match_serializer(self):
+        for name, serializer_class, queryset in (
+            ('task-list', TaskSerializer, Task.objects.order_by('-priority', '-created_at')),
+            ('dailylog-list', DailyLogSerializer, DailyLog.objects.order_by('-date')),
+        ):
+            with self.subTest(route=name), mock.patch.object(PageNumberPagination, 'page_size', 2):
+                response = self.client.get(reverse(name))
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    JSONRenderer().render(response.data['results']),
+                    self.serialized(serializer_class, queryset[:2]),
+                )
+
+    def test_method_fields_are_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            CompiledSerializer(TrackSerializer).compile()
@@ -0,0 +1,54 @@
+"""
+ETag validators change whenever the payload they stand for can change.
+"""
+from datetime import datetime
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core.models import Workspace, Track
+
+
+def local_time(hour):
+    return datetime(2026, 3, 2, hour, 30).astimezone()
+
+
+class ConditionalGetTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('etag', 'etag@example.com', 'password123')
+        cls.track = Track.objects.create(workspace_id=cls.user.pk, title='Validators')
+
+    def setUp(self):
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+
+    def dashboard(self, hour, etag=None):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        with mock.patch('core.views.datetime') as clock:
+            clock.now.return_value = local_time(hour)
+            return self.client.get(reverse('dashboard-stats'), **headers)
+
+    def test_dashboard_etag_follows_the_greeting(self):
+        morning = self.dashboard(9)
+        self.assertEqual(morning.data['greeting'], 'Good morning')
+
+        self.assertEqual(self.dashboard(11, morning['ETag']).status_code, 304)
+
+        afternoon = self.dashboard(13, morning['ETag'])
+        self.assertEqual(afternoon.status_code, 200)
+        self.assertEqual(afternoon.data['greeting'], 'Good afternoon')
+
+    def test_update_progress_invalidates_validators(self):
+        url = reverse('track-detail', kwargs={'pk': self.track.pk})
+        etag = self.client.get(url)['ETag']
+        version = Workspace.objects.get(pk=self.user.pk).data_version
+
+        response = self.client.post(reverse('track-update-progress', kwargs={'pk': self.track.pk}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Workspace.objects.get(pk=self.user.pk).data_version, version + 1)
+        self.setUp()  # a fresh user, as the JWT backend loads it per request
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
@@ -0,0 +1,112 @@
+"""
+Track and sprint task counters follow every task write without a recount.
+"""
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core.models import Track, Sprint, Task
+
+
+class TaskCounterTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('counter', 'counter@example.com', 'password123')
+        cls.track = Track.objects.create(workspace_id=cls.user.pk, title='First')
+        cls.other_track = Track.objects.create(workspace_id=cls.user.pk, title='Second')
+        cls.sprint = Sprint.objects.create(
+            track=cls.track, name='Sprint', start_date='2026-01-01', end_date='2026-01-14'
+        )
+        cls.other_sprint = Sprint.objects.create(
+            track=cls.other_track, name='Other sprint', start_date='2026-01-01', end_date='2026-01-14'
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+
+    def assertCounters(self, parent, total, done):
+        parent.refresh_from_db()
+        self.assertEqual((parent.total_tasks, parent.done_tasks), (total, done), parent)
+        # ...and match what a recount would store
+        type(parent).recount_tasks(pk=parent.pk)
+        parent.refresh_from_db()
+        self.assertEqual((parent.total_tasks, parent.done_tasks), (total, done), parent)
+
+    def create_task(self, **data):
+        response = self.client.post(reverse('task-list'), {
+            'title': 'Counted', 'track': self.track.pk, 'sprint': self.sprint.pk, **data,
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        return response.data['id']
+
+    def patch_task(self, pk, **data):
+        response = self.client.patch(reverse('task-detail', kwargs={'pk': pk}), data, format='json')
+        self.assertEqual(response.status_code, 200)
+
+    def test_create(self):
+        self.create_task()
+        self.create_task(status=Task.StatusChoices.DONE)
+        self.assertCounters(self.track, 2, 1)
+        self.assertCounters(self.sprint, 2, 1)
+        self.assertEqual(Track.objects.get(pk=self.track.pk).progress_percentage, 50)
+
+    def test_status_flip(self):
+        pk = self.create_task()
+        self.patch_task(pk, status=Task.StatusChoices.DONE)
+        self.assertCounters(self.track, 1, 1)
+        self.assertCounters(self.sprint, 1, 1)
+
+        self.patch_task(pk, status=Task.StatusChoices.IN_PROGRESS)
+        self.assertCounters(self.track, 1, 0)
+        self.assertCounters(self.sprint, 1, 0)
+
+    def test_track_and_sprint_move(self):
+        pk = self.create_task(status=Task.StatusChoices.DONE)
+        self.patch_task(pk, track=self.other_track.pk, sprint=self.other_sprint.pk)
+        self.assertCounters(self.track, 0, 0)
+        self.assertCounters(self.sprint, 0, 0)
+        self.assertCounters(self.other_track, 1, 1)
+        self.assertCounters(self.other_sprint, 1, 1)
+
+        self.patch_task(pk, sprint=None)
+        self.assertCounters(self.other_track, 1, 1)
+        self.assertCounters(self.other_sprint, 0, 0)
+
+    def test_delete(self):
+        pk = self.create_task(status=Task.StatusChoices.DONE)
+        self.create_task()
+        response = self.client.delete(reverse('task-detail', kwargs={'pk': pk}))
+        self.assertEqual(response.status_code, 204)
+        self.assertCounters(self.track, 1, 0)
+        self.assertCounters(self.sprint, 1, 0)
+
+    def test_deleting_a_track_with_tasks(self):
+        self.create_task(status=Task.StatusChoices.DONE)
+        kept = self.create_task(track=self.other_track.pk, sprint=self.other_sprint.pk)
+        response = self.client.delete(reverse('track-detail', kwargs={'pk': self.track.pk}))
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(list(Task.objects.filter(workspace_id=self.user.pk).values_list('pk', flat=True)), [kept])
+        self.assertCounters(self.other_track, 1, 0)
+        self.assertCounters(self.other_sprint, 1, 0)
+
+    def test_concurrent_writes_are_counted_once(self):
+        pk = self.create_task()
+        first, second = Task.objects.get(pk=pk), Task.objects.get(pk=pk)
+        first.status = second.status = Task.StatusChoices.DONE
+        first.save()
+        second.save()
+        self.assertCounters(self.track, 1, 1)
+
+        first, second = Task.objects.get(pk=pk), Task.objects.get(pk=pk)
+        first.title = 'Renamed'
+        first.save()
+        second.sprint = None
+        second.save()
+        self.assertEqual(Task.objects.get(pk=pk).title, 'Renamed')
+        self.assertCounters(self.sprint, 0, 0)
+
+        first, second = Task.objects.get(pk=pk), Task.objects.get(pk=pk)
+        first.delete()
+        self.assertEqual(second.delete(), (0, {}))
+        self.assertCounters(self.track, 0, 0)
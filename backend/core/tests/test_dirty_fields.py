@@ -0,0 +1,47 @@
+"""
+Changed-column tracking of DirtyFieldsMixin models.
+"""
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import DailyLog, Task
+
+
+class DirtyFieldsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('dirty', 'dirty@example.com', 'password123')
+        cls.log = DailyLog.objects.create(
+            workspace_id=cls.user.pk, date=timezone.now().date(), habits_completed=['read'],
+        )
+        cls.task = Task.objects.create(workspace_id=cls.user.pk, title='Dirty')
+
+    def test_in_place_json_changes_are_saved(self):
+        log = DailyLog.objects.get(pk=self.log.pk)
+        log.habits_completed.append('run')
+        self.assertEqual(log.get_dirty_fields(), ['habits_completed'])
+
+        log.save()
+        self.assertEqual(DailyLog.objects.get(pk=self.log.pk).habits_completed, ['read', 'run'])
+
+        log.habits_completed.append('write')
+        self.assertEqual(log.get_dirty_fields(), ['habits_completed'])
+
+    def test_refreshed_columns_are_clean(self):
+        task = Task.objects.get(pk=self.task.pk)
+        Task.objects.filter(pk=self.task.pk).update(title='Renamed elsewhere')
+
+        task.refresh_from_db()
+        self.assertEqual(task.get_dirty_fields(), [])
+
+        task.description = 'Unsaved'
+        Task.objects.filter(pk=self.task.pk).update(title='Renamed again')
+        task.refresh_from_db(fields=['title'])
+        self.assertEqual(task.get_dirty_fields(), ['description'])
+
+    def test_deferred_columns_loaded_on_access_are_clean(self):
+        task = Task.objects.only('title').get(pk=self.task.pk)
+        task.description
+        self.assertEqual(task.get_dirty_fields(), [])
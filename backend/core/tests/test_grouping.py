@@ -0,0 +1,50 @@
+"""
+Keyset paging of grouped listings must return every row exactly once.
+"""
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from core.models import Task
+
+
+class GroupCursorTests(APITestCase):
+    """Rows sharing a timestamp (down to the millisecond) are paged in full."""
+
+    ROWS = 60
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('cursor', 'cursor@example.com', 'password123')
+        created = timezone.now().replace(microsecond=123456)
+        tasks = Task.objects.bulk_create(
+            Task(workspace_id=cls.user.pk, title=f'Task {i}') for i in range(cls.ROWS)
+        )
+        # Same millisecond for all, microseconds differing for half of them
+        Task.objects.filter(pk__in=[task.pk for task in tasks[::2]]).update(created_at=created)
+        Task.objects.filter(pk__in=[task.pk for task in tasks[1::2]]).update(
+            created_at=created.replace(microsecond=123789)
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+
+    def test_every_row_is_paged_once(self):
+        url = reverse('task-by-status')
+        response = self.client.get(url, {'limit_per_group': 5})
+        self.assertEqual(response.status_code, 200)
+        column = response.data[Task.StatusChoices.TODO]
+        seen = [task['id'] for task in column['tasks']]
+        cursor = column['next']
+        while cursor:
+            response = self.client.get(url, {
+                'status': Task.StatusChoices.TODO, 'cursor': cursor, 'limit_per_group': 5,
+            })
+            self.assertEqual(response.status_code, 200)
+            column = response.data[Task.StatusChoices.TODO]
+            seen += [task['id'] for task in column['tasks']]
+            cursor = column['next']
+
+        self.assertEqual(len(seen), self.ROWS)
+        self.assertEqual(len(set(seen)), self.ROWS)
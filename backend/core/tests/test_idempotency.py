@@ -0,0 +1,109 @@
+"""
+Idempotency-Key handling of mutating endpoints.
+"""
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from core.idempotency import HEADER, REPLAYED_HEADER, request_fingerprint
+from core.models import IdempotencyKey, Task
+from core.views import TaskViewSet
+
+
+class IdempotencyTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('retry', 'retry@example.com', 'password123')
+
+    def setUp(self):
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+
+    def create_task(self, key, title='Once'):
+        return self.client.post(
+            reverse('task-list'), {'title': title}, format='json', headers={HEADER: key}
+        )
+
+    def store_key(self, key, title='Once', **fields):
+        """A key record as left by an earlier request creating ``title``."""
+        request = APIRequestFactory().post(reverse('task-list'), {'title': title}, format='json')
+        return IdempotencyKey.objects.create(**{
+            'user': self.user,
+            'key': key,
+            'fingerprint': request_fingerprint(request),
+            'expires_at': timezone.now() + timedelta(hours=1),
+            **fields,
+        })
+
+    def test_retry_replays_the_first_response(self):
+        first = self.create_task('create-1')
+        retry = self.create_task('create-1')
+
+        self.assertEqual(first.status_code, 201)
+        self.assertNotIn(REPLAYED_HEADER, first)
+        self.assertEqual(retry.status_code, 201)
+        self.assertEqual(retry[REPLAYED_HEADER], 'true')
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(Task.objects.filter(workspace_id=self.user.pk).count(), 1)
+
+    def test_key_in_flight_is_a_conflict(self):
+        self.store_key('busy')
+        response = self.create_task('busy')
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(Task.objects.filter(workspace_id=self.user.pk).exists())
+
+    def test_key_reused_for_another_request_is_rejected(self):
+        self.assertEqual(self.create_task('reused').status_code, 201)
+        response = self.create_task('reused', title='Something else')
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(Task.objects.filter(workspace_id=self.user.pk).count(), 1)
+
+    def test_failed_requests_release_the_key(self):
+        response = self.client.post(reverse('task-list'), {}, format='json', headers={HEADER: 'invalid'})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(IdempotencyKey.objects.filter(key='invalid').exists())
+
+        with mock.patch.object(TaskViewSet, 'perform_create', side_effect=RuntimeError('boom')):
+            with self.assertRaises(RuntimeError):
+                self.create_task('crashed')
+        self.assertFalse(IdempotencyKey.objects.filter(key='crashed').exists())
+        self.assertEqual(self.create_task('crashed').status_code, 201)
+
+    def test_expired_keys_run_again_and_are_purged(self):
+        expired = self.store_key(
+            'old', response_status=201, response_body={'id': 0},
+            expires_at=timezone.now() - timedelta(seconds=1),
+        )
+        live = self.store_key('live', response_status=201, response_body={'id': 0})
+
+        response = self.create_task('old')
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn(REPLAYED_HEADER, response)
+
+        IdempotencyKey.objects.filter(key='old').update(expires_at=expired.expires_at)
+        call_command('purge_idempotency_keys', stdout=StringIO())
+        self.assertEqual(list(IdempotencyKey.objects.values_list('pk', flat=True)), [live.pk])
+
+    def test_bulk_update_replays(self):
+        task = Task.objects.create(workspace_id=self.user.pk, title='Bulk')
+        body = [{'id': task.pk, 'status': Task.StatusChoices.DONE}]
+
+        def bulk_update():
+            return self.client.patch(reverse('task-bulk-update'), body, format='json', headers={HEADER: 'bulk-1'})
+
+        first = bulk_update()
+        Task.objects.filter(pk=task.pk).update(status=Task.StatusChoices.TODO)
+        retry = bulk_update()
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(retry.status_code, 200)
+        self.assertEqual(retry[REPLAYED_HEADER], 'true')
+        self.assertEqual(retry.data, first.data)
+        # The retry did not run the update again
+        self.assertEqual(Task.objects.get(pk=task.pk).status, Task.StatusChoices.TODO)
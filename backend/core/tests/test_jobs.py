@@ -0,0 +1,118 @@
+"""
+Database-backed job queue: claiming, retries and stale-lock recovery.
+"""
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core import jobs
+from core.models import Job
+
+
+@override_settings(JOB_MAX_ATTEMPTS=3, JOB_RETRY_DELAY=30)
+class JobQueueTests(TestCase):
+
+    def setUp(self):
+        # Drop the backfill job migration 0007 queues
+        Job.objects.all().delete()
+        self.calls = []
+        handlers = mock.patch.dict(jobs.JOB_HANDLERS, {
+            'record': lambda **payload: self.calls.append(payload),
+            'explode': mock.Mock(side_effect=RuntimeError('boom')),
+        })
+        handlers.start()
+        self.addCleanup(handlers.stop)
+
+    def test_claimed_jobs_are_not_handed_out_twice(self):
+        first = jobs.enqueue('record', {'n': 1})
+        second = jobs.enqueue('record', {'n': 2})
+
+        claimed = jobs.claim('worker-a', limit=1) + jobs.claim('worker-b', limit=5)
+
+        self.assertEqual(sorted(job.pk for job in claimed), sorted([first.pk, second.pk]))
+        self.assertEqual(jobs.claim('worker-c', limit=5), [])
+        self.assertEqual(
+            dict(Job.objects.values_list('pk', 'locked_by')),
+            {claimed[0].pk: 'worker-a', claimed[1].pk: 'worker-b'}
+        )
+
+    def test_future_jobs_wait(self):
+        jobs.enqueue('record', run_at=timezone.now() + timedelta(minutes=5))
+        self.assertEqual(jobs.claim('worker', limit=5), [])
+
+    def test_success_clears_the_lock(self):
+        jobs.enqueue('record', {'n': 1})
+        [job] = jobs.claim('worker')
+
+        self.assertTrue(jobs.run(job))
+
+        job.refresh_from_db()
+        self.assertEqual(self.calls, [{'n': 1}])
+        self.assertEqual(job.status, Job.StatusChoices.DONE)
+        self.assertEqual((job.locked_by, job.locked_at), ('', None))
+        self.assertIsNotNone(job.finished_at)
+
+    def test_failures_back_off_then_fail(self):
+        jobs.enqueue('explode')
+        delays = []
+        for attempt in range(1, 4):
+            Job.objects.update(run_at=timezone.now())
+            [job] = jobs.claim('worker')
+            before = timezone.now()
+            self.assertFalse(jobs.run(job))
+            job.refresh_from_db()
+            self.assertEqual(job.attempts, attempt)
+            self.assertIn('RuntimeError: boom', job.last_error)
+            if attempt < 3:
+                self.assertEqual(job.status, Job.StatusChoices.QUEUED)
+                self.assertEqual(job.locked_by, '')
+                delays.append(round((job.run_at - before).total_seconds()))
+
+        self.assertEqual(delays, [30, 60])
+        self.assertEqual(job.status, Job.StatusChoices.FAILED)
+        self.assertIsNotNone(job.finished_at)
+        self.assertEqual(jobs.claim('worker'), [])
+
+    def test_stale_running_jobs_are_requeued(self):
+        jobs.enqueue('record')
+        jobs.enqueue('record')
+        stale, fresh = jobs.claim('dead-worker', limit=2)
+        Job.objects.filter(pk=stale.pk).update(locked_at=timezone.now() - timedelta(seconds=601))
+
+        self.assertEqual(jobs.requeue_stale(timeout=600), 1)
+
+        stale.refresh_from_db()
+        fresh.refresh_from_db()
+        self.assertEqual(stale.status, Job.StatusChoices.QUEUED)
+        self.assertEqual((stale.locked_by, stale.locked_at), ('', None))
+        self.assertEqual(fresh.status, Job.StatusChoices.RUNNING)
+        self.assertEqual(fresh.locked_by, 'dead-worker')
+
+    def test_unknown_jobs_are_refused(self):
+        with self.assertRaises(ValueError):
+            jobs.enqueue('no-such-job')
+
+
+class PasswordResetJobTests(TestCase):
+
+    def test_reset_request_queues_the_email(self):
+        Job.objects.all().delete()
+        user = User.objects.create_user('forgetful', 'forgetful@example.com', 'password123')
+
+        response = APIClient().post(reverse('password-reset'), {'email': user.email}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mail.outbox, [])
+        job = Job.objects.get()
+        self.assertEqual((job.name, job.payload), ('send_password_reset_email', {'user_id': user.pk}))
+
+        [claimed] = jobs.claim('worker')
+        self.assertTrue(jobs.run(claimed))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [user.email])
@@ -0,0 +1,74 @@
+"""
+Plan import: the same validation as the per-object endpoints, and category
+name races settled without a 500.
+"""
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.test import APITestCase
+
+from core import importer
+from core.models import Category, Track
+from core.serializers import PlanImportSerializer
+
+
+def plan(name, **track):
+    return {'categories': [{'name': name, 'tracks': [{'title': 'Imported track', **track}]}]}
+
+
+def validated(document):
+    """Validated plan, as the view passes it on (no request: names are not checked)."""
+    serializer = PlanImportSerializer(data=document)
+    serializer.is_valid(raise_exception=True)
+    return serializer.validated_data
+
+
+class PlanImportTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('planner', 'planner@example.com', 'password123')
+        cls.stranger = User.objects.create_user('rival', 'rival@example.com', 'password123')
+
+    def setUp(self):
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+
+    def test_past_dates_are_rejected(self):
+        yesterday = (timezone.now().date() - timedelta(days=1)).isoformat()
+        for document in (
+            plan('Past deadline', deadline=yesterday),
+            plan('Past due date', tasks=[{'title': 'Late', 'due_date': yesterday}]),
+        ):
+            response = self.client.post(reverse('import-plan'), document, format='json')
+            self.assertEqual(response.status_code, 400)
+        self.assertFalse(Track.objects.filter(workspace_id=self.user.pk).exists())
+
+    def test_category_inserted_concurrently_is_matched(self):
+        index_by = importer.index_by
+        calls = []
+
+        def stale_first_lookup(queryset, *keys):
+            # The first category lookup misses a row another request inserted
+            calls.append(queryset.model)
+            if calls == [Category]:
+                return {}
+            return index_by(queryset, *keys)
+
+        category = Category.objects.create(workspace_id=self.user.pk, name='Raced')
+        with mock.patch('core.importer.index_by', stale_first_lookup):
+            report = importer.import_plan(self.user.workspace, validated(plan('Raced')))
+
+        self.assertEqual(report['categories'][0]['id'], category.pk)
+        self.assertEqual(Category.objects.filter(name='Raced').count(), 1)
+
+    def test_category_taken_concurrently_is_a_validation_error(self):
+        # Passed validation before the other workspace's insert committed
+        Category.objects.create(workspace_id=self.stranger.pk, name='Contested')
+        with self.assertRaises(serializers.ValidationError) as raised:
+            importer.import_plan(self.user.workspace, validated(plan('Contested')))
+        self.assertIn('Contested', str(raised.exception.detail['categories'][0]))
+        self.assertFalse(Track.objects.filter(workspace_id=self.user.pk).exists())
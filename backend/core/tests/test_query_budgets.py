@@ -0,0 +1,281 @@
+"""
+Query budget regression suite for every route in ``core/urls.py``.
+
+Three workspaces are seeded with 10, 100 and 1,000 rows per model. Every
+route is requested once per workspace and must issue the same number of
+queries for all three; a per-row query (N+1) shows up as a difference and
+the failure lists the SQL statements whose repetitions grew.
+
+New routes are picked up automatically and requested with GET. Routes that
+need another method or a body go in ROUTE_REQUESTS; routes that cannot be
+measured here go in EXCLUDED_ROUTES with the reason. DELETE_ROUTES are
+also requested with DELETE, on a parent holding 10, 100 and 1,000 tasks.
+"""
+from collections import Counter
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, reverse
+from django.utils import timezone
+from rest_framework.test import APIClient, APITestCase
+
+from core import rollups, urls
+from core.nplusone import fingerprint, chunked_batch
+from core.models import (
+    Workspace, Category, Track, Sprint, Task, DailyLog, DailyTodo, WorkspaceDailyStats,
+)
+
+
+SIZES = (10, 100, 1000)
+
+# Model whose first row fills the ``pk`` of each router basename's detail routes
+DETAIL_MODELS = {
+    'workspace': Workspace,
+    'track': Track,
+    'category': Category,
+    'sprint': Sprint,
+    'task': Task,
+    'dailylog': DailyLog,
+    'dailytodo': DailyTodo,
+}
+
+# route name -> (method, body factory taking the seeded user, authenticated?)
+ROUTE_REQUESTS = {
+    'track-update-progress': ('post', None, True),
+    'task-bulk-update': ('patch', lambda user: [
+        {'id': pk, 'status': Task.StatusChoices.DONE}
+        for pk in Task.objects.filter(workspace_id=user.pk).values_list('pk', flat=True)[:5]
+    ], True),
+    'import-plan': ('post', lambda user: {'categories': [{
+        'name': f'Imported {user.username}',
+        'tracks': [{'title': 'Imported track', 'tasks': [{'title': 'Imported task'}]}],
+    }]}, True),
+    'register': ('post', lambda user: {
+        'username': f'{user.username}-new',
+        'email': f'{user.username}-new@example.com',
+        'password': 'password123',
+        'password_confirm': 'password123',
+    }, False),
+    'token_obtain': ('post', lambda user: {'username': user.username, 'password': 'password123'}, False),
+    'password-reset': ('post', lambda user: {'email': user.email}, False),
+    'password-reset-confirm': ('post', lambda user: {
+        'uid': user.pk, 'token': 'invalid', 'password': 'password123',
+    }, False),
+}
+
+# route name -> model of the deleted parent; its tasks go with it (or lose it)
+DELETE_ROUTES = {
+    'track-detail': Track,
+    'sprint-detail': Sprint,
+}
+
+EXCLUDED_ROUTES = {
+    'dashboard-stats-async': (
+        'computes its sections on worker threads with their own connections, '
+        'which CaptureQueriesContext cannot see; dashboard-stats runs the same sections'
+    ),
+}
+
+
+def core_routes(patterns=None):
+    """(name, pattern) of every named route in core/urls.py, without format suffixes."""
+    routes = {}
+    for pattern in urls.urlpatterns if patterns is None else patterns:
+        if isinstance(pattern, URLResolver):
+            routes.update(core_routes(pattern.url_patterns))
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            if 'format' not in pattern.pattern.regex.groupindex:
+                routes.setdefault(pattern.name, pattern)
+    return routes
+
+
+def seed_workspace(username, rows):
+    """A user whose workspace has ``rows`` rows of every model."""
+    user = User.objects.create_user(username, f'{username}@example.com', 'password123')
+    workspace = user.workspace
+    today = timezone.now().date()
+
+    categories = Category.objects.bulk_create(
+        Category(workspace=workspace, name=f'{username} category {i}') for i in range(rows)
+    )
+    tracks = Track.objects.bulk_create(
+        Track(workspace=workspace, title=f'Track {i}', category=categories[i])
+        for i in range(rows)
+    )
+    sprints = Sprint.objects.bulk_create(
+        Sprint(
+            track=tracks[i],
+            name=f'Sprint {i}',
+            start_date=today - timedelta(days=7),
+            end_date=today + timedelta(days=7),
+        )
+        for i in range(rows)
+    )
+    statuses = Task.StatusChoices.values
+    Task.objects.bulk_create(
+        Task(
+            workspace=workspace,
+            track=sprints[i].track,
+            sprint=sprints[i],
+            title=f'Task {i}',
+            status=statuses[i % len(statuses)],
+            estimated_hours=2,
+            due_date=today + timedelta(days=i % 30 - 15),
+            completed_at=timezone.now() - timedelta(days=i % 30)
+            if statuses[i % len(statuses)] == Task.StatusChoices.DONE else None,
+        )
+        for i in range(rows)
+    )
+    DailyLog.objects.bulk_create(
+        DailyLog(workspace=workspace, date=today - timedelta(days=i), mood_score=7, energy_level=6, focus_hours=3)
+        for i in range(rows)
+    )
+    DailyTodo.objects.bulk_create(
+        DailyTodo(workspace=workspace, title=f'Todo {i}', date=today - timedelta(days=i % 7), is_completed=i % 2 == 0)
+        for i in range(rows)
+    )
+
+    Track.recount_tasks(workspace=workspace)
+    Sprint.recount_tasks(track__workspace=workspace)
+    rollups.rebuild(workspace_id=workspace.pk)
+    return user
+
+
+class QueryBudgetTests(APITestCase):
+    """Every core route issues a constant number of queries as data grows."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = {size: seed_workspace(f'budget{size}', size) for size in SIZES}
+
+    def route_url(self, name, pattern, user):
+        kwargs = {}
+        if 'pk' in pattern.pattern.regex.groupindex:
+            model = DETAIL_MODELS[name.split('-')[0]]
+            owner = {Workspace: 'user', Sprint: 'track__workspace__user'}.get(model, 'workspace__user')
+            kwargs['pk'] = model.objects.filter(**{owner: user}).values_list('pk', flat=True).first()
+        return reverse(name, kwargs=kwargs)
+
+    def measure(self, name, pattern, user):
+        """Request one route as ``user``; returns the response and the SQL it ran."""
+        method, body, authenticated = ROUTE_REQUESTS.get(name, ('get', None, True))
+        cache.clear()
+        client = APIClient()
+        if authenticated:
+            # A fresh user, as the JWT backend would load it per request
+            client.force_authenticate(User.objects.get(pk=user.pk))
+        url = self.route_url(name, pattern, user)
+        data = body(user) if body else None
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(client, method)(url, data, format='json')
+        return response, [query['sql'] for query in context.captured_queries]
+
+    def test_every_route_has_a_constant_query_count(self):
+        routes = core_routes()
+        self.assertTrue(routes)
+        for name, pattern in sorted(routes.items()):
+            if name in EXCLUDED_ROUTES:
+                continue
+            with self.subTest(route=name):
+                runs = {}
+                for size in SIZES:
+                    response, queries = self.measure(name, pattern, self.users[size])
+                    self.assertNotIn(
+                        response.status_code, (404, 405),
+                        f'{name} answered {response.status_code}; add it to ROUTE_REQUESTS'
+                    )
+                    self.assertLess(response.status_code, 500, f'{name} failed with {response.status_code}')
+                    runs[size] = queries
+
+                counts = {size: len(queries) for size, queries in runs.items()}
+                if len(set(counts.values())) > 1:
+                    self.fail(self.budget_report(name, runs))
+
+    def seed_parent(self, user, rows):
+        """A track and its sprint holding ``rows`` tasks, half of them done over five days."""
+        track = Track.objects.create(workspace_id=user.pk, title='Deleted track')
+        sprint = Sprint.objects.create(
+            track=track, name='Deleted sprint',
+            start_date=timezone.now().date(), end_date=timezone.now().date() + timedelta(days=14),
+        )
+        Task.objects.bulk_create(
+            Task(
+                workspace_id=user.pk, track=track, sprint=sprint, title=f'Deleted {i}',
+                status=Task.StatusChoices.DONE if i % 2 else Task.StatusChoices.TODO,
+                completed_at=timezone.now() - timedelta(days=i % 5) if i % 2 else None,
+            )
+            for i in range(rows)
+        )
+        Track.recount_tasks(pk=track.pk)
+        Sprint.recount_tasks(pk=sprint.pk)
+        rollups.rebuild(workspace_id=user.pk)
+        return {Track: track, Sprint: sprint}
+
+    def test_deletes_have_a_constant_query_count(self):
+        for name, model in DELETE_ROUTES.items():
+            with self.subTest(route=name):
+                runs = {}
+                for size in SIZES:
+                    user = self.users[size]
+                    parent = self.seed_parent(user, size)[model]
+                    client = APIClient()
+                    client.force_authenticate(User.objects.get(pk=user.pk))
+                    with CaptureQueriesContext(connection) as context:
+                        response = client.delete(reverse(name, kwargs={'pk': parent.pk}))
+                    self.assertEqual(response.status_code, 204)
+                    runs[size] = [
+                        query['sql'] for query in context.captured_queries
+                        if not chunked_batch(query['sql'])
+                    ]
+
+                counts = {size: len(queries) for size, queries in runs.items()}
+                if len(set(counts.values())) > 1:
+                    self.fail(self.budget_report(f'DELETE {name}', runs))
+
+    def test_deleting_a_track_keeps_the_rollup_in_step(self):
+        user = self.users[SIZES[0]]
+        track = self.seed_parent(user, 20)[Track]
+        client = APIClient()
+        client.force_authenticate(User.objects.get(pk=user.pk))
+        version = Workspace.objects.get(pk=user.pk).data_version
+
+        response = client.delete(reverse('track-detail', kwargs={'pk': track.pk}))
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Task.objects.filter(track_id=track.pk).exists())
+        self.assertEqual(Workspace.objects.get(pk=user.pk).data_version, version + 1)
+        stats = lambda: sorted(
+            WorkspaceDailyStats.objects.filter(workspace_id=user.pk)
+            .exclude(tasks_created=0, tasks_completed=0)
+            .values_list('date', 'tasks_created', 'tasks_completed')
+        )
+        incremental = stats()
+        rollups.rebuild(workspace_id=user.pk)
+        self.assertEqual(incremental, stats())
+
+    def test_excluded_routes_exist(self):
+        routes = core_routes()
+        for name in EXCLUDED_ROUTES:
+            self.assertIn(name, routes, f'{name} is excluded but no longer routed')
+        for name in [*ROUTE_REQUESTS, *DELETE_ROUTES]:
+            self.assertIn(name, routes, f'{name} has a request but no longer routed')
+
+    def budget_report(self, name, runs):
+        """Failure message naming the statements repeated more often with more rows."""
+        smallest, largest = runs[min(runs)], runs[max(runs)]
+        before = Counter(fingerprint(sql) for sql in smallest)
+        after = Counter(fingerprint(sql) for sql in largest)
+        examples = {fingerprint(sql): sql for sql in largest}
+        lines = [
+            f"{name}: query count changed with data size "
+            f"({', '.join(f'{size} rows: {len(queries)}' for size, queries in runs.items())})",
+        ]
+        for statement, count in after.most_common():
+            if count > before[statement]:
+                lines.append(f'  x{before[statement]} -> x{count}: {examples[statement]}')
+        if len(lines) == 1:
+            lines.extend(f'  {sql}' for sql in largest)
+        return '\n'.join(lines)
@@ -0,0 +1,64 @@
+"""
+The incrementally maintained daily rollup always equals a full rebuild.
+"""
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core import rollups
+from core.models import Workspace, Task, WorkspaceDailyStats
+
+
+def rollup(workspace_id):
+    """Non-empty rollup rows of a workspace, as comparable tuples."""
+    return sorted(
+        WorkspaceDailyStats.objects.filter(workspace_id=workspace_id).exclude(
+            tasks_created=0, tasks_completed=0, has_log=False, todos_done=0
+        ).values_list(
+            'date', 'tasks_created', 'tasks_completed', 'has_log', 'mood', 'energy', 'focus_hours', 'todos_done'
+        )
+    )
+
+
+class DailyRollupTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('rollup', 'rollup@example.com', 'password123')
+
+    def setUp(self):
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+
+    def assertMatchesRebuild(self):
+        incremental = rollup(self.user.pk)
+        rollups.rebuild(workspace_id=self.user.pk)
+        self.assertEqual(incremental, rollup(self.user.pk))
+        return incremental
+
+    def test_task_writes_match_a_rebuild(self):
+        url = reverse('task-list')
+        created = [self.client.post(url, {'title': f'Task {i}'}, format='json').data['id'] for i in range(3)]
+        self.assertEqual(self.assertMatchesRebuild()[0][1:3], (3, 0))
+
+        def patch(pk, status):
+            response = self.client.patch(reverse('task-detail', kwargs={'pk': pk}), {'status': status}, format='json')
+            self.assertEqual(response.status_code, 200)
+
+        patch(created[0], Task.StatusChoices.DONE)
+        patch(created[1], Task.StatusChoices.DONE)
+        self.assertEqual(self.assertMatchesRebuild()[0][1:3], (3, 2))
+
+        patch(created[1], Task.StatusChoices.TODO)
+        self.assertEqual(self.assertMatchesRebuild()[0][1:3], (3, 1))
+
+        for pk in created[:2]:
+            self.assertEqual(self.client.delete(reverse('task-detail', kwargs={'pk': pk})).status_code, 204)
+        self.assertEqual(self.assertMatchesRebuild()[0][1:3], (1, 0))
+
+    def test_rebuild_invalidates_cached_responses(self):
+        version = Workspace.objects.get(pk=self.user.pk).data_version
+        rollups.rebuild(workspace_id=self.user.pk)
+        self.assertEqual(Workspace.objects.get(pk=self.user.pk).data_version, version + 1)
+
+        rollups.rebuild()
+        self.assertEqual(Workspace.objects.get(pk=self.user.pk).data_version, version + 2)
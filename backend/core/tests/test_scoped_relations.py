@@ -0,0 +1,69 @@
+"""
+Workspace scoping and query cost of related-field validation on writes.
+"""
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core.models import Category, Track, Sprint, Task
+
+
+class ScopedRelationsTests(APITestCase):
+    """Tracks, sprints and categories of other workspaces are not found."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('scoped', 'scoped@example.com', 'password123')
+        cls.track = Track.objects.create(workspace=cls.user.workspace, title='Mine')
+        cls.other_track = Track.objects.create(workspace=cls.user.workspace, title='Also mine')
+        cls.sprint = Sprint.objects.create(
+            track=cls.track, name='Sprint', start_date='2026-01-01', end_date='2026-01-14'
+        )
+
+        stranger = User.objects.create_user('stranger', 'stranger@example.com', 'password123')
+        cls.foreign_category = Category.objects.create(workspace=stranger.workspace, name='Theirs')
+        cls.foreign_track = Track.objects.create(workspace=stranger.workspace, title='Theirs')
+        cls.foreign_sprint = Sprint.objects.create(
+            track=cls.foreign_track, name='Theirs', start_date='2026-01-01', end_date='2026-01-14'
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+
+    def test_track_and_sprint_are_validated_in_one_query(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(reverse('task-list'), {
+                'title': 'Scoped', 'track': self.track.pk, 'sprint': self.sprint.pk,
+            }, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        lookups = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('SELECT') and ('"tracks"' in query['sql'] or '"sprints"' in query['sql'])
+        ]
+        self.assertEqual(len(lookups), 1, lookups)
+
+    def test_sprint_must_belong_to_track(self):
+        response = self.client.post(reverse('task-list'), {
+            'title': 'Mismatch', 'track': self.other_track.pk, 'sprint': self.sprint.pk,
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('sprint', response.data)
+
+    def test_other_workspaces_objects_are_rejected(self):
+        for route, data, field in (
+            ('task-list', {'title': 'Foreign', 'track': self.foreign_track.pk}, 'track'),
+            ('task-list', {'title': 'Foreign', 'sprint': self.foreign_sprint.pk}, 'sprint'),
+            ('sprint-list', {
+                'track': self.foreign_track.pk, 'name': 'Foreign',
+                'start_date': '2026-02-01', 'end_date': '2026-02-14',
+            }, 'track'),
+            ('track-list', {'title': 'Foreign', 'category': self.foreign_category.pk}, 'category'),
+        ):
+            with self.subTest(route=route, field=field):
+                response = self.client.post(reverse(route), data, format='json')
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.data[field][0].code, 'does_not_exist')
+        self.assertFalse(Task.objects.filter(title='Foreign').exists())
@@ -0,0 +1,60 @@
+"""
+Regression tests for the number of queries behind the task list endpoint.
+"""
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.test import APITestCase
+
+from core.models import Category, Track, Sprint, Task
+
+
+class TaskListQueryTests(APITestCase):
+    """``GET /api/tasks/`` must not load tracks or sprints per task."""
+
+    # Workspace row for the ETag, COUNT for the paginator, one SELECT for the page
+    LIST_QUERIES = 3
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('tasks', 'tasks@example.com', 'password123')
+        workspace = cls.user.workspace
+        category = Category.objects.create(workspace=workspace, name='Queries')
+        tasks = []
+        for i in range(10):
+            track = Track.objects.create(workspace=workspace, title=f'Track {i}', category=category)
+            sprint = Sprint.objects.create(
+                track=track, name=f'Sprint {i}', start_date='2026-01-01', end_date='2026-01-14'
+            )
+            tasks += [
+                Task(workspace=workspace, track=track, sprint=sprint, title=f'Task {i}-{j}')
+                for j in range(10)
+            ]
+        Task.objects.bulk_create(tasks)
+
+    def setUp(self):
+        # A fresh user per request, as the JWT backend would load it
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+
+    def list_tasks(self, page_size):
+        with mock.patch.object(PageNumberPagination, 'page_size', page_size):
+            return self.client.get(reverse('task-list'))
+
+    def test_100_task_page_uses_fixed_number_of_queries(self):
+        with self.assertNumQueries(self.LIST_QUERIES):
+            response = self.list_tasks(100)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 100)
+        task = response.data['results'][0]
+        self.assertTrue(task['track_title'].startswith('Track '))
+        self.assertTrue(task['sprint_name'].startswith('Sprint '))
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        with self.assertNumQueries(self.LIST_QUERIES):
+            self.list_tasks(5)
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+        with self.assertNumQueries(self.LIST_QUERIES):
+            self.list_tasks(100)
@@ -0,0 +1,57 @@
+"""
+Trend periods over the daily rollup, by week and by month.
+"""
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from core.models import WorkspaceDailyStats
+from core.stats import trends
+
+
+class TrendTests(TestCase):
+    """Rollup days spread over January-March 2026, read on Wednesday March 18."""
+
+    TODAY = date(2026, 3, 18)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('trend', 'trend@example.com', 'password123')
+        WorkspaceDailyStats.objects.bulk_create(
+            WorkspaceDailyStats(workspace_id=cls.user.pk, **values) for values in [
+                {'date': date(2026, 1, 10), 'tasks_completed': 5, 'tasks_created': 5},
+                {'date': date(2026, 2, 20), 'tasks_completed': 4},
+                {'date': date(2026, 3, 3), 'tasks_completed': 2, 'tasks_created': 4, 'mood': 6, 'has_log': True},
+                {'date': date(2026, 3, 5), 'tasks_completed': 1, 'mood': 8, 'focus_hours': 2.5, 'has_log': True},
+                {'date': date(2026, 3, 17), 'tasks_created': 2},
+            ]
+        )
+
+    def periods(self, granularity, count):
+        rows = trends(self.user.workspace, self.TODAY, granularity, count)
+        for row in rows:
+            self.assertIsInstance(row['completion_rate'], float)
+        return [
+            (row['period_start'], row['tasks_completed'], row['tasks_created'],
+             row['completion_rate'], row['cumulative_completed'])
+            for row in rows
+        ]
+
+    def test_weeks(self):
+        self.assertEqual(self.periods('week', 3), [
+            ('2026-03-02', 3, 4, 75.0, 12),
+            ('2026-03-09', 0, 0, 0.0, 12),
+            ('2026-03-16', 0, 2, 0.0, 12),
+        ])
+        first_week = trends(self.user.workspace, self.TODAY, 'week', 3)[0]
+        self.assertEqual((first_week['avg_mood'], first_week['focus_hours']), (7, 2.5))
+
+    def test_months(self):
+        self.assertEqual(self.periods('month', 2), [
+            ('2026-02-01', 4, 0, 0.0, 9),
+            ('2026-03-01', 3, 6, 50.0, 12),
+        ])
+
+    def test_cumulative_counts_completions_before_the_window(self):
+        self.assertEqual(self.periods('week', 1), [('2026-03-16', 0, 2, 0.0, 12)])
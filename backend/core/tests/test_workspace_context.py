@@ -0,0 +1,88 @@
+"""
+Workspace resolution per request: the id is free, the row loads on demand.
+"""
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core.models import Workspace, Track, Sprint, Task
+
+
+def workspace_selects(context):
+    """Queries loading the workspace row (the rollup lock only reads its pk)."""
+    return [
+        query['sql'] for query in context.captured_queries
+        if query['sql'].startswith('SELECT') and '"workspaces"."data_version"' in query['sql']
+    ]
+
+
+class WorkspaceContextTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('context', 'context@example.com', 'password123')
+        cls.track = Track.objects.create(workspace_id=cls.user.pk, title='Context')
+        cls.sprint = Sprint.objects.create(
+            track=cls.track, name='Sprint', start_date='2026-01-01', end_date='2026-01-14'
+        )
+        cls.task = Task.objects.create(workspace_id=cls.user.pk, track=cls.track, title='Context')
+
+        stranger = User.objects.create_user('outsider', 'outsider@example.com', 'password123')
+        cls.foreign_task = Task.objects.create(workspace_id=stranger.pk, title='Theirs')
+
+    def setUp(self):
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+
+    def test_only_creates_load_the_workspace(self):
+        with CaptureQueriesContext(connection) as context:
+            created = self.client.post(reverse('task-list'), {
+                'title': 'New', 'track': self.track.pk, 'sprint': self.sprint.pk,
+            }, format='json')
+        self.assertEqual(created.status_code, 201)
+        self.assertEqual(created.data['workspace'], self.user.pk)
+        self.assertEqual(len(workspace_selects(context)), 1)
+
+        with CaptureQueriesContext(connection) as context:
+            updated = self.client.patch(
+                reverse('task-detail', kwargs={'pk': self.task.pk}), {'title': 'Renamed'}, format='json'
+            )
+        self.assertEqual(updated.status_code, 200)
+        self.assertEqual(workspace_selects(context), [])
+
+    def test_conditional_get_loads_the_workspace_once(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('track-detail', kwargs={'pk': self.track.pk}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('ETag', response)
+        self.assertEqual(len(workspace_selects(context)), 1)
+
+    def test_other_workspaces_objects_are_not_found(self):
+        response = self.client.get(reverse('task-detail', kwargs={'pk': self.foreign_task.pk}))
+        self.assertEqual(response.status_code, 404)
+
+
+class MissingWorkspaceTests(APITestCase):
+    """A user whose workspace row is gone is refused, not answered with a 500."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('homeless', 'homeless@example.com', 'password123')
+        Workspace.objects.filter(pk=cls.user.pk).delete()
+
+    def setUp(self):
+        self.client.force_authenticate(User.objects.get(pk=self.user.pk))
+
+    def test_workspace_routes_answer_403(self):
+        for route in ('task-list', 'track-list', 'dashboard-stats'):
+            with self.subTest(route=route):
+                response = self.client.get(reverse(route))
+                self.assertEqual(response.status_code, 403)
+
+    def test_creates_answer_403(self):
+        for route in ('task-list', 'track-list', 'import-plan'):
+            with self.subTest(route=route):
+                response = self.client.post(reverse(route), {'title': 'Nowhere'}, format='json')
+                self.assertEqual(response.status_code, 403)
@@ -25,6 +25,10 @@ urlpatterns = [
     path('auth/password-reset/', views.password_reset_request, name='password-reset'),
     path('auth/password-reset/confirm/', views.password_reset_confirm, name='password-reset-confirm'),
     path('dashboard/stats/', views.dashboard_stats, name='dashboard-stats'),
+    path('dashboard/stats/async/', views.dashboard_stats_async, name='dashboard-stats-async'),
+    path('dashboard/heatmap/', views.dashboard_heatmap, name='dashboard-heatmap'),
+    path('analytics/trends/', views.analytics_trends, name='analytics-trends'),
+    path('import/plan/', views.import_plan, name='import-plan'),
 
     # Custom token endpoint with approval check
     path('token/', views.custom_token_obtain, name='token_obtain'),
@@ -6,10 +6,18 @@ from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.exceptions import AuthenticationFailed, PermissionDenied
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.db.models import Count, Q, Avg, Sum
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.http import JsonResponse
+from django.views.decorators.http import require_safe
 from django.utils import timezone
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from .models import Workspace, Track, Sprint, Task, DailyLog, Category, DailyTodo
 from .serializers import (
@@ -20,15 +28,54 @@ from .serializers import (
     TrackDetailSerializer,
     SprintSerializer,
     TaskSerializer,
+    TaskBulkUpdateSerializer,
     DailyLogSerializer,
     DashboardStatsSerializer,
     CategorySerializer,
     DailyTodoSerializer,
+    PlanImportSerializer,
 )
 from .permissions import BelongsToUserWorkspace
+from .bulk import BulkCreateMixin, tasks_created, update_tasks
+from . import importer
+from .jobs import enqueue
+from .idempotency import IdempotencyMixin, idempotent
+from .compiled import CompiledSerializer, CompiledListMixin
+from .prefetch import with_recent_children
+from .grouping import (
+    parse_limit_per_group,
+    top_per_group,
+    group_counts,
+    group_cursor,
+    keyset_page,
+    split_groups,
+)
+from .cache import cache_key, cached_response
+from .conditional import (
+    ConditionalGetMixin,
+    conditional_get,
+    workspace_validators,
+    not_modified_response,
+    set_validators,
+)
+from .stats import (
+    compute_dashboard_stats,
+    acompute_dashboard_stats,
+    parse_sections,
+    heatmap,
+    with_track_counts,
+    with_sprint_progress,
+    sprint_progress_data,
+    trends,
+    HEATMAP_DAYS,
+    HEATMAP_MAX_DAYS,
+    TREND_GRANULARITIES,
+    TREND_PERIODS,
+    TREND_MAX_PERIODS,
+)
 
 
-class WorkspaceViewSet(viewsets.ReadOnlyModelViewSet):
+class WorkspaceViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for viewing workspace.
     Users can only view their own workspace (read-only).
@@ -38,10 +85,10 @@ class WorkspaceViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_queryset(self):
         """Return only the user's workspace."""
-        return Workspace.objects.filter(user=self.request.user)
+        return Workspace.objects.filter(user=self.request.user).select_related('user')
 
 
-class TrackViewSet(viewsets.ModelViewSet):
+class TrackViewSet(ConditionalGetMixin, IdempotencyMixin, BulkCreateMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Tracks.
     Full CRUD operations with workspace isolation.
@@ -55,8 +102,8 @@ class TrackViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return only tracks from user's workspace."""
-        workspace = self.request.user.workspace
-        queryset = Track.objects.filter(workspace=workspace)
+        workspace = self.request.workspace
+        queryset = with_track_counts(Track.objects.filter(workspace_id=workspace.pk))
 
         # Filter by category
         category = self.request.query_params.get('category', None)
@@ -68,6 +115,9 @@ class TrackViewSet(viewsets.ModelViewSet):
         if is_active is not None:
             queryset = queryset.filter(is_active=is_active.lower() == 'true')
 
+        if self.action == 'retrieve':
+            queryset = with_recent_children(queryset)
+
         return queryset
 
     def get_serializer_class(self):
@@ -78,39 +128,78 @@ class TrackViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         """Set workspace to current user's workspace."""
-        serializer.save(workspace=self.request.user.workspace)
+        serializer.save(workspace_id=self.request.workspace.pk)
 
     @action(detail=True, methods=['post'])
     def update_progress(self, request, pk=None):
         """Manually trigger progress update based on tasks."""
         track = self.get_object()
         track.update_progress()
+        Workspace.bump_version(pk=track.workspace_id)
         serializer = self.get_serializer(track)
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
     def by_category(self, request):
-        """Get tracks grouped by category."""
-        workspace = request.user.workspace
-        categories = Category.objects.filter(workspace=workspace)
-
-        result = []
-        for category in categories:
-            tracks = Track.objects.filter(
-                workspace=workspace,
-                category=category,
-                is_active=True
+        """
+        Get active tracks grouped by category, the first ?limit_per_group=
+        (default 20) of each, with per-group counts and ``next`` cursors.
+        Use ?category=<name>&cursor=<next> to page a single category.
+        """
+        workspace = request.workspace
+        category_name = request.query_params.get('category')
+        cursor = request.query_params.get('cursor')
+        try:
+            limit = parse_limit_per_group(request.query_params.get('limit_per_group'))
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if cursor and not category_name:
+            return Response(
+                {'error': 'cursor requires category'},
+                status=status.HTTP_400_BAD_REQUEST
             )
-            if tracks.exists():
-                result.append({
+
+        def group_tracks():
+            tracks = self.get_queryset().filter(is_active=True, category__isnull=False)
+            categories = Category.objects.filter(workspace_id=workspace.pk).annotate(
+                track_count=Count('tracks'),
+                active_track_count=Count('tracks', filter=Q(tracks__is_active=True)),
+            ).filter(active_track_count__gt=0)
+
+            if category_name:
+                categories = list(categories.filter(name__iexact=category_name))
+                groups, cursors = {}, {}
+                for category in categories:
+                    rows, cursors[category.pk] = keyset_page(
+                        tracks.filter(category=category), limit, cursor
+                    )
+                    groups[category.pk] = rows
+            else:
+                categories = list(categories)
+                groups = split_groups(top_per_group(tracks, 'category_id', limit), 'category_id')
+                cursors = {
+                    category.pk: group_cursor(groups.get(category.pk, []), category.active_track_count)
+                    for category in categories
+                }
+
+            return [
+                {
                     'category': CategorySerializer(category).data,
-                    'tracks': TrackSerializer(tracks, many=True).data
-                })
+                    'count': category.active_track_count,
+                    'tracks': TrackSerializer(groups.get(category.pk, []), many=True).data,
+                    'next': cursors[category.pk],
+                }
+                for category in categories
+            ]
 
-        return Response(result)
+        try:
+            data = cached_response(request, 'tracks-by-category', group_tracks)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(data)
 
 
-class SprintViewSet(viewsets.ModelViewSet):
+class SprintViewSet(ConditionalGetMixin, IdempotencyMixin, BulkCreateMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Sprints.
     Full CRUD operations with workspace isolation via track.
@@ -124,8 +213,8 @@ class SprintViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return only sprints from user's workspace tracks."""
-        workspace = self.request.user.workspace
-        queryset = Sprint.objects.filter(track__workspace=workspace)
+        workspace = self.request.workspace
+        queryset = Sprint.objects.filter(track__workspace_id=workspace.pk).select_related('track')
 
         # Filter by track
         track_id = self.request.query_params.get('track', None)
@@ -143,24 +232,49 @@ class SprintViewSet(viewsets.ModelViewSet):
             today = timezone.now().date()
             queryset = queryset.filter(start_date__lte=today, end_date__gte=today)
 
+        # Filter sprints overlapping a date range
+        start_date = self.request.query_params.get('start_date', None)
+        end_date = self.request.query_params.get('end_date', None)
+        if start_date:
+            queryset = queryset.filter(end_date__gte=start_date)
+        if end_date:
+            queryset = queryset.filter(start_date__lte=end_date)
+
         return queryset
 
     @action(detail=False, methods=['get'])
     def current(self, request):
         """Get all currently active sprints."""
         today = timezone.now().date()
-        workspace = request.user.workspace
-        sprints = Sprint.objects.filter(
-            track__workspace=workspace,
-            start_date__lte=today,
-            end_date__gte=today,
-            is_active=True
-        )
-        serializer = self.get_serializer(sprints, many=True)
-        return Response(serializer.data)
+        workspace = request.workspace
+
+        def current_sprints():
+            sprints = Sprint.objects.filter(
+                track__workspace_id=workspace.pk,
+                start_date__lte=today,
+                end_date__gte=today,
+                is_active=True
+            ).select_related('track')
+            return self.get_serializer(sprints, many=True).data
+
+        return Response(cached_response(request, 'sprints-current', current_sprints))
+
+    @action(detail=False, methods=['get'])
+    def progress(self, request):
+        """
+        Get task totals, completion and hours for sprints in one query.
+        Accepts the same track/is_active/is_current/date range filters as the list.
+        """
+        today = timezone.now().date()
+
+        def sprints_progress():
+            sprints = with_sprint_progress(self.filter_queryset(self.get_queryset()))
+            return [sprint_progress_data(sprint, today) for sprint in sprints]
 
+        return Response(cached_response(request, 'sprints-progress', sprints_progress))
 
-class CategoryViewSet(viewsets.ModelViewSet):
+
+class CategoryViewSet(ConditionalGetMixin, IdempotencyMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Categories.
     Full CRUD operations with workspace isolation.
@@ -174,15 +288,15 @@ class CategoryViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return only categories from user's workspace."""
-        workspace = self.request.user.workspace
-        return Category.objects.filter(workspace=workspace)
+        workspace = self.request.workspace
+        return Category.objects.filter(workspace_id=workspace.pk).annotate(track_count=Count('tracks'))
 
     def perform_create(self, serializer):
         """Set workspace to current user's workspace."""
-        serializer.save(workspace=self.request.user.workspace)
+        serializer.save(workspace_id=self.request.workspace.pk)
 
 
-class DailyTodoViewSet(viewsets.ModelViewSet):
+class DailyTodoViewSet(ConditionalGetMixin, IdempotencyMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Daily Todos.
     Full CRUD operations with workspace isolation.
@@ -196,8 +310,8 @@ class DailyTodoViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return only daily todos from user's workspace."""
-        workspace = self.request.user.workspace
-        queryset = DailyTodo.objects.filter(workspace=workspace)
+        workspace = self.request.workspace
+        queryset = DailyTodo.objects.filter(workspace_id=workspace.pk)
 
         # Filter by date
         date = self.request.query_params.get('date', None)
@@ -213,15 +327,15 @@ class DailyTodoViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         """Set workspace to current user's workspace."""
-        serializer.save(workspace=self.request.user.workspace)
+        serializer.save(workspace_id=self.request.workspace.pk)
 
     @action(detail=False, methods=['get'])
     def today(self, request):
         """Get today's todos, create if none exist."""
-        workspace = request.user.workspace
+        workspace = request.workspace
         today = timezone.now().date()
 
-        todos = DailyTodo.objects.filter(workspace=workspace, date=today)
+        todos = DailyTodo.objects.filter(workspace_id=workspace.pk, date=today)
         if not todos.exists():
             # Create default todos for today
             default_todos = [
@@ -232,22 +346,32 @@ class DailyTodoViewSet(viewsets.ModelViewSet):
             ]
             for title in default_todos:
                 DailyTodo.objects.create(
-                    workspace=workspace,
+                    workspace_id=workspace.pk,
                     title=title,
                     date=today
                 )
-            todos = DailyTodo.objects.filter(workspace=workspace, date=today)
+            todos = DailyTodo.objects.filter(workspace_id=workspace.pk, date=today)
 
         serializer = self.get_serializer(todos, many=True)
         return Response(serializer.data)
 
 
-class TaskViewSet(viewsets.ModelViewSet):
+# Task columns rendered by TaskSerializer, plus the joined track/sprint
+# columns it reads
+TASK_LIST_FIELDS = [
+    'id', 'workspace', 'track', 'sprint', 'title', 'description', 'status', 'priority',
+    'estimated_hours', 'actual_hours', 'due_date', 'completed_at', 'created_at', 'updated_at',
+    'track__title', 'sprint__name',
+]
+
+
+class TaskViewSet(ConditionalGetMixin, IdempotencyMixin, CompiledListMixin, BulkCreateMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Tasks.
     Full CRUD operations with workspace isolation.
     """
     serializer_class = TaskSerializer
+    compiled_serializer = CompiledSerializer(TaskSerializer)
     permission_classes = [IsAuthenticated, BelongsToUserWorkspace]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'description']
@@ -256,8 +380,10 @@ class TaskViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return only tasks from user's workspace."""
-        workspace = self.request.user.workspace
-        queryset = Task.objects.filter(workspace=workspace)
+        workspace = self.request.workspace
+        queryset = Task.objects.filter(workspace_id=workspace.pk).select_related(
+            'track', 'sprint'
+        ).only(*TASK_LIST_FIELDS)
 
         # Filter by status
         status_param = self.request.query_params.get('status', None)
@@ -292,48 +418,110 @@ class TaskViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         """Set workspace to current user's workspace."""
-        serializer.save(workspace=self.request.user.workspace)
+        serializer.save(workspace_id=self.request.workspace.pk)
+
+    def build_bulk_instance(self, model, attrs):
+        """Bulk-created tasks get completed_at like Task.save() would set it."""
+        task = super().build_bulk_instance(model, attrs)
+        task.sync_completed_at()
+        return task
+
+    def bulk_created(self, objects):
+        """Update track/sprint counters and the daily rollup for new tasks."""
+        tasks_created(self.request.workspace, objects)
 
     @action(detail=False, methods=['get'])
     def by_status(self, request):
-        """Get tasks grouped by status."""
-        workspace = request.user.workspace
-        statuses = Task.StatusChoices.choices
-
-        result = {}
-        for status_code, status_name in statuses:
-            tasks = Task.objects.filter(
-                workspace=workspace,
-                status=status_code
+        """
+        Get tasks grouped by status, the first ?limit_per_group= (default 20)
+        of each, with per-group counts and ``next`` cursors. The usual task
+        filters apply; use ?status=<code>&cursor=<next> to page one column.
+        """
+        statuses = dict(Task.StatusChoices.choices)
+        status_param = request.query_params.get('status', '').upper()
+        cursor = request.query_params.get('cursor')
+        try:
+            limit = parse_limit_per_group(request.query_params.get('limit_per_group'))
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if status_param and status_param not in statuses:
+            return Response(
+                {'error': f"status must be one of: {', '.join(statuses)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if cursor and not status_param:
+            return Response(
+                {'error': 'cursor requires status'},
+                status=status.HTTP_400_BAD_REQUEST
             )
-            result[status_code] = {
-                'name': status_name,
-                'count': tasks.count(),
-                'tasks': TaskSerializer(tasks[:20], many=True).data  # Limit to 20
+
+        def group_tasks():
+            tasks = self.get_queryset()
+            counts = group_counts(tasks, 'status')
+            if status_param:
+                rows, next_cursor = keyset_page(tasks, limit, cursor)
+                groups = {status_param: rows}
+                cursors = {status_param: next_cursor}
+            else:
+                groups = split_groups(top_per_group(tasks, 'status', limit), 'status')
+                cursors = {
+                    code: group_cursor(groups.get(code, []), counts.get(code, 0))
+                    for code in statuses
+                }
+
+            return {
+                code: {
+                    'name': statuses[code],
+                    'count': counts.get(code, 0),
+                    'tasks': TaskSerializer(groups.get(code, []), many=True).data,
+                    'next': cursors[code],
+                }
+                for code in statuses if code in cursors
             }
 
-        return Response(result)
+        try:
+            data = cached_response(request, 'tasks-by-status', group_tasks)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(data)
+
+    @action(detail=False, methods=['patch'], url_path='bulk')
+    def bulk_update(self, request):
+        """
+        Apply a list of {id, status?, priority?, sprint?, due_date?} changes
+        in one request; track and sprint progress is recomputed once per parent.
+        """
+        serializer = TaskBulkUpdateSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=settings.BULK_MAX_ITEMS
+        )
+        serializer.is_valid(raise_exception=True)
+        tasks = update_tasks(request.workspace, serializer.validated_data)
+        return Response(self.get_serializer(tasks, many=True).data)
 
     @action(detail=False, methods=['get'])
     def today(self, request):
         """Get tasks due today."""
         today = timezone.now().date()
-        workspace = request.user.workspace
+        workspace = request.workspace
         tasks = Task.objects.filter(
-            workspace=workspace,
+            workspace_id=workspace.pk,
             due_date=today,
             status__in=[Task.StatusChoices.TODO, Task.StatusChoices.IN_PROGRESS]
-        )
+        ).select_related('track', 'sprint').only(*TASK_LIST_FIELDS)
         serializer = self.get_serializer(tasks, many=True)
         return Response(serializer.data)
 
 
-class DailyLogViewSet(viewsets.ModelViewSet):
+class DailyLogViewSet(ConditionalGetMixin, IdempotencyMixin, CompiledListMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing Daily Logs.
     Full CRUD operations with workspace isolation.
     """
     serializer_class = DailyLogSerializer
+    compiled_serializer = CompiledSerializer(DailyLogSerializer)
     permission_classes = [IsAuthenticated, BelongsToUserWorkspace]
     filter_backends = [filters.OrderingFilter]
     ordering_fields = ['date', 'mood_score', 'created_at']
@@ -341,8 +529,8 @@ class DailyLogViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return only daily logs from user's workspace."""
-        workspace = self.request.user.workspace
-        queryset = DailyLog.objects.filter(workspace=workspace)
+        workspace = self.request.workspace
+        queryset = DailyLog.objects.filter(workspace_id=workspace.pk)
 
         # Filter by date range
         start_date = self.request.query_params.get('start_date', None)
@@ -357,16 +545,16 @@ class DailyLogViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         """Set workspace to current user's workspace."""
-        serializer.save(workspace=self.request.user.workspace)
+        serializer.save(workspace_id=self.request.workspace.pk)
 
     @action(detail=False, methods=['get'])
     def today(self, request):
         """Get or create today's log."""
         today = timezone.now().date()
-        workspace = request.user.workspace
+        workspace = request.workspace
 
         log, created = DailyLog.objects.get_or_create(
-            workspace=workspace,
+            workspace_id=workspace.pk,
             date=today
         )
 
@@ -378,10 +566,10 @@ class DailyLogViewSet(viewsets.ModelViewSet):
         """Get logs from the last 7 days."""
         end_date = timezone.now().date()
         start_date = end_date - timedelta(days=7)
-        workspace = request.user.workspace
+        workspace = request.workspace
 
         logs = DailyLog.objects.filter(
-            workspace=workspace,
+            workspace_id=workspace.pk,
             date__gte=start_date,
             date__lte=end_date
         )
@@ -390,129 +578,193 @@ class DailyLogViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
+def greeting_period():
+    """(greeting, start of its time-of-day bucket) in the server's local time."""
+    now = datetime.now().astimezone()
+    if now.hour < 12:
+        return "Good morning", now.replace(hour=0, minute=0, second=0, microsecond=0)
+    elif now.hour < 18:
+        return "Good afternoon", now.replace(hour=12, minute=0, second=0, microsecond=0)
+    return "Good evening", now.replace(hour=18, minute=0, second=0, microsecond=0)
+
+
+def get_greeting():
+    """User greeting based on time of day."""
+    return greeting_period()[0]
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@conditional_get(period=greeting_period)
 def dashboard_stats(request):
     """
     Get comprehensive dashboard statistics for the user's workspace.
     Includes pending tasks, sprint progress, and heatmap data.
+    Use ?sections=counters,sprints,heatmap,logs to compute only some blocks.
     """
-    workspace = request.user.workspace
+    try:
+        sections = parse_sections(request.query_params.get('sections'))
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    workspace = request.workspace
     today = timezone.now().date()
-    thirty_days_ago = today - timedelta(days=30)
-
-    # Track stats
-    tracks = Track.objects.filter(workspace=workspace)
-    total_tracks = tracks.count()
-    active_tracks = tracks.filter(is_active=True).count()
-
-    # Task stats
-    tasks = Task.objects.filter(workspace=workspace)
-    total_tasks = tasks.count()
-    completed_tasks = tasks.filter(status=Task.StatusChoices.DONE).count()
-    in_progress_tasks = tasks.filter(status=Task.StatusChoices.IN_PROGRESS).count()
-    pending_tasks = tasks.filter(status=Task.StatusChoices.TODO).count()
-
-    # High priority pending tasks
-    high_priority_pending = tasks.filter(
-        status__in=[Task.StatusChoices.TODO, Task.StatusChoices.IN_PROGRESS],
-        priority=Task.PriorityChoices.HIGH
-    ).count()
-
-    # Overdue tasks
-    overdue_tasks = tasks.filter(
-        status__in=[Task.StatusChoices.TODO, Task.StatusChoices.IN_PROGRESS],
-        due_date__lt=today
-    ).count()
-
-    # Current active sprint progress
-    active_sprints = Sprint.objects.filter(
-        track__workspace=workspace,
-        start_date__lte=today,
-        end_date__gte=today,
-        is_active=True
-    )
 
-    sprint_progress = []
-    for sprint in active_sprints:
-        sprint_tasks = Task.objects.filter(sprint=sprint)
-        total_sprint_tasks = sprint_tasks.count()
-        completed_sprint_tasks = sprint_tasks.filter(status=Task.StatusChoices.DONE).count()
-
-        progress_percentage = (completed_sprint_tasks / total_sprint_tasks * 100) if total_sprint_tasks > 0 else 0
-
-        sprint_progress.append({
-            'id': sprint.id,
-            'name': sprint.name,
-            'track_title': sprint.track.title if sprint.track else None,
-            'start_date': sprint.start_date,
-            'end_date': sprint.end_date,
-            'total_tasks': total_sprint_tasks,
-            'completed_tasks': completed_sprint_tasks,
-            'progress_percentage': round(progress_percentage, 2),
-            'days_remaining': (sprint.end_date - today).days,
-        })
-
-    # Heatmap data: Last 30 days of task completion
-    heatmap_data = []
-    for i in range(30):
-        date = today - timedelta(days=i)
-        completed_on_date = Task.objects.filter(
-            workspace=workspace,
-            completed_at__date=date
-        ).count()
-
-        heatmap_data.append({
-            'date': date.isoformat(),
-            'count': completed_on_date,
-            'level': min(completed_on_date, 4)  # 0-4 for visual intensity
-        })
-
-    # Reverse to get chronological order
-    heatmap_data.reverse()
-
-    # Daily log stats (last 30 days)
-    recent_logs = DailyLog.objects.filter(
-        workspace=workspace,
-        date__gte=thirty_days_ago
-    )
+    stats = {
+        'greeting': get_greeting(),
+        'user_name': request.user.first_name or request.user.username,
+        **cached_response(
+            request,
+            'dashboard-stats',
+            lambda: compute_dashboard_stats(workspace, today, sections)
+        ),
+    }
+
+    return Response(stats)
 
-    avg_mood = recent_logs.aggregate(avg_mood=Avg('mood_score'))['avg_mood'] or 0
-    total_focus = recent_logs.aggregate(total_focus=Sum('focus_hours'))['total_focus'] or 0
 
-    # Completion rate
-    completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+@require_safe
+async def dashboard_stats_async(request):
+    """
+    Async version of dashboard_stats for the ASGI entry point.
+    Computes the requested sections concurrently; accepts the same
+    ?sections= parameter, cache and conditional GET headers.
+    """
+    try:
+        auth = await sync_to_async(JWTAuthentication().authenticate)(request)
+    except AuthenticationFailed as e:
+        detail = e.detail if isinstance(e.detail, dict) else {'detail': e.detail}
+        return JsonResponse(detail, status=status.HTTP_401_UNAUTHORIZED)
+    if auth is None:
+        return JsonResponse(
+            {'detail': 'Authentication credentials were not provided.'},
+            status=status.HTTP_401_UNAUTHORIZED
+        )
+    request.user = auth[0]
 
-    # User greeting based on time of day
-    from datetime import datetime
-    current_hour = datetime.now().hour
-    if current_hour < 12:
-        greeting = "Good morning"
-    elif current_hour < 18:
-        greeting = "Good afternoon"
-    else:
-        greeting = "Good evening"
+    try:
+        sections = parse_sections(request.GET.get('sections'))
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    workspace = request.workspace
+    # Loaded here, off the event loop, for the validators and the cache key
+    try:
+        await sync_to_async(lambda: workspace.instance)()
+    except PermissionDenied as e:
+        return JsonResponse({'detail': e.detail}, status=status.HTTP_403_FORBIDDEN)
+    today = timezone.now().date()
+
+    validators = workspace_validators(request, greeting_period())
+    not_modified = not_modified_response(request, *validators)
+    if not_modified is not None:
+        return not_modified
+
+    key = cache_key(workspace.instance, 'dashboard-stats', request.GET)
+    data = await cache.aget(key)
+    if data is None:
+        data = await acompute_dashboard_stats(workspace, today, sections)
+        await cache.aset(key, data, settings.RESPONSE_CACHE_TIMEOUT)
 
     stats = {
-        'greeting': greeting,
+        'greeting': get_greeting(),
         'user_name': request.user.first_name or request.user.username,
-        'total_tracks': total_tracks,
-        'active_tracks': active_tracks,
-        'total_tasks': total_tasks,
-        'completed_tasks': completed_tasks,
-        'in_progress_tasks': in_progress_tasks,
-        'pending_tasks': pending_tasks,
-        'high_priority_pending': high_priority_pending,
-        'overdue_tasks': overdue_tasks,
-        'active_sprints_count': active_sprints.count(),
-        'sprint_progress': sprint_progress,
-        'heatmap_data': heatmap_data,
-        'avg_mood_score': round(avg_mood, 2),
-        'total_focus_hours': round(total_focus, 2),
-        'completion_rate': round(completion_rate, 2),
+        **data,
     }
+    return set_validators(JsonResponse(stats, encoder=JSONEncoder), *validators)
 
-    return Response(stats)
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@conditional_get
+def dashboard_heatmap(request):
+    """
+    Get daily activity (task completions, focus hours, log presence)
+    for an arbitrary window ending today. Window size is set via ?days=N.
+    """
+    try:
+        days = int(request.query_params.get('days', HEATMAP_DAYS))
+    except ValueError:
+        return Response(
+            {'error': 'days must be an integer'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    if not 1 <= days <= HEATMAP_MAX_DAYS:
+        return Response(
+            {'error': f'days must be between 1 and {HEATMAP_MAX_DAYS}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    today = timezone.now().date()
+    data = heatmap(request.workspace, today, days)
+
+    return Response({
+        'days': days,
+        'start_date': data[0]['date'],
+        'end_date': data[-1]['date'],
+        'total_completed': sum(day['count'] for day in data),
+        'days_logged': sum(1 for day in data if day['has_log']),
+        'data': data,
+    })
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@conditional_get
+def analytics_trends(request):
+    """
+    Get per-period tasks completed/created, completion rate, average
+    mood/energy and focus hours. Use ?granularity=week|month and ?periods=N.
+    """
+    granularity = request.query_params.get('granularity', 'week')
+    if granularity not in TREND_GRANULARITIES:
+        return Response(
+            {'error': f"granularity must be one of: {', '.join(TREND_GRANULARITIES)}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        periods = int(request.query_params.get('periods', TREND_PERIODS))
+    except ValueError:
+        return Response(
+            {'error': 'periods must be an integer'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    if not 1 <= periods <= TREND_MAX_PERIODS:
+        return Response(
+            {'error': f'periods must be between 1 and {TREND_MAX_PERIODS}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    workspace = request.workspace
+    today = timezone.now().date()
+
+    data = cached_response(
+        request,
+        'analytics-trends',
+        lambda: trends(workspace, today, granularity, periods)
+    )
+    return Response({
+        'granularity': granularity,
+        'periods': data,
+    })
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, BelongsToUserWorkspace])
+@idempotent
+def import_plan(request):
+    """
+    Import a whole plan (categories -> tracks -> sprints -> tasks) in one
+    transaction, upserting nodes by name. Returns a per-node report.
+    """
+    serializer = PlanImportSerializer(data=request.data, context={'request': request})
+    serializer.is_valid(raise_exception=True)
+    report = importer.import_plan(request.workspace, serializer.validated_data)
+    created = any(counts['created'] for counts in report['summary'].values())
+    return Response(report, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
 
 
 @api_view(['POST'])
@@ -595,13 +847,8 @@ def custom_token_obtain(request):
 def password_reset_request(request):
     """
     Request a password reset email.
-    Generates a token and sends email with reset link.
+    Queues a job that generates a token and sends the reset link.
     """
-    from django.contrib.auth.tokens import default_token_generator
-    from django.core.mail import send_mail
-    from django.template.loader import render_to_string
-    from django.conf import settings
-
     email = request.data.get('email')
 
     if not email:
@@ -619,54 +866,8 @@ def password_reset_request(request):
             status=status.HTTP_200_OK
         )
 
-    # Generate reset token
-    token = default_token_generator.make_token(user)
-
-    # Create reset URL
-    frontend_url = settings.FRONTEND_URL
-    reset_url = f"{frontend_url}/reset-password?token={token}&uid={user.pk}"
-
-    # Send email with HTML template
-    try:
-        subject = 'Reset Your BreathingMonk Password'
-
-        # Render HTML email
-        html_message = render_to_string('emails/password_reset.html', {
-            'username': user.username,
-            'reset_url': reset_url,
-        })
-
-        # Plain text fallback
-        plain_message = f'''
-        Hello {user.username},
-
-        We received a request to reset your password for your BreathingMonk account.
-
-        Click the link below to reset your password:
-        {reset_url}
-
-        This link will expire in 24 hours.
-
-        If you didn't request a password reset, you can safely ignore this email.
-
-        Best regards,
-        The BreathingMonk Team
-        '''
-
-        send_mail(
-            subject=subject,
-            message=plain_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[email],
-            html_message=html_message,
-            fail_silently=False,
-        )
-
-        print(f"Password reset email sent to {email}")
-
-    except Exception as e:
-        print(f"Error sending password reset email: {e}")
-        # Don't reveal to user whether email exists or if there was an error
+    # Send the email from a background worker instead of blocking on SMTP
+    enqueue('send_password_reset_email', {'user_id': user.pk})
 
     return Response(
         {'message': 'If an account exists with this email, you will receive password reset instructions.'},
@@ -3,6 +3,11 @@ ASGI config for focusflow project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Async views such as /api/dashboard/stats/async/ run natively when served
+through this entry point, e.g. with an ASGI worker class:
+
+    gunicorn focusflow.asgi:application -k uvicorn.workers.UvicornWorker
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 """
@@ -49,8 +49,10 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.tenancy.WorkspaceMiddleware',  # request.workspace, see core/tenancy.py
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.nplusone.NPlusOneMiddleware',  # Only active when NPLUSONE_DETECTOR is set
 ]
 
 ROOT_URLCONF = 'focusflow.urls'
@@ -93,6 +95,54 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# Entries are keyed by the workspace data_version stored in the database,
+# so a per-process cache never serves stale data across workers.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'focusflow',
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', '5000')),
+        }
+    }
+}
+
+# Seconds a cached read-endpoint response is kept
+RESPONSE_CACHE_TIMEOUT = int(os.environ.get('RESPONSE_CACHE_TIMEOUT', '300'))
+
+# Threads (and therefore extra DB connections) per process used by the
+# async dashboard to compute its sections concurrently
+DASHBOARD_SECTION_WORKERS = int(os.environ.get('DASHBOARD_SECTION_WORKERS', '4'))
+
+# Maximum number of items accepted by one bulk create/update request
+BULK_MAX_ITEMS = int(os.environ.get('BULK_MAX_ITEMS', '500'))
+
+# Background job queue (manage.py run_jobs)
+# Worker threads per run_jobs process, each with its own DB connection
+JOB_WORKER_CONCURRENCY = int(os.environ.get('JOB_WORKER_CONCURRENCY', '2'))
+# Seconds an idle worker waits before polling the queue again
+JOB_POLL_INTERVAL = float(os.environ.get('JOB_POLL_INTERVAL', '2'))
+# Seconds after which a RUNNING job is considered abandoned and re-queued
+JOB_LOCK_TIMEOUT = int(os.environ.get('JOB_LOCK_TIMEOUT', '600'))
+# Attempts per job before it is marked FAILED, and the base retry delay in seconds
+JOB_MAX_ATTEMPTS = int(os.environ.get('JOB_MAX_ATTEMPTS', '3'))
+JOB_RETRY_DELAY = int(os.environ.get('JOB_RETRY_DELAY', '30'))
+
+# Idempotency-Key support on POST/PUT/PATCH/DELETE
+# Seconds a key's response is kept and replayed to retries
+IDEMPOTENCY_KEY_TTL = int(os.environ.get('IDEMPOTENCY_KEY_TTL', '86400'))
+# Seconds after which a key whose request never finished may be reused
+IDEMPOTENCY_LOCK_TIMEOUT = int(os.environ.get('IDEMPOTENCY_LOCK_TIMEOUT', '300'))
+
+# N+1 query detection (development/staging): 'log', 'raise' or 'off'
+NPLUSONE_DETECTOR = os.environ.get('NPLUSONE_DETECTOR', 'log' if DEBUG else 'off')
+# Repetitions of one query shape within a request that count as N+1
+NPLUSONE_THRESHOLD = int(os.environ.get('NPLUSONE_THRESHOLD', '10'))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -223,6 +273,7 @@ CORS_ALLOW_HEADERS = [
     'authorization',
     'content-type',
     'dnt',
+    'idempotency-key',
     'origin',
     'user-agent',
     'x-csrftoken',
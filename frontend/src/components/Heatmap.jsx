@@ -21,6 +21,17 @@ const Heatmap = ({ data }) => {
     return colors[level] || colors[0];
   };
 
+  const getDayTitle = (day) => {
+    let title = `${day.date}: ${day.count} tasks completed`;
+    if (day.focus_hours) {
+      title += `, ${day.focus_hours}h focus`;
+    }
+    if (day.has_log) {
+      title += ' (journal logged)';
+    }
+    return title;
+  };
+
   // Group by weeks (7 days each)
   const weeks = [];
   for (let i = 0; i < data.length; i += 7) {
@@ -48,8 +59,8 @@ const Heatmap = ({ data }) => {
             {week.map((day, dayIndex) => (
               <div
                 key={dayIndex}
-                className={`w-3 h-3 rounded-sm ${getColorByLevel(day.level)} hover:ring-2 hover:ring-primary transition-all cursor-pointer`}
-                title={`${day.date}: ${day.count} tasks completed`}
+                className={`w-3 h-3 rounded-sm ${getColorByLevel(day.level)} ${day.has_log ? 'ring-1 ring-accent-blue' : ''} hover:ring-2 hover:ring-primary transition-all cursor-pointer`}
+                title={getDayTitle(day)}
               ></div>
             ))}
           </div>
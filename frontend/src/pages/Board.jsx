@@ -91,6 +91,25 @@ const Board = () => {
     });
   };
 
+  // Fetch the next page of one Kanban column and append it
+  const loadMoreTasks = async (status) => {
+    const cursor = tasksByStatus?.[status]?.next;
+    if (!cursor) return;
+    try {
+      const page = await taskAPI.getByStatus({ status, cursor });
+      setTasksByStatus((current) => ({
+        ...current,
+        [status]: {
+          ...current[status],
+          tasks: [...current[status].tasks, ...page[status].tasks],
+          next: page[status].next,
+        },
+      }));
+    } catch (error) {
+      console.error('Failed to load more tasks:', error);
+    }
+  };
+
   // Get filtered tasks for each status
   const getFilteredTasksByStatus = (status) => {
     const tasks = tasksByStatus?.[status]?.tasks || [];
@@ -297,6 +316,15 @@ const Board = () => {
           <TaskCard key={task.id} task={task} />
         ))}
 
+        {tasksByStatus?.[status]?.next && (
+          <button
+            onClick={() => loadMoreTasks(status)}
+            className="w-full py-2 text-sm text-primary hover:bg-dark-elevated rounded-lg transition-colors"
+          >
+            Load more
+          </button>
+        )}
+
         {tasks.length === 0 && (
           <div className="text-center py-8 text-text-muted text-sm border-2 border-dashed border-dark-border rounded-lg">
             No tasks
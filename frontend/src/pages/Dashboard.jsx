@@ -13,6 +13,7 @@ const Dashboard = () => {
   const [stats, setStats] = useState(null);
   const [tracksByCategory, setTracksByCategory] = useState(null);
   const [todayTodos, setTodayTodos] = useState([]);
+  const [yearHeatmap, setYearHeatmap] = useState(null);
   const [loading, setLoading] = useState(true);
   const [newTodoTitle, setNewTodoTitle] = useState('');
 
@@ -22,15 +23,17 @@ const Dashboard = () => {
 
   const fetchDashboardData = async () => {
     try {
-      const [statsData, tracksData, todosData] = await Promise.all([
+      const [statsData, tracksData, todosData, heatmapData] = await Promise.all([
         dashboardAPI.getStats(),
         trackAPI.getByCategory(),
         dailyTodoAPI.getToday(),
+        dashboardAPI.getHeatmap(365),
       ]);
 
       setStats(statsData);
       setTracksByCategory(tracksData);
       setTodayTodos(todosData.results || todosData);
+      setYearHeatmap(heatmapData);
     } catch (error) {
       console.error('Failed to fetch dashboard data:', error);
     } finally {
@@ -92,7 +95,7 @@ const Dashboard = () => {
   const categoryData = tracksByCategory
     ? tracksByCategory.map((item) => ({
         name: item.category.name,
-        count: item.tracks.length,
+        count: item.count ?? item.tracks.length,
       }))
     : [];
 
@@ -397,8 +400,13 @@ const Dashboard = () => {
 
       {/* Heatmap */}
       <div className="card">
-        <h2 className="text-xl font-semibold mb-6">Activity Heatmap</h2>
-        <Heatmap />
+        <h2 className="text-xl font-semibold mb-2">Activity Heatmap (Last Year)</h2>
+        {yearHeatmap && (
+          <p className="text-text-muted text-sm mb-6">
+            {yearHeatmap.total_completed} tasks completed, {yearHeatmap.days_logged} days journaled
+          </p>
+        )}
+        <Heatmap data={yearHeatmap?.data || []} />
       </div>
     </div>
   );
@@ -25,11 +25,18 @@ const Sprints = () => {
 
   const fetchData = async () => {
     try {
-      const [sprintsData, tracksData] = await Promise.all([
+      const [sprintsData, tracksData, progressData] = await Promise.all([
         sprintAPI.getAll(),
         trackAPI.getAll(),
+        sprintAPI.getProgress(),
       ]);
-      setSprints(sprintsData.results || sprintsData);
+      const progressById = Object.fromEntries(progressData.map((p) => [p.id, p]));
+      setSprints(
+        (sprintsData.results || sprintsData).map((sprint) => ({
+          ...sprint,
+          ...progressById[sprint.id],
+        }))
+      );
       setTracks(tracksData.results || tracksData);
     } catch (error) {
       console.error('Failed to fetch data:', error);
@@ -223,6 +230,10 @@ const Sprints = () => {
                             </span>
                             <span className="text-primary font-medium">{sprint.progress_percentage}%</span>
                           </div>
+                          <div className="flex items-center justify-between text-xs text-text-muted mb-2">
+                            <span>{sprint.completed_tasks}/{sprint.total_tasks} done, {sprint.in_progress_tasks} in progress</span>
+                            <span>{sprint.actual_hours}h / {sprint.estimated_hours}h</span>
+                          </div>
                           <div className="h-2 bg-dark-elevated rounded-full overflow-hidden">
                             <div
                               className="h-full bg-primary rounded-full transition-all"
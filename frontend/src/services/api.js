@@ -126,8 +126,8 @@ export const trackAPI = {
     return response.data;
   },
 
-  getByCategory: async () => {
-    const response = await api.get('/tracks/by_category/');
+  getByCategory: async (params = {}) => {
+    const response = await api.get('/tracks/by_category/', { params });
     return response.data;
   },
 
@@ -229,6 +229,11 @@ export const sprintAPI = {
     const response = await api.get('/sprints/current/');
     return response.data;
   },
+
+  getProgress: async (params = {}) => {
+    const response = await api.get('/sprints/progress/', { params });
+    return response.data;
+  },
 };
 
 // Task APIs
@@ -253,13 +258,19 @@ export const taskAPI = {
     return response.data;
   },
 
+  // changes: [{ id, status?, priority?, sprint?, due_date? }]
+  bulkUpdate: async (changes) => {
+    const response = await api.patch('/tasks/bulk/', changes);
+    return response.data;
+  },
+
   delete: async (id) => {
     const response = await api.delete(`/tasks/${id}/`);
     return response.data;
   },
 
-  getByStatus: async () => {
-    const response = await api.get('/tasks/by_status/');
+  getByStatus: async (params = {}) => {
+    const response = await api.get('/tasks/by_status/', { params });
     return response.data;
   },
 
@@ -307,10 +318,33 @@ export const dailyLogAPI = {
   },
 };
 
+// Analytics APIs
+export const analyticsAPI = {
+  getTrends: async (granularity = 'week', periods = 12) => {
+    const response = await api.get('/analytics/trends/', { params: { granularity, periods } });
+    return response.data;
+  },
+};
+
+// Plan import API
+export const importAPI = {
+  // plan: { categories: [{ name, tracks: [{ title, sprints: [{ name, tasks: [...] }], tasks: [...] }] }] }
+  importPlan: async (plan) => {
+    const response = await api.post('/import/plan/', plan);
+    return response.data;
+  },
+};
+
 // Dashboard APIs
 export const dashboardAPI = {
-  getStats: async () => {
-    const response = await api.get('/dashboard/stats/');
+  getStats: async (sections = null) => {
+    const params = sections ? { sections: sections.join(',') } : {};
+    const response = await api.get('/dashboard/stats/', { params });
+    return response.data;
+  },
+
+  getHeatmap: async (days = 365) => {
+    const response = await api.get('/dashboard/heatmap/', { params: { days } });
     return response.data;
   },
 };